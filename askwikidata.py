@@ -1,25 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
 import glob
+import hashlib
 import json
 import os
-import requests
 import datetime
+import tempfile
+import threading
 import time
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+import numpy as np
 from tqdm import tqdm
 
-from langchain.embeddings.huggingface import HuggingFaceBgeEmbeddings
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from annoy import AnnoyIndex
-
-import torch
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
-
-from generate import LLM
+# pandas, langchain, torch, transformers, annoy, requests and the local LLM
+# are imported where they are first used, so importing this module stays fast.
+if TYPE_CHECKING:
+    import pandas as pd
+
+from caches import DiskCache, LRUCache, collapse_whitespace, normalize_query
+from metrics import Metrics, timed
+from retrievers import compare_retrievers, make_retriever
+
+# The default configuration of the REPL and the server.
+hyperparams = {
+    "chunk_size": 1280,
+    "chunk_overlap": 0,
+    "index_trees": 1024,
+    "retrieval_chunks": 16,
+    "context_chunks": 5,
+    "embedding_model_name": "BAAI/bge-small-en-v1.5",
+    "reranker_model_name": "BAAI/bge-reranker-base",
+    "qa_model_url": "Qwen/Qwen2.5-3B-Instruct",
+}
+
+
+@contextlib.contextmanager
+def replacing(path):
+    """
+    Yield the path of a new temporary file next to path, and move it to path
+    once the block completes. Every writer gets its own temporary file, so
+    processes writing the same cache at once never clobber each other and
+    readers never see a torn file.
+    """
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory or ".", prefix=name + ".", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 class AskWikidata:
-    df = pd.DataFrame()
-    local_llm = None
+    async_hf_client = None
+    manifest = {}
+    corpus_version = None
+    # Identifies the saved cache the chunks and embeddings were loaded from
+    # or saved to, a new one is drawn on every save.
+    cache_id = None
+    text_representations_dir = "./text_representations"
 
     def __init__(
         self,
@@ -31,169 +78,627 @@ class AskWikidata:
         qa_model_url="https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.1",
         reranker_model_name="BAAI/bge-reranker-base",
         retrieval_chunks=64,
-        cache_file=None,
+        cache_dir=None,
+        embedding_batch_size=32,
+        embedding_dtype="float32",
+        retriever="annoy",
+        rerank_batch_size=16,
+        rerank_cache_size=65536,
+        query_cache_size=4096,
+        query_cache_file=None,
+        answer_cache_size=1024,
+        answer_cache_ttl=24 * 60 * 60,
+        answer_cache_file=None,
+        generation_batch_size=8,
+        llm_cpu_dtype="float32",
+        llm_threads=None,
+        lazy=False,
+        device=None,
     ):
         self.chunk_overlap = chunk_overlap
         self.chunk_size = chunk_size
         self.context_chunks = context_chunks
         self.embedding_model_name = embedding_model_name
         self.index_trees = index_trees
+        self.retriever = retriever
         self.qa_model_url = qa_model_url
         self.reranker_model_name = reranker_model_name
         self.retrieval_chunks = retrieval_chunks
+        self.generation_batch_size = generation_batch_size
+        self.llm_cpu_dtype = llm_cpu_dtype
+        self.llm_threads = llm_threads
+        self.rerank_batch_size = rerank_batch_size
+        self.rerank_cache = LRUCache(rerank_cache_size)
+        if query_cache_file:
+            self.query_cache = DiskCache(query_cache_file, query_cache_size)
+        else:
+            self.query_cache = LRUCache(query_cache_size)
+        if answer_cache_file:
+            self.answer_cache = DiskCache(
+                answer_cache_file, answer_cache_size, answer_cache_ttl
+            )
+        else:
+            self.answer_cache = LRUCache(answer_cache_size, answer_cache_ttl)
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_dtype = np.dtype(embedding_dtype)
 
-        if not cache_file:
+        if not cache_dir:
             emn = embedding_model_name.replace("/", "-")
-            self.cache_file = f"cache-{chunk_size}-{chunk_overlap}-{emn}.json"
+            self.cache_dir = f"cache-{chunk_size}-{chunk_overlap}-{emn}"
         else:
-            self.cache_file = cache_file
-
-        self.device = "cpu"
-        if torch.cuda.is_available():
-            print("CUDA available to torch.")
-            self.device = "cuda"
+            self.cache_dir = cache_dir
+        self.embeds_file = os.path.join(self.cache_dir, "embeddings.npy")
+        self.chunks_file = os.path.join(self.cache_dir, "chunks.parquet")
+        self.manifest_file = os.path.join(self.cache_dir, "manifest.json")
+        self.lock_file = os.path.join(self.cache_dir, "lock")
+
+        self.hf_clients = {}
+
+        self.metrics = Metrics()
+        self.metrics.register_cache("rerank", self.rerank_cache)
+        self.metrics.register_cache("query_embedding", self.query_cache)
+        self.metrics.register_cache("answer", self.answer_cache)
+
+        self.lazy = lazy
+        self._device = device
+        # The chunks, set by read_data or load_cache
+        self.df = None
+        self.components = {}
+        self.component_locks = {name: threading.Lock() for name in self.COMPONENTS}
+        # One model and its prefix caches serve all requests, so local
+        # generations run one at a time.
+        self.local_llm_lock = threading.Lock()
+
+    @property
+    def device(self):
+        if self._device is None:
+            import torch
+
+            self._device = "cpu"
+            if torch.cuda.is_available():
+                print("CUDA available to torch.")
+                self._device = "cuda"
+        return self._device
 
     def setup(self):
-        self.load_models()
-        if not self.load_cache():
+        if self.lazy:
+            self.warm_up()
+        else:
+            self.load_models()
+        if self.load_cache():
+            self.refresh()
+        else:
             self.read_data()
             self.create_embeds()
             self.save_cache()
         self.create_index()
 
+    # Models, in the order they are loaded. Each is materialized by its
+    # load_<name> method on first use, see component.
+    COMPONENTS = ("embedding_model", "rerank_tokenizer", "rerank_model", "local_llm")
+
+    def component(self, name):
+        if name not in self.components:
+            with self.component_locks[name]:
+                if name not in self.components:
+                    self.components[name] = getattr(self, f"load_{name}")()
+        return self.components[name]
+
+    @property
+    def embedding_model(self):
+        return self.component("embedding_model")
+
+    @embedding_model.setter
+    def embedding_model(self, model):
+        self.components["embedding_model"] = model
+
+    @property
+    def rerank_tokenizer(self):
+        return self.component("rerank_tokenizer")
+
+    @rerank_tokenizer.setter
+    def rerank_tokenizer(self, tokenizer):
+        self.components["rerank_tokenizer"] = tokenizer
+
+    @property
+    def rerank_model(self):
+        return self.component("rerank_model")
+
+    @rerank_model.setter
+    def rerank_model(self, model):
+        self.components["rerank_model"] = model
+
+    @property
+    def local_llm(self):
+        return self.component("local_llm")
+
+    @local_llm.setter
+    def local_llm(self, llm):
+        self.components["local_llm"] = llm
+
     def load_models(self):
         print("Loading models...")
-
-        self.embedding_model = HuggingFaceBgeEmbeddings(
+        for name in self.COMPONENTS:
+            self.component(name)
+
+    def warm_up(self, background=True):
+        """Load all models, by default in a background thread, so the first
+        request does not pay for it. Requests that arrive earlier load what
+        they need themselves."""
+        if not background:
+            return self.load_models()
+        thread = threading.Thread(target=self.load_models, daemon=True)
+        thread.start()
+        return thread
+
+    def ready(self):
+        """Report which components are loaded."""
+        ready = {name: name in self.components for name in self.COMPONENTS}
+        ready["index"] = hasattr(self, "index")
+        return ready
+
+    def load_embedding_model(self):
+        from langchain.embeddings.huggingface import HuggingFaceBgeEmbeddings
+
+        return HuggingFaceBgeEmbeddings(
             model_name=self.embedding_model_name,
             model_kwargs={"device": self.device},
-            encode_kwargs={"normalize_embeddings": True},
+            encode_kwargs={
+                "normalize_embeddings": True,
+                "batch_size": self.embedding_batch_size,
+            },
             query_instruction="Represent this sentence for searching relevant passages: ",
         )
 
-        self.rerank_tokenizer = AutoTokenizer.from_pretrained(self.reranker_model_name)
-        self.rerank_model = AutoModelForSequenceClassification.from_pretrained(
+    def load_rerank_tokenizer(self):
+        from transformers import AutoTokenizer
+
+        return AutoTokenizer.from_pretrained(self.reranker_model_name)
+
+    def load_rerank_model(self):
+        from transformers import AutoModelForSequenceClassification
+
+        rerank_model = AutoModelForSequenceClassification.from_pretrained(
             self.reranker_model_name
         )
-        self.rerank_model.to(self.device)
+        rerank_model.to(self.device)
+        return rerank_model
 
-        if not "https://" in self.qa_model_url:
-            self.local_llm = LLM(self.qa_model_url)
+    def load_local_llm(self):
+        if "https://" in self.qa_model_url:
+            return None
 
-    def read_data(self):
-        directory_path = "./text_representations"
+        from generate import LLM
 
-        texts = []
-        metas = []
+        return LLM(
+            self.qa_model_url,
+            device=self.device,
+            cpu_dtype=self.llm_cpu_dtype,
+            num_threads=self.llm_threads,
+        )
 
-        files = glob.glob(os.path.join(directory_path, "*.txt"))
-        print("Loading text representations...")
-        for file_path in files:
-            with open(file_path, "r") as file:
-                texts.append(file.read())
-                file_name = file_path.split("/")[-1]
-                q_id = file_name.split(".")[0]
-                metas.append({"source": f"https://www.wikidata.org/wiki/{q_id}"})
-        print(f"  {len(files)} files loaded.")
-
-        print("Creating chunks...")
-        text_splitter = RecursiveCharacterTextSplitter(
+    def text_splitter(self):
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+        return RecursiveCharacterTextSplitter(
             separators=["\n\n", "\n"],
             chunk_size=self.chunk_size,
             chunk_overlap=self.chunk_overlap,
             length_function=len,
         )
-        chunks = text_splitter.create_documents(texts, metadatas=metas)
 
-        self.df = pd.DataFrame(columns=["id", "text", "source"])
+    def iter_chunks(self, files, batch_size=256, entries=None):
+        """Read and chunk text representations, yielding (texts, sources)
+        column batches covering at most batch_size files each. If entries is
+        given, the manifest entry of each file read is added to it."""
+        text_splitter = self.text_splitter()
+        for start in range(0, len(files), batch_size):
+            texts = []
+            sources = []
+            for file_path in files[start : start + batch_size]:
+                q_id = os.path.basename(file_path).split(".")[0]
+                stat = os.stat(file_path)
+                with open(file_path, "rb") as file:
+                    data = file.read()
+                if entries is not None:
+                    entries[q_id] = self.file_entry(stat, data)
+                text = data.decode()
+                source = f"https://www.wikidata.org/wiki/{q_id}"
+                for chunk in text_splitter.split_text(text):
+                    texts.append(chunk)
+                    sources.append(source)
+            yield texts, sources
+
+    def text_representation_files(self):
+        return sorted(glob.glob(os.path.join(self.text_representations_dir, "*.txt")))
+
+    def file_entry(self, stat, data):
+        """The manifest entry of a text representation: its content hash and
+        the size and modification time of the file when it was read."""
+        return {
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def unchanged_entries(self, files):
+        """Split text representations into those whose size and modification
+        time match the manifest, mapped from Q-id to their manifest entry,
+        and a list of the other files, which have to be read again."""
+        entries = {}
+        stale_files = []
+        for file_path in files:
+            q_id = os.path.basename(file_path).split(".")[0]
+            stat = os.stat(file_path)
+            entry = self.manifest.get(q_id)
+            if (
+                entry is not None
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+            ):
+                entries[q_id] = entry
+            else:
+                stale_files.append(file_path)
+        return entries, stale_files
+
+    def set_manifest(self, manifest):
+        self.manifest = manifest
+        # Only the contents make up the corpus version, touching a file does
+        # not change it.
+        hashes = {q_id: entry["sha256"] for q_id, entry in manifest.items()}
+        self.corpus_version = hashlib.sha256(
+            json.dumps(hashes, sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+    def chunk_table(self, files, entries=None):
+        import pandas as pd
 
-        for i, c in enumerate(chunks):
-            self.df.loc[i] = [i, c.page_content, c.metadata["source"]]
+        texts = []
+        sources = []
+        for batch_texts, batch_sources in self.iter_chunks(files, entries=entries):
+            texts.extend(batch_texts)
+            sources.extend(batch_sources)
+        return pd.DataFrame({"id": range(len(texts)), "text": texts, "source": sources})
 
+    @timed("setup_seconds", setup="read_data")
+    def read_data(self):
+        files = self.text_representation_files()
+        print(f"Loading and chunking {len(files)} text representations...")
+        entries = {}
+        self.df = self.chunk_table(files, entries)
+        self.set_manifest(entries)
         print(f"  {len(self.df)} chunks.")
 
+    @timed("setup_seconds", setup="refresh")
+    def refresh(self):
+        """Re-chunk and re-embed only new or changed text representations and
+        drop chunks of deleted ones. Returns True if the corpus changed."""
+        import pandas as pd
+
+        files = self.text_representation_files()
+        entries, stale_files = self.unchanged_entries(files)
+        # Stale files are hashed from the same read that chunks them, so the
+        # manifest always describes the embedded chunks.
+        stale_entries = {}
+        stale_df = self.chunk_table(stale_files, stale_entries)
+        entries.update(stale_entries)
+        changed = {
+            q
+            for q, entry in stale_entries.items()
+            if q not in self.manifest or self.manifest[q]["sha256"] != entry["sha256"]
+        }
+        deleted = set(self.manifest) - set(entries)
+        if not changed and not deleted:
+            if entries != self.manifest:
+                # Files were touched without changing, remember their new
+                # modification times so they are not hashed again.
+                self.set_manifest(entries)
+                self.save_manifest()
+            return False
+
+        print(
+            f"Refreshing {len(changed)} new or changed and {len(deleted)} deleted "
+            + "text representations..."
+        )
+        q_ids = self.df["source"].str.rsplit("/", n=1).str[-1]
+        keep = ~q_ids.isin(changed | deleted).to_numpy()
+        stale_q_ids = stale_df["source"].str.rsplit("/", n=1).str[-1]
+        new_df = stale_df[stale_q_ids.isin(changed).to_numpy()]
+        embeds = [np.asarray(self.embeds[keep], dtype=self.embedding_dtype)]
+        if len(new_df):
+            embeds.append(self.embed_texts(list(new_df["text"])))
+
+        self.df = pd.concat([self.df[keep], new_df], ignore_index=True)
+        self.df["id"] = range(len(self.df))
+        self.embeds = np.concatenate(embeds)
+        self.set_manifest(entries)
+        self.rerank_cache.clear()
+        self.answer_cache.clear()
+        self.save_cache()
+        print(f"  {len(self.df)} chunks.")
+        return True
+
+    def embed_texts(self, texts):
+        # Embed chunks of similar length together so batches pad little, then
+        # write the results back in the original order.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        embeds = None
+        with tqdm(total=len(texts)) as progress:
+            for start in range(0, len(order), self.embedding_batch_size):
+                batch = order[start : start + self.embedding_batch_size]
+                embeddings = self.embedding_model.embed_documents(
+                    [texts[i] for i in batch]
+                )
+                if embeds is None:
+                    embeds = np.empty(
+                        (len(texts), len(embeddings[0])), dtype=self.embedding_dtype
+                    )
+                embeds[batch] = embeddings
+                progress.update(len(batch))
+        return embeds
+
+    @timed("setup_seconds", setup="create_embeds")
     def create_embeds(self):
-        embeds = []
         print("Creating embeddings...")
-        for _, row in tqdm(self.df.iterrows(), total=len(self.df)):
-            text = str(row["text"])
-            embeddings = self.embedding_model.embed_documents([text])
-            embeds.append(embeddings[0])
-        self.df["embeddings"] = embeds
-
+        self.embeds = self.embed_texts([str(t) for t in self.df["text"]])
+
+    @contextlib.contextmanager
+    def cache_lock(self, exclusive):
+        """
+        Hold the lock of the cache directory, exclusive to save and shared to
+        load, so the embeddings, chunks and manifest a process reads always
+        come from the same save, even if other processes save concurrently.
+        """
+        import fcntl
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.lock_file, "a") as file:
+            fcntl.flock(file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+
+    @timed("setup_seconds", setup="save_cache")
     def save_cache(self):
-        print(f"Saving dataframe to {self.cache_file}...")
-        # start = time.time()
-        self.df.to_json(self.cache_file)
-        # print(f"  {int(time.time() - start)} seconds.")
-
+        print(f"Saving embeddings and chunks to {self.cache_dir}...")
+        self.cache_id = os.urandom(8).hex()
+        with self.cache_lock(exclusive=True):
+            # Indexes built from previous embeddings become stale.
+            for index_file in glob.glob(os.path.join(self.cache_dir, "annoy-*.ann")):
+                os.remove(index_file)
+            # Write to temporary files first, so a crash never tears a file.
+            with replacing(self.embeds_file) as tmp_path:
+                with open(tmp_path, "wb") as file:
+                    np.save(file, self.embeds.astype(self.embedding_dtype))
+            with replacing(self.chunks_file) as tmp_path:
+                self.df.to_parquet(tmp_path, index=False)
+            self.write_manifest()
+
+    def save_manifest(self):
+        """Save the manifest alone, unless another process has saved a cache
+        since this one was loaded or saved, which it does not describe."""
+        with self.cache_lock(exclusive=True):
+            if self.read_manifest().get("cache_id") == self.cache_id:
+                self.write_manifest()
+
+    def write_manifest(self):
+        manifest = {
+            "cache_id": self.cache_id,
+            "rows": len(self.df),
+            "files": self.manifest,
+        }
+        with replacing(self.manifest_file) as tmp_path:
+            with open(tmp_path, "w") as file:
+                json.dump(manifest, file)
+
+    def read_manifest(self):
+        """The saved manifest, or an empty dict if it is missing or in another
+        format."""
+        if not os.path.exists(self.manifest_file):
+            return {}
+        with open(self.manifest_file, "r") as file:
+            manifest = json.load(file)
+        if (
+            not isinstance(manifest, dict)
+            or set(manifest) != {"cache_id", "rows", "files"}
+            or not all(isinstance(entry, dict) for entry in manifest["files"].values())
+        ):
+            return {}
+        return manifest
+
+    @timed("setup_seconds", setup="load_cache")
     def load_cache(self):
-        if os.path.exists(self.cache_file):
-            print(f"Loading dataframe from {self.cache_file}...")
-            # start = time.time()
-            self.df = pd.read_json(self.cache_file)
-            # print(f"  {int(time.time() - start)} seconds.")
-            return True
-        return False
-
+        """
+        Load the saved chunks, embeddings and manifest. Returns False, like
+        for a missing cache, if the manifest is missing or in another format,
+        or the files do not have the rows the manifest records.
+        """
+        if not os.path.exists(self.manifest_file):
+            return False
+        import pandas as pd
+
+        with self.cache_lock(exclusive=False):
+            manifest = self.read_manifest()
+            if not manifest or not (
+                os.path.exists(self.embeds_file) and os.path.exists(self.chunks_file)
+            ):
+                return False
+            print(f"Loading embeddings and chunks from {self.cache_dir}...")
+            # The memory map keeps the loaded file, even once another process
+            # replaces it.
+            embeds = np.load(self.embeds_file, mmap_mode="r")
+            df = pd.read_parquet(self.chunks_file)
+        if not len(embeds) == len(df) == manifest["rows"]:
+            return False
+        self.embeds = embeds
+        self.df = df
+        self.cache_id = manifest["cache_id"]
+        self.set_manifest(manifest["files"])
+        return True
+
+    @property
+    def index_file(self):
+        # Named after the saved cache, so an index that another process built
+        # from other embeddings, and saved after the cache changed, is never
+        # loaded.
+        name = f"annoy-{self.index_trees}-{self.cache_id}.ann"
+        return os.path.join(self.cache_dir, name)
+
+    @timed("setup_seconds", setup="create_index")
     def create_index(self):
+        self.index = make_retriever(
+            self.retriever, self.embeds.shape[1], self.index_trees
+        )
+        if self.index.persistent and os.path.exists(self.index_file):
+            print(f"Loading embedding index from {self.index_file}...")
+            self.index.load(self.index_file)
+            if len(self.index) == len(self.embeds):
+                return
+            print("The index does not match the embeddings.")
+            self.index = make_retriever(
+                self.retriever, self.embeds.shape[1], self.index_trees
+            )
+
         print("Creating embedding index...")
-        embed_dims = len(self.df.iloc[0]["embeddings"])
-        self.index = AnnoyIndex(embed_dims, "angular")
-        for i, e in enumerate(self.df["embeddings"]):
-            self.index.add_item(i, e)
-        self.index.build(self.index_trees)
+        self.index.build(self.embeds)
+        if self.index.persistent:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Annoy mmaps the file it saved to, so it must not be shared.
+            with replacing(self.index_file) as tmp_path:
+                self.index.save(tmp_path)
+
+    @timed("stage_seconds", stage="query_embedding")
+    def embed_queries(self, queries):
+        # Same as embed_query, but one encoder call for the whole batch, and
+        # only for queries missing from the query embedding cache. Queries are
+        # embedded normalized, like they are keyed, so the cache never changes
+        # an embedding. The bge tokenizers lowercase anyway.
+        texts = [normalize_query(q) for q in queries]
+        keys = [(self.embedding_model_name, text) for text in texts]
+        embeds = [self.query_cache.get(k) for k in keys]
+        missing = [i for i, e in enumerate(embeds) if e is None]
+        if missing:
+            instruction = self.embedding_model.query_instruction
+            computed = self.embedding_model.embed_documents(
+                [instruction + texts[i] for i in missing]
+            )
+            for i, e in zip(missing, computed):
+                embeds[i] = np.asarray(e, dtype=np.float32)
+                self.query_cache.put(keys[i], embeds[i])
+        return np.stack(embeds)
+
+    def retrieve_many(self, queries):
+        """
+        Retrieve the nearest chunks for a batch of queries.
+
+        Args:
+            queries (list): The query strings.
+
+        Returns:
+            tuple: Two arrays of shape (len(queries), retrieval_chunks), the
+                   chunk ids sorted by distance (-1 where fewer chunks were
+                   found) and their retrieve distances.
+        """
+        query_embeds = self.embed_queries(queries)
+        with self.metrics.timer("stage_seconds", stage="ann_search"):
+            return self.index.search_many(query_embeds, self.retrieval_chunks)
+
+    @timed("stage_seconds", stage="dataframe_slicing")
+    def retrieved(self, ids, distances) -> pd.DataFrame:
+        found = ids >= 0
+        ret = self.df.iloc[ids[found]].copy()
+        ret["retrieve_distance"] = distances[found]
+        return ret
 
     def retrieve(self, query: str) -> pd.DataFrame:
-        print("Retrieving...")
-        query_embed = self.embedding_model.embed_query(query)
-        query_embed_float = [float(value) for value in query_embed]
-        nns = self.index.get_nns_by_vector(
-            query_embed_float, self.retrieval_chunks, include_distances=True
+        ids, distances = self.retrieve_many([query])
+        return self.retrieved(ids[0], distances[0])
+
+    def compare_retrievers(self, queries, annoy_trees=(10, 100, 1024)):
+        query_embeds = self.embed_queries(queries)
+        results = compare_retrievers(
+            self.embeds, query_embeds, self.retrieval_chunks, annoy_trees
         )
-        nns_ids = nns[0]
-        nns_distances = nns[1]
-        ret = self.df.iloc[nns_ids].copy()
-        ret["retrieve_distance"] = nns_distances
-        ret = ret.sort_values("retrieve_distance")
-        return ret
+        for r in results:
+            print(
+                f"{r['retriever']:>6} trees={str(r['trees']):>5} "
+                + f"build={r['build_seconds']:.1f}s search={r['search_ms']:.2f}ms "
+                + f"recall@{self.retrieval_chunks}={r['recall']:.3f}"
+            )
+        return results
 
-    def rerank(self, query: str, df: pd.DataFrame):
-        print("Reranking...")
-        start = time.time()
+    def rerank_scores(self, pairs):
+        if not pairs:
+            return np.empty(0, dtype=np.float32)
 
-        pairs = []
-        for _, n in df.iterrows():
-            pairs.append([query, n["text"]])
+        # Tokenize without padding first, then run micro-batches of pairs with
+        # similar token lengths so each batch pads as little as possible.
+        # TODO: do we truncate? do we loose information here?
+        encoded = self.rerank_tokenizer(
+            [list(pair) for pair in pairs], truncation=True, max_length=512
+        )
+        lengths = [len(ids) for ids in encoded["input_ids"]]
+        order = sorted(range(len(pairs)), key=lambda i: lengths[i])
+
+        import torch
 
+        scores = np.empty(len(pairs), dtype=np.float32)
         with torch.no_grad():
-            inputs = self.rerank_tokenizer(
-                pairs,
-                padding=True,
-                truncation=True,
-                return_tensors="pt",
-                max_length=512,
-            ).to(self.device)
-
-            # TODO: do we truncate? do we loose information here?
-
-            scores = (
-                self.rerank_model(**inputs, return_dict=True)
-                .logits.view(
-                    -1,
+            for start in range(0, len(order), self.rerank_batch_size):
+                batch = order[start : start + self.rerank_batch_size]
+                features = [{k: v[i] for k, v in encoded.items()} for i in batch]
+                inputs = self.rerank_tokenizer.pad(features, return_tensors="pt").to(
+                    self.device
                 )
-                .float()
-            )
+                logits = self.rerank_model(**inputs, return_dict=True).logits
+                scores[batch] = logits.view(-1).float().to("cpu").numpy()
+        return scores
+
+    @timed("stage_seconds", stage="rerank")
+    def rerank_many(self, queries, dfs):
+        """Rerank the retrieved chunks of several queries, scoring all of
+        their uncached (query, chunk) pairs in one micro-batched pass."""
+        # Scores are cached per query and chunk. The reranker is case
+        # sensitive, so queries are scored and keyed with their whitespace
+        # collapsed only. Corpus version and reranker model are part of the
+        # key, so changing either invalidates.
+        version = (self.corpus_version, self.reranker_model_name)
+        all_keys = []
+        all_scores = []
+        pairs = []
+        uncached = []
+        for n, (query, df) in enumerate(zip(queries, dfs)):
+            query = collapse_whitespace(query)
+            keys = [(*version, query, i) for i in df["id"]]
+            scores = np.array([self.rerank_cache.get(k, np.nan) for k in keys])
+            for i in np.flatnonzero(np.isnan(scores)):
+                pairs.append((query, str(df["text"].iloc[i])))
+                uncached.append((n, i))
+            all_keys.append(keys)
+            all_scores.append(scores)
+
+        for (n, i), score in zip(uncached, self.rerank_scores(pairs)):
+            all_scores[n][i] = score
+            self.rerank_cache.put(all_keys[n][i], score)
+
+        reranked = []
+        for df, scores in zip(dfs, all_scores):
+            df["rank"] = scores
+            df = df.sort_values(by="rank", ascending=False)
+            reranked.append(df.head(self.context_chunks))
+        return reranked
 
-        df["rank"] = scores.to("cpu")
-        ret = df.sort_values(by="rank", ascending=False).head(self.context_chunks)
+    def rerank(self, query: str, df: pd.DataFrame):
+        start = time.time()
+        ret = self.rerank_many([query], [df])[0]
         seconds = time.time() - start
         return ret, seconds
 
     def print_data(self):
+        import pandas as pd
+
         pd.set_option("display.max_rows", None)
         print(self.df)
 
+    @timed("stage_seconds", stage="context")
     def context(self, df: pd.DataFrame):
         context = ""
         for index in reversed(df.index):
@@ -201,47 +706,230 @@ class AskWikidata:
             context += row["text"] + "\n"
         return context.replace("\n\n", "\n")
 
-    def llm_generate(self, query: str, df: pd.DataFrame):
-        context = self.context(df)
-        prompt_func = None
+    def prompt_func(self):
         if "llama" in self.qa_model_url:
-            prompt_func = self.llama_prompt
+            return self.llama_prompt
         elif "mistral" in self.qa_model_url:
-            prompt_func = self.mistral_prompt
+            return self.mistral_prompt
         elif "Qwen" in self.qa_model_url:
-            prompt_func = self.qwen25_prompt
+            return self.qwen25_prompt
         else:
             raise Exception(f"unknown qa_model_name {self.qa_model_url}")
 
+    @timed("stage_seconds", stage="prompt")
+    def prompt(self, question, context, prompt_func):
+        if context:
+            system = self.system_from_context(context)
+            return prompt_func(question, system)
+        return prompt_func(question)
+
+    def prompt_prefix(self, prompt):
+        """
+        The part of a prompt that is the same for every question: the chat
+        template head and the system instructions up to the context. It
+        contains today's date, so it changes when the date rolls over.
+        """
+        static_system = self.system_from_context("")
+        end = prompt.find(static_system)
+        if end < 0:
+            return None
+        return prompt[: end + len(static_system)]
+
+    def llm_generate(self, query: str, df: pd.DataFrame):
+        context = self.context(df)
+        prompt_func = self.prompt_func()
+
         if "huggingface.co" in self.qa_model_url:
             return self.hf_generate(query, context, self.qa_model_url, prompt_func)
         else:
             return self.local_generate(query, context, prompt_func)
 
     def llm_generate_plain(self, query: str):
-        prompt_func = None
-        if "llama" in self.qa_model_url:
-            prompt_func = self.llama_prompt
-        elif "mistral" in self.qa_model_url:
-            prompt_func = self.mistral_prompt
-        elif "Qwen" in self.qa_model_url:
-            prompt_func = self.qwen25_prompt
-        else:
-            raise Exception(f"unknown qa_model_name {self.qa_model_url}")
+        prompt_func = self.prompt_func()
 
-        # TODO: DRY (see llm_generate)
         if "huggingface.co" in self.qa_model_url:
             return self.hf_generate(query, None, self.qa_model_url, prompt_func)
         else:
             return self.local_generate(query, None, prompt_func)
 
+    def llm_generate_stream(self, query: str, df: pd.DataFrame):
+        prompt = self.prompt(query, self.context(df), self.prompt_func())
+        if self.uses_hf_api():
+            return self.hf_client(self.qa_model_url).generate_stream(prompt)
+        if self.local_llm is None:
+            raise Exception("no local llm loaded")
+        return self.local_llm_stream(prompt)
+
+    def uses_hf_api(self):
+        """Whether answers come from the Huggingface API, not a local LLM."""
+        return "huggingface.co" in self.qa_model_url
+
+    def local_llm_answer(self, prompt):
+        with self.local_llm_lock:
+            return self.local_llm(prompt, prefix=self.prompt_prefix(prompt))
+
+    def local_llm_stream(self, prompt):
+        # The lock is released when generation finishes, not when the caller
+        # is done with the stream.
+        return self.local_llm.stream(
+            prompt, prefix=self.prompt_prefix(prompt), lock=self.local_llm_lock
+        )
+
+    def answer_key(self, query: str):
+        # Everything the answer depends on. A regenerated corpus changes the
+        # corpus version, so stale answers are never returned.
+        return (
+            normalize_query(query),
+            self.qa_model_url,
+            self.embedding_model_name,
+            self.reranker_model_name,
+            self.chunk_size,
+            self.chunk_overlap,
+            self.retrieval_chunks,
+            self.context_chunks,
+            self.corpus_version,
+        )
+
+    def with_sources(self, answer: str, df: pd.DataFrame):
+        sources = set(df["source"])
+        sources_bullet_list = "Sources:\n" + "\n".join(f"- {s}" for s in sources)
+        return answer + "\n\n" + sources_bullet_list
+
     def ask(self, query: str):
+        key = self.answer_key(query)
+        response = self.answer_cache.get(key)
+        if response is not None:
+            return response
+
         retrieved = self.retrieve(query)
         reranked, _ = self.rerank(query, retrieved)
         answer = self.llm_generate(query, reranked)
-        sources = set(reranked["source"])
-        sources_bullet_list = "Sources:\n" + "\n".join(f"- {s}" for s in sources)
-        return answer + "\n\n" + sources_bullet_list
+        response = self.with_sources(answer, reranked)
+        self.answer_cache.put(key, response)
+        return response
+
+    def prepare_many(self, queries):
+        """
+        Retrieve and rerank chunks for a batch of queries and build their
+        prompts. Returns the reranked DataFrames and the prompts.
+        """
+        ids, distances = self.retrieve_many(queries)
+        retrieved = [self.retrieved(i, d) for i, d in zip(ids, distances)]
+        reranked = self.rerank_many(queries, retrieved)
+        prompt_func = self.prompt_func()
+        prompts = [
+            self.prompt(q, self.context(df), prompt_func)
+            for q, df in zip(queries, reranked)
+        ]
+        return reranked, prompts
+
+    @timed("stage_seconds", stage="generation_batch")
+    def generate_many(self, prompts):
+        """Local generation runs in batches of generation_batch_size prompts,
+        API generations run concurrently over the pooled client. Timed per
+        call as generation_batch, apart from single generations."""
+        if self.uses_hf_api():
+            client = self.hf_client(self.qa_model_url)
+            with ThreadPoolExecutor(client.pool_size) as executor:
+                return list(executor.map(client.generate, prompts))
+
+        if self.local_llm is None:
+            raise Exception("no local llm loaded")
+        answers = []
+        for start in range(0, len(prompts), self.generation_batch_size):
+            batch = prompts[start : start + self.generation_batch_size]
+            with self.local_llm_lock:
+                answers.extend(self.local_llm.generate_batch(batch))
+        return answers
+
+    @timed("stage_seconds", stage="generation")
+    async def generate_async(self, prompt):
+        """Await one generation. API requests share the async client, local
+        generation runs in a worker thread."""
+        if self.uses_hf_api():
+            if self.async_hf_client is None:
+                from hf_client import AsyncInferenceClient
+
+                self.async_hf_client = AsyncInferenceClient(self.qa_model_url)
+            return await self.async_hf_client.generate(prompt)
+
+        if self.local_llm is None:
+            raise Exception("no local llm loaded")
+        return await asyncio.to_thread(self.local_llm_answer, prompt)
+
+    async def close_async(self):
+        """Close the async API client and its connections, on the event loop
+        that generated. It is created again on the next generate_async call."""
+        if self.async_hf_client is not None:
+            await self.async_hf_client.close()
+            self.async_hf_client = None
+
+    def ask_many(self, queries):
+        """
+        Answer many questions at once. Queries are embedded, searched and
+        reranked in one batch before generation.
+        """
+        keys = [self.answer_key(q) for q in queries]
+        responses = [self.answer_cache.get(k) for k in keys]
+        missing = [i for i, r in enumerate(responses) if r is None]
+        if not missing:
+            return responses
+
+        reranked, prompts = self.prepare_many([queries[i] for i in missing])
+        answers = self.generate_many(prompts)
+
+        for i, answer, df in zip(missing, answers, reranked):
+            responses[i] = self.with_sources(answer, df)
+            self.answer_cache.put(keys[i], responses[i])
+        return responses
+
+    def ask_stream(self, query: str):
+        """Like ask, but yields the answer piece by piece as it is generated,
+        followed by the sources."""
+        # Retrieval and reranking count towards the time to first token too.
+        start = time.perf_counter()
+        key = self.answer_key(query)
+        response = self.answer_cache.get(key)
+        if response is not None:
+            yield response
+            return
+
+        retrieved = self.retrieve(query)
+        reranked, _ = self.rerank(query, retrieved)
+        pieces = []
+        first = True
+        for piece in self.llm_generate_stream(query, reranked):
+            if not pieces:
+                piece = piece.lstrip()
+            if piece:
+                if first:
+                    self.metrics.observe(
+                        "time_to_first_token_seconds", time.perf_counter() - start
+                    )
+                    first = False
+                pieces.append(piece)
+                yield piece
+        answer = "".join(pieces).strip()
+        response = self.with_sources(answer, reranked)
+        yield response[len(answer) :]
+        self.answer_cache.put(key, response)
+
+    async def ask_async(self, query: str):
+        """
+        Like ask, but awaits generation from the Huggingface API instead of
+        blocking, so one process can have many generations in flight.
+        Retrieval, reranking and local generation run in worker threads.
+        """
+        key = self.answer_key(query)
+        response = self.answer_cache.get(key)
+        if response is not None:
+            return response
+
+        reranked, prompts = await asyncio.to_thread(self.prepare_many, [query])
+        answer = await self.generate_async(prompts[0])
+        response = self.with_sources(answer, reranked[0])
+        self.answer_cache.put(key, response)
+        return response
 
     def system_from_context(self, context):
         system = (
@@ -271,57 +959,29 @@ class AskWikidata:
     def qwen25_prompt(self, text, system=DEFAULT_SYSTEM):
         return f"<|im_start|>system\n{system}\n<|im_end|>\n<|im_start|>assistant\nQUESTION: {text}\n<|im_end|>\n"
 
-    def hf_generate(self, question, context, model_url, prompt_func):
-        huggingface_api_key = os.getenv("HUGGINGFACE_API_KEY")
-
-        if huggingface_api_key is None:
-            raise Exception("HUGGINGFACE_API_KEY is None.")
+    def hf_client(self, model_url):
+        from hf_client import InferenceClient
 
-        print("Generating...")
-        headers = {"Authorization": f"Bearer {huggingface_api_key}"}
+        if model_url not in self.hf_clients:
+            self.hf_clients[model_url] = InferenceClient(model_url)
+        return self.hf_clients[model_url]
 
-        prompt = ""
-        if context:
-            system = self.system_from_context(context)
-            prompt = prompt_func(question, system)
-        else:
-            prompt = prompt_func(question)
+    @timed("stage_seconds", stage="generation")
+    def hf_generate(self, question, context, model_url, prompt_func):
+        prompt = self.prompt(question, context, prompt_func)
 
         # print(f"Sending the following prompt to {model_url}:")
         # print(prompt)
         # print(f"({len(prompt)} chars, about {int(len(prompt)/3)} tokens)")
 
-        response = requests.post(
-            model_url,
-            headers=headers,
-            json={
-                "inputs": prompt,
-                "parameters": {
-                    # max is 250 https://huggingface.co/docs/api-inference/detailed_parameters#text-generation-task
-                    "max_new_tokens": 250,
-                },
-            },
-        )
-        # print(response.json())
-
-        try:
-            return response.json()[0]["generated_text"].replace(prompt, "").strip()
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
-            print(response)
-            raise e
+        return self.hf_client(model_url).generate(prompt)
 
+    @timed("stage_seconds", stage="generation")
     def local_generate(self, question, context, prompt_func):
         if self.local_llm is None:
             raise Exception("no local llm loaded")
 
-        print("Generating...")
-        prompt = ""
-        if context:
-            system = self.system_from_context(context)
-            prompt = prompt_func(question, system)
-        else:
-            prompt = prompt_func(question)
+        prompt = self.prompt(question, context, prompt_func)
 
-        result = self.local_llm(prompt)
+        result = self.local_llm_answer(prompt)
         return result
@@ -0,0 +1,303 @@
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from askwikidata import AskWikidata
+
+WORDS = (
+    "city capital river mayor population country member founded located "
+    + "twinned elevation area official language currency border museum "
+    + "university airport station bridge cathedral park street district "
+    + "region province state council election party government head"
+).split()
+
+
+def seed(text):
+    return int.from_bytes(hashlib.md5(text.encode()).digest()[:8], "little")
+
+
+class StubEmbeddings:
+    """A deterministic stand-in for HuggingFaceBgeEmbeddings. Every text maps
+    to a fixed pseudo random unit vector, so no model is downloaded."""
+
+    query_instruction = "Represent this sentence for searching relevant passages: "
+
+    def __init__(self, dims=384):
+        self.dims = dims
+
+    def embed_documents(self, texts):
+        embeds = []
+        for text in texts:
+            vector = np.random.default_rng(seed(text)).standard_normal(self.dims)
+            embeds.append((vector / np.linalg.norm(vector)).tolist())
+        return embeds
+
+
+class StubRerankTokenizer:
+    """Tokenizes by hashing words, pads like a transformers tokenizer."""
+
+    def __call__(self, pairs, truncation=True, max_length=512):
+        input_ids = []
+        for query, text in pairs:
+            ids = [seed(w) % 30000 for w in f"{query} {text}".split()]
+            input_ids.append(ids[:max_length] if truncation else ids)
+        return {
+            "input_ids": input_ids,
+            "attention_mask": [[1] * len(ids) for ids in input_ids],
+        }
+
+    def pad(self, features, return_tensors="pt"):
+        import torch
+
+        length = max(len(f["input_ids"]) for f in features)
+        batch = PaddedBatch()
+        for key in ("input_ids", "attention_mask"):
+            batch[key] = torch.tensor(
+                [f[key] + [0] * (length - len(f[key])) for f in features]
+            )
+        return batch
+
+
+class PaddedBatch(dict):
+    def to(self, device):
+        return self
+
+
+class StubRerankModel:
+    """Scores a (query, text) pair by a hash of its token ids."""
+
+    def __call__(self, input_ids, attention_mask, return_dict=True):
+        from types import SimpleNamespace
+
+        scores = (input_ids * attention_mask).sum(dim=1, keepdim=True) % 997
+        return SimpleNamespace(logits=scores.float() / 997)
+
+
+def write_corpus(directory, items, lines, rng):
+    """Write items synthetic text representations of lines statements each."""
+    os.makedirs(directory, exist_ok=True)
+    for n in range(1, items + 1):
+        statements = [f"Q{n}", f"item {n} ({rng.choice(WORDS)} {rng.choice(WORDS)})"]
+        for _ in range(lines):
+            words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12)))
+            statements.append(f"{rng.choice(WORDS)}: {words}")
+        with open(os.path.join(directory, f"Q{n}.txt"), "w") as file:
+            file.write("\n".join(statements) + "\n")
+
+
+def make_queries(count, rng):
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6)))
+        for _ in range(count)
+    ]
+
+
+def timings(func, repeats, before=None):
+    seconds = []
+    for _ in range(repeats):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+    return {
+        "median": statistics.median(seconds),
+        "min": min(seconds),
+        "mean": statistics.mean(seconds),
+        "repeats": repeats,
+    }
+
+
+def benchmark_corpus(items, args):
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        write_corpus(os.path.join(tmp, "text_representations"), items, args.lines, rng)
+        askwikidata = AskWikidata(
+            chunk_size=args.chunk_size,
+            chunk_overlap=0,
+            index_trees=args.index_trees,
+            retrieval_chunks=16,
+            context_chunks=5,
+            embedding_model_name="stub-embeddings",
+            reranker_model_name="stub-reranker",
+            qa_model_url="https://stub",
+            cache_dir=os.path.join(tmp, "cache"),
+            retriever=args.retriever,
+            device="cpu",
+        )
+        askwikidata.text_representations_dir = os.path.join(tmp, "text_representations")
+        askwikidata.embedding_model = StubEmbeddings(args.dims)
+        askwikidata.rerank_tokenizer = StubRerankTokenizer()
+        askwikidata.rerank_model = StubRerankModel()
+        askwikidata.local_llm = None
+
+        def remove_index():
+            if os.path.exists(askwikidata.index_file):
+                os.remove(askwikidata.index_file)
+
+        # Query embeddings and rerank scores are cached, so every repeat
+        # works on fresh queries and the stages are measured cold.
+        queries = iter(make_queries(args.queries * (args.repeats + 1), rng))
+        retrieved = []
+
+        def retrieve():
+            retrieved.clear()
+            for _ in range(args.queries):
+                query = next(queries)
+                retrieved.append((query, askwikidata.retrieve(query)))
+
+        def rerank():
+            for query, df in retrieved:
+                askwikidata.rerank(query, df)
+
+        def context():
+            for _, df in retrieved:
+                askwikidata.context(df.head(askwikidata.context_chunks))
+
+        results = {
+            "read_data": timings(askwikidata.read_data, args.repeats),
+            "create_embeds": timings(askwikidata.create_embeds, args.repeats),
+            "save_cache": timings(askwikidata.save_cache, args.repeats),
+            "load_cache": timings(askwikidata.load_cache, args.repeats),
+            "create_index": timings(
+                askwikidata.create_index, args.repeats, remove_index
+            ),
+        }
+        # Per query stages are reported per query.
+        for stage, func in (
+            ("retrieve", retrieve),
+            ("rerank", rerank),
+            ("context", context),
+        ):
+            result = timings(func, args.repeats, askwikidata.rerank_cache.clear)
+            for key in ("median", "min", "mean"):
+                result[key] /= args.queries
+            results[stage] = result
+
+        return {"items": items, "chunks": len(askwikidata.df), "stages": results}
+
+
+def run(args):
+    runs = []
+    for items in args.items:
+        print(f"Benchmarking a synthetic corpus of {items} items...")
+        runs.append(benchmark_corpus(items, args))
+
+    result = {
+        "date": datetime.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "config": {
+            key: getattr(args, key)
+            for key in (
+                "lines",
+                "queries",
+                "repeats",
+                "chunk_size",
+                "index_trees",
+                "retriever",
+                "dims",
+                "seed",
+            )
+        },
+        "runs": runs,
+    }
+    with open(args.output, "w") as file:
+        json.dump(result, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    for r in runs:
+        print(f"{r['items']} items, {r['chunks']} chunks:")
+        for stage, t in r["stages"].items():
+            print(f"  {stage:>14} {t['median'] * 1000:10.2f}ms")
+    return result
+
+
+def compare(baseline, current, threshold=0.2):
+    """
+    Compare the median stage timings of two benchmark results of the same
+    corpus sizes. Returns (items, stage, baseline, current, ratio, slower)
+    rows, where slower marks a slowdown by more than threshold.
+    """
+    baseline_runs = {r["items"]: r for r in baseline["runs"]}
+    rows = []
+    for r in current["runs"]:
+        if r["items"] not in baseline_runs:
+            continue
+        baseline_stages = baseline_runs[r["items"]]["stages"]
+        for stage, t in r["stages"].items():
+            if stage not in baseline_stages:
+                continue
+            before = baseline_stages[stage]["median"]
+            after = t["median"]
+            ratio = after / before if before > 0 else float("inf")
+            rows.append(
+                (r["items"], stage, before, after, ratio, ratio > 1 + threshold)
+            )
+    return rows
+
+
+def print_comparison(rows):
+    for items, stage, before, after, ratio, slower in rows:
+        flag = "  SLOWER" if slower else ""
+        print(
+            f"{items:>8} {stage:>14} {before * 1000:10.2f}ms "
+            + f"-> {after * 1000:10.2f}ms {ratio:6.2f}x{flag}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the retrieval pipeline offline with stub models."
+    )
+    parser.add_argument(
+        "--items", type=int, nargs="+", default=[100, 1000], help="corpus sizes"
+    )
+    parser.add_argument("--lines", type=int, default=40, help="statements per item")
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=1280)
+    parser.add_argument("--index-trees", type=int, default=16)
+    parser.add_argument("--retriever", default="annoy")
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="compare two result files instead of running",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown to flag in --compare, e.g. 0.2 for 20%%",
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as file:
+            baseline = json.load(file)
+        with open(args.compare[1]) as file:
+            current = json.load(file)
+        rows = compare(baseline, current, args.threshold)
+        print_comparison(rows)
+        return 1 if any(row[-1] for row in rows) else 0
+
+    run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import json
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def collapse_whitespace(query):
+    """Collapse the whitespace of a query, keeping its case."""
+    return re.sub(r"\s+", " ", query).strip()
+
+
+def normalize_query(query):
+    """Lowercase a query and collapse its whitespace."""
+    return collapse_whitespace(query).lower()
+
+
+class LRUCache:
+    """
+    A bounded in-memory cache that evicts the least recently used entry.
+    Entries older than ttl seconds are dropped, if ttl is set.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key in self.entries:
+                value, expires = self.entries[key]
+                if expires is None or expires > time.time():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self.entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        with self.lock:
+            self.entries[key] = (value, expires)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+        }
+
+
+class DiskCache:
+    """
+    A bounded cache stored in an SQLite file, so entries survive restarts and
+    are shared by processes on one host. Values are pickled. Entries older
+    than ttl seconds are dropped, if ttl is set.
+    """
+
+    def __init__(self, path, maxsize=1024, ttl=None):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            + "(key TEXT PRIMARY KEY, value BLOB, accessed REAL, expires REAL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+        self.db.commit()
+
+    def get(self, key, default=None):
+        key = json.dumps(key)
+        with self.lock:
+            now = time.time()
+            row = self.db.execute(
+                "SELECT value, expires FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] is not None and row[1] <= now:
+                self.db.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.db.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return default
+            self.db.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+            self.db.commit()
+            self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, key, value):
+        key = json.dumps(key)
+        now = time.time()
+        expires = now + self.ttl if self.ttl is not None else None
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (key, pickle.dumps(value), now, expires),
+            )
+            self.db.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                + "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+            self.db.commit()
+
+    def clear(self):
+        with self.lock:
+            self.db.execute("DELETE FROM cache")
+            self.db.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "size": len(self),
+            "maxsize": self.maxsize,
+        }
@@ -16,6 +16,8 @@
         tokenizers
         tiktoken
         pandas
+        pyarrow
+        aiohttp
         psycopg
         annoy
         openai
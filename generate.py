@@ -1,13 +1,46 @@
+import copy
+from threading import Event, Thread
+
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from transformers import (
+    AutoModelForCausalLM,
+    AutoTokenizer,
+    DynamicCache,
+    StoppingCriteria,
+    StoppingCriteriaList,
+    TextIteratorStreamer,
+)
 import transformers
 
 
 class LLM:
-    def __init__(self, model_name="mistralai/Mistral-7B-Instruct-v0.1", device="cuda"):
+    def __init__(
+        self,
+        model_name="mistralai/Mistral-7B-Instruct-v0.1",
+        device="cuda",
+        cpu_dtype="float32",
+        num_threads=None,
+    ):
         self.model_name = model_name
         self.device = device
 
+        if device == "cuda":
+            self.model = self.load_cuda_model()
+        else:
+            self.model = self.load_cpu_model(cpu_dtype, num_threads)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        self.tokenizer.bos_token_id = 1
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        self.stop_token_ids = [0]
+
+        # past key values of static prompt prefixes, see prefix_cache
+        self.prefix_caches = {}
+        self.max_prefix_caches = 4
+
+    def load_cuda_model(self):
         bnb_config = transformers.BitsAndBytesConfig(
             load_in_4bit=True,
             bnb_4bit_use_double_quant=True,
@@ -15,39 +48,193 @@ class LLM:
             bnb_4bit_compute_dtype=torch.bfloat16,
         )
 
-        self.model = AutoModelForCausalLM.from_pretrained(
+        return AutoModelForCausalLM.from_pretrained(
             self.model_name,
             torch_dtype=torch.bfloat16,
             quantization_config=bnb_config,
         )
 
-        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-        self.tokenizer.bos_token_id = 1
-        self.stop_token_ids = [0]
+    def load_cpu_model(self, cpu_dtype, num_threads):
+        """
+        bitsandbytes needs CUDA, so on CPU the model runs in float32, in
+        bfloat16 or with int8 dynamically quantized linear layers. float32 is
+        the default, as it is fast on every CPU. bfloat16 halves the memory,
+        but is only fast on CPUs with native bfloat16 support, e.g. AVX512-BF16
+        or AMX, and slower than float32 elsewhere. Quantization starts from
+        float32 weights, so loading int8 peaks at about the memory of float32,
+        twice that of bfloat16, which stays the option for low memory hosts.
+        """
+        if num_threads:
+            torch.set_num_threads(num_threads)
+
+        if cpu_dtype == "int8":
+            model = AutoModelForCausalLM.from_pretrained(
+                self.model_name, torch_dtype=torch.float32, low_cpu_mem_usage=True
+            )
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        elif cpu_dtype in ("float32", "bfloat16"):
+            model = AutoModelForCausalLM.from_pretrained(
+                self.model_name,
+                torch_dtype=getattr(torch, cpu_dtype),
+                low_cpu_mem_usage=True,
+            )
+        else:
+            raise Exception(f"unknown cpu_dtype {cpu_dtype}")
+
+        model.to("cpu")
+        model.eval()
+        return model
+
+    def prefix_cache(self, prefix):
+        """
+        Return the token ids and past key values of a static prompt prefix,
+        computing them on first use. Only the most recent prefixes are kept,
+        so a prefix that changed, e.g. with the date, is dropped eventually.
+        """
+        if prefix not in self.prefix_caches:
+            prefix_ids = self.tokenizer(
+                prefix, return_tensors="pt", add_special_tokens=False
+            ).input_ids.to(self.device)
+            with torch.no_grad():
+                output = self.model(
+                    prefix_ids, past_key_values=DynamicCache(), use_cache=True
+                )
+            self.prefix_caches[prefix] = (prefix_ids, output.past_key_values)
+            while len(self.prefix_caches) > self.max_prefix_caches:
+                del self.prefix_caches[next(iter(self.prefix_caches))]
+        return self.prefix_caches[prefix]
+
+    def model_input(self, prompt, prefix=None):
+        """
+        Tokenize the whole prompt at once and reuse the past key values of
+        its prefix when the prompt tokens start with the prefix tokens. A
+        prefix tokenized on its own may end differently than within the
+        prompt, in which case the prompt is prefilled from scratch.
+        """
+        encoded = self.tokenizer(
+            prompt, return_tensors="pt", add_special_tokens=False
+        ).to(self.device)
+        if not prefix or not prompt.startswith(prefix):
+            return dict(encoded)
 
-    def __call__(self, prompt):
-        encoded = self.tokenizer(prompt, return_tensors="pt", add_special_tokens=False)
+        prefix_ids, past_key_values = self.prefix_cache(prefix)
+        input_ids = encoded.input_ids
+        length = prefix_ids.shape[1]
+        if input_ids.shape[1] <= length or not torch.equal(
+            input_ids[:, :length], prefix_ids
+        ):
+            return dict(encoded)
+
+        # Only the tokens after the prefix need a prefill. generate mutates
+        # the cache, so every request works on its own copy.
+        return dict(
+            input_ids=input_ids,
+            attention_mask=torch.ones_like(input_ids),
+            past_key_values=copy.deepcopy(past_key_values),
+        )
+
+    def __call__(self, prompt, prefix=None):
+        model_input = self.model_input(prompt, prefix)
+        generated_ids = self.model.generate(
+            **model_input,
+            do_sample=True,
+            max_new_tokens=200,
+            pad_token_id=self.tokenizer.pad_token_id
+        )
+        answer_ids = generated_ids[:, model_input["input_ids"].shape[1] :]
+        decoded = self.tokenizer.batch_decode(answer_ids, skip_special_tokens=True)
+        return decoded[0].strip()
+
+    def generate_batch(self, prompts, max_new_tokens=200):
+        """
+        Generate answers for several prompts in one batch. Prompts are padded
+        on the left, so every answer starts right after the shared input
+        length and is cut from the output by token offset.
+        """
+        encoded = self.tokenizer(
+            prompts, return_tensors="pt", padding=True, add_special_tokens=False
+        )
         model_input = encoded
         model_input.to(self.device)
         generated_ids = self.model.generate(
             **model_input,
             do_sample=True,
-            max_new_tokens=200,
-            pad_token_id=self.tokenizer.eos_token_id
+            max_new_tokens=max_new_tokens,
+            pad_token_id=self.tokenizer.pad_token_id
         )
-        decoded = self.tokenizer.batch_decode(generated_ids)
+        answer_ids = generated_ids[:, model_input["input_ids"].shape[1] :]
+        decoded = self.tokenizer.batch_decode(answer_ids, skip_special_tokens=True)
+        return [result.strip() for result in decoded]
 
-        result = decoded[0]
+    def stream(self, prompt, prefix=None, timeout=120, lock=None):
+        """
+        Yield decoded text pieces of the answer as they are generated. An
+        error during generation is raised here, as is queue.Empty if no piece
+        arrives within timeout seconds. Generation is stopped before this
+        returns, also when the caller stops consuming early.
 
-        # mistrals response does not match prompt
-        result = result.replace("<s> [INST]", "<s>[INST]") 
+        If lock is given, it is held while the model runs and released once
+        generation finishes, so a caller that stalls or drops the stream
+        without closing it does not hold it any longer.
+        """
+        if lock is not None:
+            lock.acquire()
+        try:
+            model_input = self.model_input(prompt, prefix)
+            streamer = TextIteratorStreamer(
+                self.tokenizer,
+                skip_prompt=True,
+                skip_special_tokens=True,
+                timeout=timeout,
+            )
+            stop = Event()
+            errors = []
 
-        # remove prompt from response
-        result = result.replace(prompt, "")
+            def generate():
+                try:
+                    self.model.generate(
+                        **model_input,
+                        do_sample=True,
+                        max_new_tokens=200,
+                        pad_token_id=self.tokenizer.eos_token_id,
+                        streamer=streamer,
+                        stopping_criteria=StoppingCriteriaList([StopOnEvent(stop)]),
+                    )
+                except Exception as e:
+                    errors.append(e)
+                    streamer.end()
+                finally:
+                    if lock is not None:
+                        lock.release()
 
-        # remove end token
-        result = result.replace("</s>", "")
+            thread = Thread(target=generate)
+            thread.start()
+        except BaseException:
+            if lock is not None:
+                lock.release()
+            raise
+        try:
+            for text in streamer:
+                yield text
+        finally:
+            stop.set()
+            thread.join()
+        if errors:
+            raise errors[0]
 
-        result = result.strip()
 
-        return result
+class StopOnEvent(StoppingCriteria):
+    """Stops generation once the event is set."""
+
+    def __init__(self, event):
+        self.event = event
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return torch.full(
+            (input_ids.shape[0],),
+            self.event.is_set(),
+            dtype=torch.bool,
+            device=input_ids.device,
+        )
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import os
+
+from retrying_client import RETRY_STATUS, RetryingClient
+
+
+class InferenceClient(RetryingClient):
+    """
+    A client for the Huggingface text generation inference API that keeps a
+    pool of persistent connections and retries transient failures with
+    jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        model_url,
+        api_key=None,
+        connect_timeout=5,
+        read_timeout=120,
+        max_retries=5,
+        backoff=1.0,
+        max_backoff=30.0,
+        pool_size=16,
+    ):
+        super().__init__(
+            connect_timeout, read_timeout, max_retries, backoff, max_backoff, pool_size
+        )
+        self.model_url = model_url
+        self.api_key = api_key or os.getenv("HUGGINGFACE_API_KEY")
+
+    def headers(self):
+        if self.api_key is None:
+            raise Exception("HUGGINGFACE_API_KEY is None.")
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def payload(self, prompt, max_new_tokens, stream=False):
+        payload = {
+            "inputs": prompt,
+            "parameters": {
+                # max is 250 https://huggingface.co/docs/api-inference/detailed_parameters#text-generation-task
+                "max_new_tokens": max_new_tokens,
+            },
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    @staticmethod
+    def loading_delay(status, body):
+        """A 503 while the model is loading reports an estimated_time."""
+        if status != 503:
+            return None
+        try:
+            return json.loads(body).get("estimated_time")
+        except (ValueError, AttributeError):
+            return None
+
+    def server_delay(self, response):
+        delay = self.loading_delay(response.status_code, response.content)
+        if delay is None:
+            return super().server_delay(response)
+        return delay
+
+    @staticmethod
+    def answer(data, prompt):
+        return data[0]["generated_text"].replace(prompt, "").strip()
+
+    def post(self, payload, stream=False):
+        return self.request(
+            "POST", self.model_url, headers=self.headers(), json=payload, stream=stream
+        )
+
+    def generate(self, prompt, max_new_tokens=250):
+        response = self.post(self.payload(prompt, max_new_tokens))
+        return self.answer(response.json(), prompt)
+
+    def generate_stream(self, prompt, max_new_tokens=250):
+        """
+        Yield the generated text token by token as server-sent events arrive.
+        Retries only happen before the first token. An error event, or a
+        stream that ends without any token, raises an exception, so a failed
+        generation is never taken for an empty answer.
+        """
+        response = self.post(self.payload(prompt, max_new_tokens, True), True)
+        tokens = 0
+        with response:
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                event = json.loads(line[len("data:") :])
+                if "error" in event:
+                    raise Exception(f"generation failed: {event['error']}")
+                if "token" not in event:
+                    continue
+                tokens += 1
+                if not event["token"].get("special"):
+                    yield event["token"].get("text", "")
+        if not tokens:
+            raise Exception("generation stream ended without tokens")
+
+
+class AsyncInferenceClient(InferenceClient):
+    """
+    The asyncio variant of InferenceClient. Many generations can be in flight
+    at once, sharing one pool of at most pool_size connections. The client
+    is used from one event loop at a time, await close() on it before using
+    the client from another loop.
+    """
+
+    def __init__(self, model_url, **kwargs):
+        super().__init__(model_url, **kwargs)
+        self.async_session = None
+        self.async_session_loop = None
+
+    def aiohttp_session(self):
+        import aiohttp
+
+        # Sessions are bound to the event loop they were created on and can
+        # only be closed on it, so another loop may only create a new one once
+        # the session was closed.
+        loop = asyncio.get_running_loop()
+        if self.async_session is not None and not self.async_session.closed:
+            if self.async_session_loop is not loop:
+                raise Exception(
+                    "the client is in use by another event loop, "
+                    + "await close() on that loop first"
+                )
+            return self.async_session
+        self.async_session_loop = loop
+        self.async_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=self.timeout[0], sock_read=self.timeout[1]
+            ),
+        )
+        return self.async_session
+
+    async def generate(self, prompt, max_new_tokens=250):
+        import aiohttp
+
+        session = self.aiohttp_session()
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.post(
+                    self.model_url,
+                    headers=self.headers(),
+                    json=self.payload(prompt, max_new_tokens),
+                ) as response:
+                    if response.status in RETRY_STATUS and attempt < self.max_retries:
+                        wait = self.loading_delay(
+                            response.status, await response.read()
+                        )
+                        if wait is None:
+                            wait = response.headers.get("Retry-After")
+                        await asyncio.sleep(self.retry_delay(attempt, wait))
+                        continue
+
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+                    return self.answer(data, prompt)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self.retry_delay(attempt))
+
+    async def close(self):
+        """Close the session, on the event loop that used the client."""
+        if self.async_session is not None:
+            if self.async_session_loop is not asyncio.get_running_loop():
+                raise Exception(
+                    "close() must be awaited on the event loop that used the client"
+                )
+            await self.async_session.close()
+            self.async_session = None
+            self.async_session_loop = None
+        super().close()
@@ -0,0 +1,179 @@
+import asyncio
+import bisect
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds in seconds, from sub-millisecond index lookups to generation.
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+)
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """(upper bound, cumulative count) pairs, ending with +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(list(self.buckets) + ["+Inf"], self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class Metrics:
+    """
+    Timers, histograms and counters for the question answering pipeline,
+    exportable as Prometheus text or JSON. Metrics are identified by a name
+    and optional labels, e.g. timer("stage_seconds", stage="rerank").
+    """
+
+    def __init__(self, prefix="askwikidata"):
+        self.prefix = prefix
+        self.histograms = {}
+        self.counters = {}
+        self.caches = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(name, labels):
+        return (name, tuple(sorted(labels.items())))
+
+    def observe(self, name, value, **labels):
+        with self.lock:
+            key = self.key(name, labels)
+            if key not in self.histograms:
+                self.histograms[key] = Histogram()
+            self.histograms[key].observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def inc(self, name, value=1, **labels):
+        with self.lock:
+            key = self.key(name, labels)
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def register_cache(self, name, cache):
+        """Export the hit and miss counts of a cache with a stats() method."""
+        self.caches[name] = cache
+
+    def cache_counters(self):
+        counters = {}
+        for name, cache in self.caches.items():
+            stats = cache.stats()
+            labels = (("cache", name),)
+            counters[("cache_hits", labels)] = stats["hits"]
+            counters[("cache_misses", labels)] = stats["misses"]
+        return counters
+
+    def to_json(self):
+        with self.lock:
+            histograms = list(self.histograms.items())
+            counters = dict(self.counters)
+        counters.update(self.cache_counters())
+
+        result = {"histograms": [], "counters": []}
+        for (name, labels), h in histograms:
+            result["histograms"].append(
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": h.count,
+                    "sum": h.sum,
+                    "buckets": [[str(b), c] for b, c in h.cumulative()],
+                }
+            )
+        for (name, labels), value in counters.items():
+            result["counters"].append(
+                {"name": name, "labels": dict(labels), "value": value}
+            )
+        return json.dumps(result)
+
+    def to_prometheus(self):
+        with self.lock:
+            histograms = sorted(self.histograms.items())
+            counters = dict(self.counters)
+        counters.update(self.cache_counters())
+
+        lines = []
+        typed = set()
+        for (name, labels), h in histograms:
+            metric = f"{self.prefix}_{name}"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} histogram")
+                typed.add(metric)
+            for bound, count in h.cumulative():
+                bucket_labels = labels + (("le", str(bound)),)
+                lines.append(f"{metric}_bucket{format_labels(bucket_labels)} {count}")
+            lines.append(f"{metric}_sum{format_labels(labels)} {h.sum}")
+            lines.append(f"{metric}_count{format_labels(labels)} {h.count}")
+        for (name, labels), value in sorted(counters.items()):
+            metric = f"{self.prefix}_{name}_total"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+def timed(name, **labels):
+    """Decorate a method to record its duration in self.metrics."""
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.metrics.timer(name, **labels):
+                    return await func(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.timer(name, **labels):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
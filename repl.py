@@ -1,20 +1,11 @@
-from askwikidata import AskWikidata
-
-hyperparams = {
-    "chunk_size": 1280,
-    "chunk_overlap": 0,
-    "index_trees": 1024,
-    "retrieval_chunks": 16,
-    "context_chunks": 5,
-    "embedding_model_name": "BAAI/bge-small-en-v1.5",
-    "reranker_model_name": "BAAI/bge-reranker-base",
-    "qa_model_url": "Qwen/Qwen2.5-3B-Instruct",
-}
+from askwikidata import AskWikidata, hyperparams
 
 askwikidata = AskWikidata(**hyperparams)
 askwikidata.setup()
 
 while True:
     query = input("AskWikidata >> ")
-    response = askwikidata.ask(query)
-    print("\n" + response + "\n")
+    print("")
+    for piece in askwikidata.ask_stream(query):
+        print(piece, end="", flush=True)
+    print("\n")
@@ -0,0 +1,150 @@
+import time
+
+import numpy as np
+
+
+class AnnoyRetriever:
+    """Approximate nearest neighbor search over an Annoy index."""
+
+    persistent = True
+
+    def __init__(self, dims, trees=10):
+        from annoy import AnnoyIndex
+
+        self.trees = trees
+        self.index = AnnoyIndex(dims, "angular")
+
+    def build(self, embeds):
+        for i, e in enumerate(embeds):
+            self.index.add_item(i, e.tolist())
+        self.index.build(self.trees)
+
+    def save(self, path):
+        self.index.save(path)
+
+    def load(self, path):
+        # Annoy mmaps the file, so processes on one host share its pages.
+        self.index.load(path)
+
+    def __len__(self):
+        return self.index.get_n_items()
+
+    def search(self, vector, k):
+        ids, distances = self.index.get_nns_by_vector(
+            vector.tolist(), k, include_distances=True
+        )
+        return np.asarray(ids, dtype=np.int64), np.asarray(distances, dtype=np.float32)
+
+    def search_many(self, vectors, k):
+        k = min(k, self.index.get_n_items())
+        # Annoy may return fewer than k neighbors, pad with id -1.
+        ids = np.full((len(vectors), k), -1, dtype=np.int64)
+        distances = np.full((len(vectors), k), np.inf, dtype=np.float32)
+        for i, vector in enumerate(vectors):
+            found_ids, found_distances = self.search(vector, k)
+            ids[i, : len(found_ids)] = found_ids
+            distances[i, : len(found_ids)] = found_distances
+        return ids, distances
+
+
+class NumpyRetriever:
+    """Exact nearest neighbor search with one matrix-vector product."""
+
+    persistent = False
+
+    def __init__(self, dims, trees=None):
+        self.dims = dims
+
+    def build(self, embeds):
+        # Normalized float32 embeddings, e.g. the mmap'd cache, are searched
+        # in place instead of being copied into memory.
+        embeds = np.asarray(embeds, dtype=np.float32)
+        norms = np.sqrt(np.einsum("ij,ij->i", embeds, embeds))
+        if np.allclose(norms, 1, atol=1e-3):
+            self.embeds = embeds
+        else:
+            self.embeds = embeds / np.maximum(norms, 1e-12)[:, None]
+
+    def __len__(self):
+        return len(self.embeds)
+
+    def search(self, vector, k):
+        vector = np.asarray(vector, dtype=np.float32)
+        vector = vector / max(np.linalg.norm(vector), 1e-12)
+        scores = self.embeds @ vector
+        k = min(k, len(scores))
+        ids = np.argpartition(-scores, k - 1)[:k]
+        ids = ids[np.argsort(-scores[ids])]
+        # Same scale as Annoy's angular distance: sqrt(2 - 2 * cos).
+        distances = np.sqrt(np.maximum(2 - 2 * scores[ids], 0))
+        return ids, distances
+
+    def search_many(self, vectors, k):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        scores = (vectors / np.maximum(norms, 1e-12)) @ self.embeds.T
+        k = min(k, scores.shape[1])
+        ids = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(scores, ids, axis=1)
+        order = np.argsort(-top, axis=1)
+        ids = np.take_along_axis(ids, order, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        distances = np.sqrt(np.maximum(2 - 2 * top, 0))
+        return ids, distances
+
+
+RETRIEVERS = {
+    "annoy": AnnoyRetriever,
+    "numpy": NumpyRetriever,
+}
+
+
+def make_retriever(name, dims, trees=10):
+    if name not in RETRIEVERS:
+        raise Exception(f"unknown retriever {name}")
+    return RETRIEVERS[name](dims, trees)
+
+
+def compare_retrievers(embeds, query_embeds, k=16, annoy_trees=(10, 100, 1024)):
+    """
+    Measure recall@k against exact search and mean search latency for the
+    NumPy backend and Annoy indexes with different numbers of trees.
+
+    Args:
+        embeds (array): The corpus embeddings, one row per chunk.
+        query_embeds (array): The query embeddings, one row per query.
+        k (int): The number of neighbors to retrieve per query.
+        annoy_trees (tuple): The Annoy tree counts to compare.
+
+    Returns:
+        list: One dict per configuration with build seconds, mean search
+              milliseconds and recall@k.
+    """
+    dims = embeds.shape[1]
+    configurations = [("numpy", None)] + [("annoy", t) for t in annoy_trees]
+
+    results = []
+    exact = None
+    for name, trees in configurations:
+        retriever = make_retriever(name, dims, trees)
+        start = time.time()
+        retriever.build(embeds)
+        build_seconds = time.time() - start
+
+        start = time.time()
+        found = [set(retriever.search(q, k)[0]) for q in query_embeds]
+        search_ms = (time.time() - start) * 1000 / max(len(query_embeds), 1)
+
+        if exact is None:
+            exact = found
+        recall = np.mean([len(f & e) / max(len(e), 1) for f, e in zip(found, exact)])
+        results.append(
+            {
+                "retriever": name,
+                "trees": trees,
+                "build_seconds": build_seconds,
+                "search_ms": search_ms,
+                "recall": float(recall),
+            }
+        )
+    return results
@@ -0,0 +1,89 @@
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Statuses worth retrying: rate limiting and server errors, including the 503
+# of a Huggingface model that is still loading.
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RetryingClient:
+    """
+    A base for HTTP clients that are safe to share between threads. All
+    requests go through one pool of persistent connections and transient
+    failures are retried with jittered exponential backoff. Subclasses may
+    wait before each attempt, see before_attempt, and read the delay a server
+    asks for from its response, see server_delay.
+    """
+
+    user_agent = None
+
+    def __init__(
+        self,
+        connect_timeout=5,
+        read_timeout=60,
+        max_retries=5,
+        backoff=1.0,
+        max_backoff=30.0,
+        pool_size=16,
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.pool_size = pool_size
+
+        self.session = requests.Session()
+        if self.user_agent:
+            self.session.headers["User-Agent"] = self.user_agent
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def before_attempt(self):
+        pass
+
+    def server_delay(self, response):
+        """The seconds a response asks to wait in its Retry-After header."""
+        return response.headers.get("Retry-After")
+
+    def retry_delay(self, attempt, server_delay=None):
+        """
+        Seconds to wait before the next attempt. The delay the server asked
+        for is used when present.
+        """
+        try:
+            return min(float(server_delay), self.max_backoff)
+        except (TypeError, ValueError):
+            pass
+        delay = min(self.backoff * 2**attempt, self.max_backoff)
+        return random.uniform(0, delay)
+
+    def request(self, method, url, **kwargs):
+        for attempt in range(self.max_retries + 1):
+            self.before_attempt()
+            try:
+                response = self.session.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self.retry_delay(attempt))
+                continue
+
+            if response.status_code in RETRY_STATUS and attempt < self.max_retries:
+                delay = self.retry_delay(attempt, self.server_delay(response))
+                # Return the connection to the pool, a streamed response would
+                # hold on to it.
+                response.close()
+                time.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            return response
+
+    def close(self):
+        self.session.close()
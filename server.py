@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import web
+
+from askwikidata import AskWikidata, hyperparams
+
+
+class QueueFull(Exception):
+    pass
+
+
+class BatchScheduler:
+    """
+    Coalesces concurrent questions into shared batches. A batch is closed
+    when it holds max_batch_size questions or max_wait_ms after its first
+    question arrived. Query embedding, nearest neighbor search and
+    reranking then run once for the whole batch, and the generations of
+    a batch run concurrently with the preparation of the next one.
+
+    API generations run concurrently per question, up to max_generations.
+    A local LLM generates each batch with one padded generate_many call in
+    a single worker thread, one batch at a time.
+    """
+
+    def __init__(
+        self,
+        askwikidata,
+        max_batch_size=16,
+        max_wait_ms=10,
+        max_queue=256,
+        max_generations=32,
+    ):
+        self.askwikidata = askwikidata
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.queue = asyncio.Queue(max_queue)
+        self.generations = asyncio.Semaphore(max_generations)
+        self.local_batches = asyncio.Semaphore(1)
+        self.local_executor = ThreadPoolExecutor(1)
+        self.tasks = set()
+
+    async def ask(self, query):
+        response = self.askwikidata.answer_cache.get(self.askwikidata.answer_key(query))
+        if response is not None:
+            return response
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((query, future))
+        except asyncio.QueueFull:
+            self.askwikidata.metrics.inc("rejected_requests")
+            raise QueueFull()
+        return await future
+
+    async def next_batch(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def run(self):
+        while True:
+            batch = await self.next_batch()
+            self.askwikidata.metrics.inc("batches")
+            self.askwikidata.metrics.inc("batched_requests", len(batch))
+            queries = [query for query, _ in batch]
+            try:
+                reranked, prompts = await asyncio.to_thread(
+                    self.askwikidata.prepare_many, queries
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            if not self.askwikidata.uses_hf_api():
+                # The next batch is prepared while this one generates.
+                await self.local_batches.acquire()
+                self.start_task(self.generate_batch(batch, reranked, prompts))
+                continue
+
+            for (query, future), df, prompt in zip(batch, reranked, prompts):
+                # Wait for a free generation slot, so a backlog builds up in
+                # the bounded queue instead of in unbounded tasks.
+                await self.generations.acquire()
+                self.start_task(self.generate(query, future, df, prompt))
+
+    def start_task(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def generate(self, query, future, df, prompt):
+        try:
+            answer = await self.askwikidata.generate_async(prompt)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        finally:
+            self.generations.release()
+        self.respond(query, future, answer, df)
+
+    async def generate_batch(self, batch, reranked, prompts):
+        loop = asyncio.get_running_loop()
+        try:
+            answers = await loop.run_in_executor(
+                self.local_executor, self.askwikidata.generate_many, prompts
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.local_batches.release()
+        for (query, future), df, answer in zip(batch, reranked, answers):
+            self.respond(query, future, answer, df)
+
+    def respond(self, query, future, answer, df):
+        response = self.askwikidata.with_sources(answer, df)
+        self.askwikidata.answer_cache.put(self.askwikidata.answer_key(query), response)
+        if not future.done():
+            future.set_result(response)
+
+    def close(self):
+        self.local_executor.shutdown(wait=False)
+
+
+async def handle_ask(request):
+    scheduler = request.app["scheduler"]
+    scheduler.askwikidata.metrics.inc("requests")
+    try:
+        body = await request.json()
+    except ValueError:
+        # Covers both JSON and UTF-8 decoding errors.
+        return web.json_response({"error": "invalid JSON body"}, status=400)
+    query = body.get("query") if isinstance(body, dict) else None
+    if not isinstance(query, str) or not query.strip():
+        return web.json_response({"error": "missing query"}, status=400)
+    try:
+        response = await scheduler.ask(query)
+    except QueueFull:
+        return web.json_response(
+            {"error": "too many queued requests"},
+            status=503,
+            headers={"Retry-After": "1"},
+        )
+    return web.json_response({"answer": response})
+
+
+async def handle_health(request):
+    scheduler = request.app["scheduler"]
+    return web.json_response(
+        {
+            "ready": scheduler.askwikidata.ready(),
+            "queued": scheduler.queue.qsize(),
+        }
+    )
+
+
+async def handle_metrics(request):
+    metrics = request.app["scheduler"].askwikidata.metrics
+    if request.query.get("format") == "json":
+        return web.Response(text=metrics.to_json(), content_type="application/json")
+    return web.Response(
+        text=metrics.to_prometheus(), content_type="text/plain", charset="utf-8"
+    )
+
+
+def create_app(askwikidata, **scheduler_kwargs):
+    app = web.Application()
+    app.router.add_post("/ask", handle_ask)
+    app.router.add_get("/health", handle_health)
+    app.router.add_get("/metrics", handle_metrics)
+
+    async def start_scheduler(app):
+        app["scheduler"] = BatchScheduler(askwikidata, **scheduler_kwargs)
+        app["scheduler_task"] = asyncio.create_task(app["scheduler"].run())
+
+    async def stop_scheduler(app):
+        app["scheduler_task"].cancel()
+        app["scheduler"].close()
+        await askwikidata.close_async()
+
+    app.on_startup.append(start_scheduler)
+    app.on_cleanup.append(stop_scheduler)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve AskWikidata over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch-size", type=int, default=16)
+    parser.add_argument("--max-wait-ms", type=float, default=10)
+    parser.add_argument("--max-queue", type=int, default=256)
+    parser.add_argument("--max-generations", type=int, default=32)
+    args = parser.parse_args()
+
+    askwikidata = AskWikidata(**hyperparams)
+    askwikidata.setup()
+
+    app = create_app(
+        askwikidata,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+        max_queue=args.max_queue,
+        max_generations=args.max_generations,
+    )
+    web.run_app(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    A base for request handlers of local stand-in servers in client tests.
+    Subclasses answer with the statuses in failures before succeeding, shared
+    by all requests, and count the requests they received.
+    """
+
+    failures = []
+    requests = 0
+    lock = threading.Lock()
+
+    def next_status(self):
+        handler = type(self)
+        with StandInHandler.lock:
+            handler.requests += 1
+            return handler.failures.pop(0) if handler.failures else 200
+
+    def send_json(self, status, response, headers=()):
+        data = json.dumps(response).encode()
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServerTestCase(unittest.TestCase):
+    """Runs a stand-in server with the handler class at url for each test."""
+
+    handler = None
+    path = ""
+
+    def setUp(self):
+        self.handler.failures = []
+        self.handler.requests = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}{self.path}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
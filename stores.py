@@ -0,0 +1,115 @@
+import json
+import sqlite3
+import threading
+import zlib
+from collections.abc import MutableMapping
+
+
+class SQLiteStore(MutableMapping):
+    """
+    A persistent mapping of Wikidata ids to values in an SQLite table. Every
+    insert is written on its own, without rewriting the other entries. The
+    database runs in WAL mode, so several threads and processes can read and
+    write the same file. Subclasses set the table and column names and may
+    encode values for storage.
+    """
+
+    table = None
+    column = None
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} "
+            + f"(id TEXT PRIMARY KEY, {self.column} BLOB)"
+        )
+        self.db.commit()
+
+    def encode(self, value):
+        return value
+
+    def decode(self, stored):
+        return stored
+
+    def __getitem__(self, id_):
+        with self.lock:
+            row = self.db.execute(
+                f"SELECT {self.column} FROM {self.table} WHERE id = ?", (id_,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(id_)
+        return self.decode(row[0])
+
+    def __setitem__(self, id_, value):
+        self.update({id_: value})
+
+    def __delitem__(self, id_):
+        with self.lock:
+            deleted = self.db.execute(f"DELETE FROM {self.table} WHERE id = ?", (id_,))
+            self.db.commit()
+        if deleted.rowcount == 0:
+            raise KeyError(id_)
+
+    def __contains__(self, id_):
+        with self.lock:
+            row = self.db.execute(
+                f"SELECT 1 FROM {self.table} WHERE id = ?", (id_,)
+            ).fetchone()
+        return row is not None
+
+    def __iter__(self):
+        with self.lock:
+            ids = [row[0] for row in self.db.execute(f"SELECT id FROM {self.table}")]
+        return iter(ids)
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def update(self, values=(), **kwargs):
+        """Insert or replace many entries in one transaction."""
+        rows = [(k, self.encode(v)) for k, v in dict(values, **kwargs).items()]
+        with self.lock:
+            self.db.executemany(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?)", rows
+            )
+            self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class LabelStore(SQLiteStore):
+    """Labels of Wikidata entities by id."""
+
+    table = "labels"
+    column = "label"
+
+
+class ItemStore(SQLiteStore):
+    """
+    Entity data of Wikidata items by id, stored as JSON compressed with zlib
+    unless compress is False. An item is only decoded when it is looked up,
+    so memory does not grow with the number of stored items.
+    """
+
+    table = "items"
+    column = "data"
+
+    def __init__(self, path, compress=True):
+        super().__init__(path)
+        self.compress = compress
+
+    def encode(self, item):
+        data = json.dumps(item).encode()
+        return zlib.compress(data) if self.compress else data
+
+    def decode(self, data):
+        # zlib streams start with 0x78, JSON objects with "{"
+        if data[:1] == b"\x78":
+            data = zlib.decompress(data)
+        return json.loads(data)
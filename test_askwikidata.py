@@ -0,0 +1,490 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import benchmark
+import retrievers
+from askwikidata import AskWikidata
+
+
+class BlankLineSplitter:
+    def split_text(self, text):
+        return [chunk for chunk in text.split("\n\n") if chunk]
+
+
+class TestImport(unittest.TestCase):
+    # Test if importing the module does not import the heavy dependencies.
+    def test_import_is_light(self):
+        heavy = ["pandas", "torch", "transformers", "langchain", "annoy"]
+        code = (
+            "import sys, askwikidata; "
+            + f"print(' '.join(m for m in {heavy} if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "")
+
+
+class StubPersistentRetriever(retrievers.NumpyRetriever):
+    """A NumpyRetriever that is saved to and loaded from a file like Annoy."""
+
+    persistent = True
+
+    def __init__(self, dims, trees=None):
+        super().__init__(dims)
+        self.built = False
+        self.loaded = False
+
+    def build(self, embeds):
+        super().build(embeds)
+        self.built = True
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            np.save(file, self.embeds)
+
+    def load(self, path):
+        self.embeds = np.load(path)
+        self.loaded = True
+
+
+class CorpusTestCase(unittest.TestCase):
+    """Writes a small corpus and caches its chunks and stub embeddings."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = os.path.join(tmp.name, "cache")
+        self.text_dir = os.path.join(tmp.name, "text_representations")
+        os.makedirs(self.text_dir)
+        self.write("Q1", "Q1\n\nBerlin\n\ncapital of Germany")
+        self.write("Q2", "Q2\n\nParis")
+        self.write("Q3", "Q3\n\nRome")
+
+        self.askwikidata = self.make_askwikidata()
+        self.askwikidata.read_data()
+        self.askwikidata.create_embeds()
+        self.askwikidata.save_cache()
+
+    def make_askwikidata(self):
+        askwikidata = AskWikidata(cache_dir=self.cache_dir)
+        askwikidata.text_representations_dir = self.text_dir
+        askwikidata.text_splitter = BlankLineSplitter
+        askwikidata.embedding_model = benchmark.StubEmbeddings(dims=8)
+        return askwikidata
+
+    def write(self, q_id, text):
+        with open(os.path.join(self.text_dir, f"{q_id}.txt"), "w") as file:
+            file.write(text)
+
+
+class TestRefresh(CorpusTestCase):
+
+    def assert_embeds_match_texts(self):
+        expected = self.askwikidata.embedding_model.embed_documents(
+            list(self.askwikidata.df["text"])
+        )
+        np.testing.assert_allclose(self.askwikidata.embeds, expected, rtol=1e-3)
+
+    # Test if changed, deleted and new text representations are refreshed and
+    # every embedding still belongs to the text in its row.
+    def test_refresh(self):
+        self.write("Q1", "Q1\n\nBerlin\n\ncapital and largest city of Germany")
+        os.remove(os.path.join(self.text_dir, "Q2.txt"))
+        self.write("Q4", "Q4\n\nMadrid")
+
+        self.assertTrue(self.askwikidata.load_cache())
+        self.assertTrue(self.askwikidata.refresh())
+        texts = ["Q1", "Berlin", "capital and largest city of Germany"]
+        texts += ["Q3", "Rome", "Q4", "Madrid"]
+        self.assertEqual(sorted(self.askwikidata.df["text"]), sorted(texts))
+        self.assertEqual(sorted(self.askwikidata.manifest), ["Q1", "Q3", "Q4"])
+        self.assert_embeds_match_texts()
+
+    # Test if a changed file is read once, for both its hash and its chunks.
+    def test_refresh_reads_changed_file_once(self):
+        self.write("Q2", "Q2\n\nParis\n\ncapital of France")
+        path = os.path.join(self.text_dir, "Q2.txt")
+        self.assertTrue(self.askwikidata.load_cache())
+        with mock.patch("builtins.open", wraps=open) as opened:
+            self.assertTrue(self.askwikidata.refresh())
+        self.assertEqual([c.args[0] for c in opened.call_args_list].count(path), 1)
+        self.assert_embeds_match_texts()
+
+    # Test if unchanged files are neither hashed again nor re-embedded.
+    def test_refresh_unchanged(self):
+        version = self.askwikidata.corpus_version
+        self.assertTrue(self.askwikidata.load_cache())
+        with mock.patch.object(self.askwikidata, "file_entry") as file_entry:
+            self.assertFalse(self.askwikidata.refresh())
+        file_entry.assert_not_called()
+        self.assertEqual(self.askwikidata.corpus_version, version)
+
+    # Test if a touched but unchanged file keeps the corpus version and its
+    # new modification time is recorded.
+    def test_refresh_touched(self):
+        version = self.askwikidata.corpus_version
+        path = os.path.join(self.text_dir, "Q2.txt")
+        os.utime(path, ns=(0, 0))
+        self.assertTrue(self.askwikidata.load_cache())
+        self.assertFalse(self.askwikidata.refresh())
+        self.assertEqual(self.askwikidata.corpus_version, version)
+        self.assertTrue(self.askwikidata.load_cache())
+        self.assertEqual(self.askwikidata.manifest["Q2"]["mtime_ns"], 0)
+
+
+class TestCache(CorpusTestCase):
+    # Test if saved chunks and embeddings load unchanged, the embeddings as a
+    # memory map.
+    def test_load_cache(self):
+        askwikidata = self.make_askwikidata()
+        self.assertTrue(askwikidata.load_cache())
+        pd.testing.assert_frame_equal(askwikidata.df, self.askwikidata.df)
+        self.assertIsInstance(askwikidata.embeds, np.memmap)
+        self.assertEqual(askwikidata.embeds.dtype, askwikidata.embedding_dtype)
+        np.testing.assert_array_equal(askwikidata.embeds, self.askwikidata.embeds)
+        self.assertEqual(askwikidata.corpus_version, self.askwikidata.corpus_version)
+
+    # Test if workers that save different corpora at the same time leave the
+    # files of one save behind, not a mix of both.
+    def test_concurrent_cache_saves(self):
+        self.write("Q4", "Q4\n\nMadrid")
+        other = self.make_askwikidata()
+        other.read_data()
+        other.create_embeds()
+        to_parquet = pd.DataFrame.to_parquet
+        thread = threading.Thread(target=other.save_cache)
+
+        def save_during_other_save(df, path, **kwargs):
+            if thread.ident is None:
+                thread.start()
+                # Gives the other save the chance to run in between.
+                thread.join(timeout=0.5)
+            to_parquet(df, path, **kwargs)
+
+        with mock.patch.object(pd.DataFrame, "to_parquet", save_during_other_save):
+            self.askwikidata.save_cache()
+            thread.join()
+        self.assertEqual(
+            sorted(os.listdir(self.cache_dir)),
+            ["chunks.parquet", "embeddings.npy", "lock", "manifest.json"],
+        )
+        askwikidata = self.make_askwikidata()
+        self.assertTrue(askwikidata.load_cache())
+        pd.testing.assert_frame_equal(askwikidata.df, other.df)
+        np.testing.assert_array_equal(askwikidata.embeds, other.embeds)
+        self.assertEqual(askwikidata.cache_id, other.cache_id)
+
+    # Test if a manifest in another format counts as a missing cache.
+    def test_load_cache_unknown_manifest(self):
+        with open(self.askwikidata.manifest_file, "w") as file:
+            file.write('{"Q1": "0123", "Q2": "4567", "Q3": "89ab"}')
+        self.assertFalse(self.make_askwikidata().load_cache())
+
+    # Test if files with other rows than the manifest records count as a
+    # missing cache.
+    def test_load_cache_row_mismatch(self):
+        with open(self.askwikidata.embeds_file, "wb") as file:
+            np.save(file, self.askwikidata.embeds[:-1])
+        self.assertFalse(self.make_askwikidata().load_cache())
+
+    # Test if nothing is loaded without a saved cache.
+    def test_load_cache_missing(self):
+        askwikidata = AskWikidata(cache_dir=os.path.join(self.cache_dir, "missing"))
+        self.assertFalse(askwikidata.load_cache())
+
+
+class TestIndex(CorpusTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch(
+            "askwikidata.make_retriever",
+            lambda name, dims, trees: StubPersistentRetriever(dims, trees),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # Test if a second setup loads the saved index instead of building it.
+    def test_setup_loads_saved_index(self):
+        self.askwikidata.create_index()
+        self.assertTrue(self.askwikidata.index.built)
+        self.assertTrue(os.path.exists(self.askwikidata.index_file))
+
+        askwikidata = self.make_askwikidata()
+        with mock.patch.object(askwikidata, "load_models"):
+            askwikidata.setup()
+        self.assertTrue(askwikidata.index.loaded)
+        self.assertFalse(askwikidata.index.built)
+
+    # Test if a worker that saves the index while another one does writes its
+    # own temporary file, and both leave a complete index behind.
+    def test_concurrent_index_saves(self):
+        other = self.make_askwikidata()
+        self.assertTrue(other.load_cache())
+        save = StubPersistentRetriever.save
+        paths = []
+
+        def save_during_other_save(retriever, path):
+            save(retriever, path)
+            paths.append(path)
+            if len(paths) == 1:
+                other.create_index()
+
+        with mock.patch.object(StubPersistentRetriever, "save", save_during_other_save):
+            self.askwikidata.create_index()
+        self.assertEqual(len(set(paths)), 2)
+        self.assertEqual(
+            sorted(os.listdir(self.cache_dir)),
+            [
+                os.path.basename(self.askwikidata.index_file),
+                "chunks.parquet",
+                "embeddings.npy",
+                "lock",
+                "manifest.json",
+            ],
+        )
+        index = StubPersistentRetriever(8)
+        index.load(self.askwikidata.index_file)
+        np.testing.assert_array_equal(index.embeds, self.askwikidata.index.embeds)
+
+    # Test if an index on disk with other rows than the embeddings is not
+    # used, but built again.
+    def test_rebuilds_index_with_other_rows(self):
+        stale = StubPersistentRetriever(8)
+        stale.build(self.askwikidata.embeds[:-1])
+        stale.save(self.askwikidata.index_file)
+
+        self.askwikidata.create_index()
+        self.assertTrue(self.askwikidata.index.built)
+        self.assertEqual(len(self.askwikidata.index), len(self.askwikidata.embeds))
+        index = StubPersistentRetriever(8)
+        index.load(self.askwikidata.index_file)
+        self.assertEqual(len(index), len(self.askwikidata.embeds))
+
+    # Test if an index saved for another save of the cache is not loaded.
+    def test_ignores_index_of_other_cache(self):
+        self.askwikidata.create_index()
+        other = self.make_askwikidata()
+        other.read_data()
+        other.create_embeds()
+        other.save_cache()
+        # Saved after the other save_cache removed the stale indexes
+        self.askwikidata.create_index()
+        askwikidata = self.make_askwikidata()
+        self.assertTrue(askwikidata.load_cache())
+        self.assertNotEqual(askwikidata.index_file, self.askwikidata.index_file)
+        askwikidata.create_index()
+        self.assertTrue(askwikidata.index.built)
+
+    # Test if a refresh removes the index of the previous embeddings.
+    def test_refresh_removes_stale_index(self):
+        self.askwikidata.create_index()
+        self.write("Q4", "Q4\n\nMadrid")
+        self.assertTrue(self.askwikidata.refresh())
+        self.assertFalse(os.path.exists(self.askwikidata.index_file))
+
+        self.askwikidata.create_index()
+        self.assertTrue(self.askwikidata.index.built)
+        self.assertEqual(len(self.askwikidata.index.embeds), len(self.askwikidata.df))
+
+
+class TestEmbedQueries(unittest.TestCase):
+    def setUp(self):
+        self.askwikidata = AskWikidata()
+        self.askwikidata.embedding_model = benchmark.StubEmbeddings(dims=8)
+
+    # Test if queries are embedded normalized, and queries that differ only in
+    # case or whitespace share the cached embedding.
+    def test_embed_queries_uses_cache(self):
+        model = self.askwikidata.embedding_model
+        instruction = model.query_instruction
+        with mock.patch.object(
+            model, "embed_documents", wraps=model.embed_documents
+        ) as embed_documents:
+            self.askwikidata.embed_queries(["Mayor of Berlin"])
+            embeds = self.askwikidata.embed_queries(
+                ["mayor  of\nberlin ", "Capital of France"]
+            )
+        self.assertEqual(
+            [c.args[0] for c in embed_documents.call_args_list],
+            [[instruction + "mayor of berlin"], [instruction + "capital of france"]],
+        )
+        expected = model.embed_documents(
+            [instruction + "mayor of berlin", instruction + "capital of france"]
+        )
+        np.testing.assert_allclose(embeds, expected, rtol=1e-6)
+
+
+class StubLLM:
+    """A local LLM that answers with the question of the prompt."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def answer(self, prompt):
+        self.prompts.append(prompt)
+        question = prompt.rsplit("QUESTION: ", 1)[1].split("\n")[0]
+        return f"Answer to {question}"
+
+    def __call__(self, prompt, prefix=None):
+        return self.answer(prompt)
+
+    def generate_batch(self, prompts):
+        return [self.answer(prompt) for prompt in prompts]
+
+    def stream(self, prompt, prefix=None, lock=None):
+        for word in self.answer(prompt).split(" "):
+            yield " " + word
+
+
+class TestAsk(CorpusTestCase):
+    """Answers questions over the corpus with stub models."""
+
+    def setUp(self):
+        super().setUp()
+        self.askwikidata.retriever = "numpy"
+        self.askwikidata.qa_model_url = "Qwen/Qwen2.5-3B-Instruct"
+        self.llm = self.askwikidata.local_llm = StubLLM()
+        patcher = mock.patch.object(
+            self.askwikidata,
+            "rerank_scores",
+            lambda pairs: np.zeros(len(pairs), np.float32),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.askwikidata.create_index()
+
+    # Test if cached answers are served and only missing ones are generated,
+    # in one batch.
+    def test_ask_many_generates_missing_answers(self):
+        first = self.askwikidata.ask_many(["Mayor of Berlin?"])
+        self.llm.prompts.clear()
+        responses = self.askwikidata.ask_many(
+            ["Mayor of Berlin?", "Capital of France?", "Capital of Italy?"]
+        )
+        self.assertEqual(responses[0], first[0])
+        self.assertTrue(responses[0].startswith("Answer to Mayor of Berlin?\n"))
+        self.assertTrue(responses[1].startswith("Answer to Capital of France?\n"))
+        self.assertTrue(responses[2].startswith("Answer to Capital of Italy?\n"))
+        self.assertEqual(len(self.llm.prompts), 2)
+
+    # Test if a cached answer is returned without generating, until a refresh
+    # changes the corpus version.
+    def test_ask_uses_answer_cache(self):
+        first = self.askwikidata.ask("Mayor of Berlin?")
+        self.assertEqual(self.askwikidata.ask("mayor of  Berlin?"), first)
+        self.assertEqual(len(self.llm.prompts), 1)
+
+        key = self.askwikidata.answer_key("Mayor of Berlin?")
+        self.write("Q4", "Q4\n\nMadrid")
+        self.assertTrue(self.askwikidata.refresh())
+        self.askwikidata.create_index()
+        self.assertNotEqual(self.askwikidata.answer_key("Mayor of Berlin?"), key)
+        # The cache of another worker, e.g. on disk, still holds the answer.
+        self.askwikidata.answer_cache.put(key, first)
+        self.askwikidata.ask("Mayor of Berlin?")
+        self.assertEqual(len(self.llm.prompts), 2)
+
+
+    # Test if a failed stream is not cached, but a complete one is.
+    def test_ask_stream_caches_complete_answers_only(self):
+        def fail(prompt, prefix=None, lock=None):
+            yield " Answer"
+            raise Exception("generation failed")
+
+        key = self.askwikidata.answer_key("Mayor of Berlin?")
+        with mock.patch.object(self.llm, "stream", fail):
+            with self.assertRaisesRegex(Exception, "generation failed"):
+                list(self.askwikidata.ask_stream("Mayor of Berlin?"))
+        self.assertIsNone(self.askwikidata.answer_cache.get(key))
+
+        response = "".join(self.askwikidata.ask_stream("Mayor of Berlin?"))
+        self.assertTrue(response.startswith("Answer to Mayor of Berlin?\n"))
+        self.assertEqual(self.askwikidata.answer_cache.get(key), response)
+
+
+def chunks(texts):
+    return pd.DataFrame({"id": range(len(texts)), "text": texts})
+
+
+class TestRerank(unittest.TestCase):
+    def setUp(self):
+        self.askwikidata = AskWikidata(context_chunks=3)
+        self.queries = ["mayor of Berlin", "capital of France"]
+        self.texts = [
+            "Berlin head of government Kai Wegner",
+            "Paris",
+            "France capital Paris country in western Europe",
+            "Berlin",
+            "river Spree",
+        ]
+
+    # Test if micro-batches of any size score like an unbatched pass.
+    @unittest.skipIf(importlib.util.find_spec("torch") is None, "needs torch")
+    def test_rerank_scores_batched(self):
+        self.askwikidata.rerank_tokenizer = benchmark.StubRerankTokenizer()
+        self.askwikidata.rerank_model = benchmark.StubRerankModel()
+        pairs = [(q, t) for q in self.queries for t in self.texts]
+        self.askwikidata.rerank_batch_size = 1
+        expected = self.askwikidata.rerank_scores(pairs)
+        for batch_size in (2, 3, 7, 64):
+            self.askwikidata.rerank_batch_size = batch_size
+            np.testing.assert_array_equal(
+                self.askwikidata.rerank_scores(pairs), expected
+            )
+
+    # Test if scores of several queries land in their rows and cached pairs
+    # are not scored again.
+    def test_rerank_many_uses_cache(self):
+        def score(pairs):
+            scored.extend(pairs)
+            return np.array([len(q) * 100 + len(t) for q, t in pairs], np.float32)
+
+        scored = []
+        with mock.patch.object(self.askwikidata, "rerank_scores", score):
+            self.askwikidata.rerank_many(self.queries[:1], [chunks(self.texts[:3])])
+            self.assertEqual(len(scored), 3)
+            scored.clear()
+            reranked = self.askwikidata.rerank_many(
+                self.queries, [chunks(self.texts), chunks(self.texts)]
+            )
+
+        expected_pairs = [(self.queries[0], t) for t in self.texts[3:]]
+        expected_pairs += [(self.queries[1], t) for t in self.texts]
+        self.assertEqual(scored, expected_pairs)
+        for query, df in zip(self.queries, reranked):
+            self.assertEqual(len(df), 3)
+            self.assertEqual(list(df["rank"]), sorted(df["rank"], reverse=True))
+            for text, rank in zip(df["text"], df["rank"]):
+                self.assertEqual(rank, len(query) * 100 + len(text))
+
+    # Test if a query that differs only in case is scored as it is, not
+    # answered with the scores of the other casing, while one that differs
+    # only in whitespace shares the cached scores.
+    def test_rerank_many_cache_is_case_sensitive(self):
+        def score(pairs):
+            scored.extend(pairs)
+            return np.zeros(len(pairs), np.float32)
+
+        scored = []
+        with mock.patch.object(self.askwikidata, "rerank_scores", score):
+            self.askwikidata.rerank_many([" Mayor\nof Berlin"], [chunks(self.texts)])
+            self.assertEqual(scored, [("Mayor of Berlin", t) for t in self.texts])
+            scored.clear()
+            self.askwikidata.rerank_many(["Mayor  of Berlin "], [chunks(self.texts)])
+            self.assertEqual(scored, [])
+            self.askwikidata.rerank_many(["mayor of berlin"], [chunks(self.texts)])
+        self.assertEqual(scored, [("mayor of berlin", t) for t in self.texts])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+import numpy as np
+
+import benchmark
+
+
+def result(medians):
+    return {
+        "runs": [
+            {
+                "items": items,
+                "stages": {stage: {"median": m} for stage, m in stages.items()},
+            }
+            for items, stages in medians.items()
+        ]
+    }
+
+
+class TestBenchmark(unittest.TestCase):
+    # Test if the stub embedder returns the same unit vector for the same text.
+    def test_stub_embeddings_deterministic(self):
+        embeddings = benchmark.StubEmbeddings(dims=8)
+        first, second, other = embeddings.embed_documents(["Berlin", "Berlin", "Paris"])
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertAlmostEqual(float(np.linalg.norm(first)), 1.0)
+
+    # Test if only slowdowns beyond the threshold are flagged.
+    def test_compare_flags_slowdowns(self):
+        baseline = result({100: {"retrieve": 0.010, "rerank": 0.020}})
+        current = result({100: {"retrieve": 0.011, "rerank": 0.030}})
+        rows = benchmark.compare(baseline, current, threshold=0.2)
+        flagged = {stage: slower for _, stage, _, _, _, slower in rows}
+        self.assertEqual(flagged, {"retrieve": False, "rerank": True})
+
+    # Test if corpus sizes and stages missing from the baseline are skipped.
+    def test_compare_skips_unmatched(self):
+        baseline = result({100: {"retrieve": 0.010}})
+        current = result({100: {"retrieve": 0.010, "context": 0.001}, 1000: {}})
+        rows = benchmark.compare(baseline, current)
+        self.assertEqual([(r[0], r[1]) for r in rows], [(100, "retrieve")])
+
+
+if __name__ == "__main__":
+    unittest.main()
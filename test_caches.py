@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import caches
+
+
+class TestNormalizeQuery(unittest.TestCase):
+    # Test if casing and whitespace differences are normalized away.
+    def test_casing_and_whitespace(self):
+        self.assertEqual(
+            caches.normalize_query("  Mayor   of\nBerlin "), "mayor of berlin"
+        )
+
+    # Test if whitespace is collapsed, but the case is kept.
+    def test_collapse_whitespace(self):
+        self.assertEqual(
+            caches.collapse_whitespace("  Mayor   of\nBerlin "), "Mayor of Berlin"
+        )
+
+
+class TestLRUCache(unittest.TestCase):
+    # Test if a stored value is returned and counted as a hit.
+    def test_get_hit(self):
+        cache = caches.LRUCache()
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    # Test if a missing key returns the default and is counted as a miss.
+    def test_get_miss(self):
+        cache = caches.LRUCache()
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    # Test if the least recently used entry is evicted when the cache is full.
+    def test_evicts_least_recently_used(self):
+        cache = caches.LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+    # Test if the hit rate is computed from hits and misses.
+    def test_hit_rate(self):
+        cache = caches.LRUCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+        self.assertEqual(cache.stats()["hit_rate"], 0.5)
+
+    # Test if entries are dropped once their time to live has passed.
+    @mock.patch("caches.time.time")
+    def test_expires_after_ttl(self, mock_time):
+        mock_time.return_value = 1000.0
+        cache = caches.LRUCache(ttl=60)
+        cache.put("a", 1)
+        mock_time.return_value = 1059.0
+        self.assertEqual(cache.get("a"), 1)
+        mock_time.return_value = 1061.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "cache.sqlite")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    # Test if entries survive reopening the cache file.
+    def test_persists_across_instances(self):
+        caches.DiskCache(self.path).put(("model", "query"), [1.0, 2.0])
+        cache = caches.DiskCache(self.path)
+        self.assertEqual(cache.get(("model", "query")), [1.0, 2.0])
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    # Test if the least recently used entry is evicted when the cache is full.
+    def test_evicts_least_recently_used(self):
+        cache = caches.DiskCache(self.path, maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+    # Test if entries are dropped once their time to live has passed.
+    @mock.patch("caches.time.time")
+    def test_expires_after_ttl(self, mock_time):
+        mock_time.return_value = 1000.0
+        cache = caches.DiskCache(self.path, ttl=60)
+        cache.put("a", 1)
+        mock_time.return_value = 1059.0
+        self.assertEqual(cache.get("a"), 1)
+        mock_time.return_value = 1061.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
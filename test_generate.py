@@ -0,0 +1,260 @@
+import queue
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    import torch
+    import transformers
+
+    import generate
+except ImportError:
+    generate = None
+
+
+class StubSentencePieceTokenizer:
+    """
+    Splits text into words like SentencePiece: spaces become "▁", a "▁" is
+    prepended to the text and every piece starts at a "▁".
+    """
+
+    pad_token_id = 1000
+
+    def __init__(self):
+        self.vocab = {}
+        self.padding_side = "right"
+
+    def encode(self, text):
+        text = text.replace(" ", "▁")
+        if not text.startswith("▁"):
+            text = "▁" + text
+        pieces = ["▁" + piece for piece in text.split("▁")[1:]]
+        return [self.vocab.setdefault(piece, len(self.vocab)) for piece in pieces]
+
+    def __call__(
+        self, text, return_tensors="pt", add_special_tokens=False, padding=False
+    ):
+        rows = [self.encode(t) for t in ([text] if isinstance(text, str) else text)]
+        width = max(len(ids) for ids in rows)
+        input_ids = []
+        attention_mask = []
+        for ids in rows:
+            pad = width - len(ids)
+            if self.padding_side == "left":
+                input_ids.append([self.pad_token_id] * pad + ids)
+                attention_mask.append([0] * pad + [1] * len(ids))
+            else:
+                input_ids.append(ids + [self.pad_token_id] * pad)
+                attention_mask.append([1] * len(ids) + [0] * pad)
+        return transformers.BatchEncoding(
+            {
+                "input_ids": torch.tensor(input_ids),
+                "attention_mask": torch.tensor(attention_mask),
+            }
+        )
+
+    def decode(self, ids, skip_special_tokens=False, **kwargs):
+        pieces = {i: piece for piece, i in self.vocab.items()}
+        pieces[self.pad_token_id] = "" if skip_special_tokens else "<pad>"
+        return "".join(pieces[int(i)] for i in ids).replace("▁", " ")
+
+    def batch_decode(self, rows, skip_special_tokens=False):
+        return [self.decode(ids, skip_special_tokens) for ids in rows]
+
+
+class StubModel:
+    def __init__(self, error=None, delay=0):
+        self.error = error
+        self.delay = delay
+        self.steps = 0
+        self.finished = False
+
+    def __call__(self, input_ids, past_key_values=None, use_cache=True):
+        return SimpleNamespace(past_key_values=input_ids.tolist())
+
+    def generate(self, input_ids, streamer, stopping_criteria, **kwargs):
+        """Repeat the last prompt token until stopped, like a tiny LLM."""
+        if self.error is not None:
+            raise self.error
+        streamer.put(input_ids)
+        for _ in range(1000):
+            time.sleep(self.delay)
+            self.steps += 1
+            input_ids = torch.cat([input_ids, input_ids[:, -1:]], dim=1)
+            streamer.put(input_ids[:, -1:])
+            if stopping_criteria(input_ids, None).all():
+                break
+        streamer.end()
+        self.finished = True
+
+
+class StubBatchModel:
+    """Answers every prompt of a batch by repeating its last token twice."""
+
+    def generate(self, input_ids, attention_mask, max_new_tokens, **kwargs):
+        self.attention_mask = attention_mask
+        last = input_ids[:, -1:]
+        return torch.cat([input_ids, last, last], dim=1)
+
+
+@unittest.skipIf(generate is None, "needs torch and transformers")
+class TestLoadCpuModel(unittest.TestCase):
+    def setUp(self):
+        self.llm = generate.LLM.__new__(generate.LLM)
+        self.llm.model_name = "Qwen/Qwen2.5-3B-Instruct"
+        for target in (
+            "generate.AutoModelForCausalLM",
+            "generate.torch.set_num_threads",
+            "generate.torch.ao.quantization.quantize_dynamic",
+        ):
+            patcher = mock.patch(target)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def assert_loaded_with(self, dtype):
+        from_pretrained = generate.AutoModelForCausalLM.from_pretrained
+        from_pretrained.assert_called_once()
+        self.assertEqual(from_pretrained.call_args.kwargs["torch_dtype"], dtype)
+
+    # Test if float32 and bfloat16 models are loaded in their dtype and not
+    # quantized, and the number of threads is left alone by default.
+    def test_float_dtypes(self):
+        for cpu_dtype, dtype in (
+            ("float32", torch.float32),
+            ("bfloat16", torch.bfloat16),
+        ):
+            generate.AutoModelForCausalLM.reset_mock()
+            self.llm.load_cpu_model(cpu_dtype, None)
+            self.assert_loaded_with(dtype)
+        generate.torch.ao.quantization.quantize_dynamic.assert_not_called()
+        generate.torch.set_num_threads.assert_not_called()
+
+    # Test if int8 models are loaded in float32, quantized and run on the
+    # given number of threads.
+    def test_int8(self):
+        model = self.llm.load_cpu_model("int8", 4)
+        self.assert_loaded_with(torch.float32)
+        quantize_dynamic = generate.torch.ao.quantization.quantize_dynamic
+        quantize_dynamic.assert_called_once()
+        self.assertEqual(quantize_dynamic.call_args.kwargs["dtype"], torch.qint8)
+        self.assertIs(model, quantize_dynamic.return_value)
+        generate.torch.set_num_threads.assert_called_once_with(4)
+
+    # Test if an unknown dtype is rejected.
+    def test_unknown_dtype(self):
+        with self.assertRaisesRegex(Exception, "unknown cpu_dtype"):
+            self.llm.load_cpu_model("float16", None)
+
+
+@unittest.skipIf(generate is None, "needs torch and transformers")
+class TestModelInput(unittest.TestCase):
+    def setUp(self):
+        self.llm = generate.LLM.__new__(generate.LLM)
+        self.llm.device = "cpu"
+        self.llm.tokenizer = StubSentencePieceTokenizer()
+        self.llm.model = StubModel()
+        self.llm.prefix_caches = {}
+        self.llm.max_prefix_caches = 4
+
+    # Test if the cached prefix is used and the input ids are unchanged.
+    def test_uses_prefix_cache(self):
+        prefix = "Answer briefly."
+        prompt = prefix + " Who is the mayor of Berlin?"
+        cached = self.llm.model_input(prompt, prefix)
+        uncached = self.llm.model_input(prompt)
+        self.assertTrue(torch.equal(cached["input_ids"], uncached["input_ids"]))
+        self.assertEqual(cached["past_key_values"], [[0, 1]])
+
+    # Test if a prefix that is tokenized differently within the prompt is
+    # not used, and the prompt is tokenized as a whole.
+    def test_skips_prefix_cache_on_token_mismatch(self):
+        prefix = "Answer briefly"
+        prompt = prefix + ". Who is the mayor of Berlin?"
+        cached = self.llm.model_input(prompt, prefix)
+        uncached = self.llm.model_input(prompt)
+        self.assertTrue(torch.equal(cached["input_ids"], uncached["input_ids"]))
+        self.assertNotIn("past_key_values", cached)
+
+
+@unittest.skipIf(generate is None, "needs torch and transformers")
+class TestGenerateBatch(unittest.TestCase):
+    # Test if prompts of different lengths are padded on the left, the padding
+    # is masked and each answer is cut from its own prompt.
+    def test_generate_batch(self):
+        llm = generate.LLM.__new__(generate.LLM)
+        llm.device = "cpu"
+        llm.tokenizer = StubSentencePieceTokenizer()
+        llm.tokenizer.padding_side = "left"
+        llm.model = StubBatchModel()
+        answers = llm.generate_batch(
+            ["Mayor of Berlin?", "Capital of France?", "Rome?"]
+        )
+        self.assertEqual(
+            answers, ["Berlin? Berlin?", "France? France?", "Rome? Rome?"]
+        )
+        self.assertEqual(
+            llm.model.attention_mask.tolist(), [[1, 1, 1], [1, 1, 1], [0, 0, 1]]
+        )
+
+
+@unittest.skipIf(generate is None, "needs torch and transformers")
+class TestStream(unittest.TestCase):
+    def llm(self, model):
+        llm = generate.LLM.__new__(generate.LLM)
+        llm.device = "cpu"
+        llm.tokenizer = StubSentencePieceTokenizer()
+        llm.tokenizer.eos_token_id = 0
+        llm.model = model
+        llm.prefix_caches = {}
+        llm.max_prefix_caches = 4
+        return llm
+
+    # Test if an error during generation is raised to the consumer.
+    def test_raises_generation_error(self):
+        llm = self.llm(StubModel(error=RuntimeError("out of memory")))
+        with self.assertRaisesRegex(RuntimeError, "out of memory"):
+            list(llm.stream("Mayor of Berlin?", timeout=5))
+
+    # Test if generation is stopped before the stream is closed early.
+    def test_stops_generation_when_closed(self):
+        model = StubModel()
+        stream = self.llm(model).stream("Mayor of Berlin?", timeout=5)
+        next(stream)
+        stream.close()
+        self.assertTrue(model.finished)
+        self.assertLess(model.steps, 1000)
+
+    # Test if the lock is held while the model generates and released once
+    # it finishes, even though the stream was neither consumed nor closed.
+    def test_releases_lock_when_generation_finishes(self):
+        lock = threading.Lock()
+        model = StubModel(delay=0.001)
+        stream = self.llm(model).stream("Mayor of Berlin?", timeout=5, lock=lock)
+        next(stream)
+        self.assertTrue(lock.locked())
+        self.assertTrue(lock.acquire(timeout=10))
+        self.assertTrue(model.finished)
+        lock.release()
+        stream.close()
+
+    # Test if the lock is released when generation fails.
+    def test_releases_lock_on_generation_error(self):
+        lock = threading.Lock()
+        llm = self.llm(StubModel(error=RuntimeError("out of memory")))
+        with self.assertRaises(RuntimeError):
+            list(llm.stream("Mayor of Berlin?", timeout=5, lock=lock))
+        self.assertFalse(lock.locked())
+
+    # Test if a stalled generation raises instead of blocking forever.
+    def test_times_out(self):
+        model = StubModel(delay=0.5)
+        stream = self.llm(model).stream("Mayor of Berlin?", timeout=0.1)
+        with self.assertRaises(queue.Empty):
+            list(stream)
+        self.assertTrue(model.finished)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import asyncio
+import json
+from unittest import mock
+
+import requests
+
+import hf_client
+from stand_in_server import StandInHandler, StandInServerTestCase
+
+
+class InferenceHandler(StandInHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        status = self.next_status()
+        if status == 429:
+            response = {"error": "Rate limit reached"}
+            return self.send_json(status, response, [("Retry-After", "0.25")])
+        if status != 200:
+            response = {"error": "Model is currently loading", "estimated_time": 0}
+            return self.send_json(status, response)
+        if body.get("stream"):
+            if body["inputs"] == "fail":
+                error = {"error": "overloaded", "error_type": "overloaded"}
+                return self.stream_events([error])
+            if body["inputs"] == "empty":
+                return self.stream_events([])
+            return self.stream(["Kai", " Wegner", "</s>"])
+        prompt = body["inputs"]
+        self.send_json(status, [{"generated_text": prompt + " Kai Wegner"}])
+
+    def stream(self, tokens):
+        self.stream_events(
+            {"token": {"id": i, "text": text, "special": text == "</s>"}}
+            for i, text in enumerate(tokens)
+        )
+
+    def stream_events(self, events):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for event in events:
+            self.wfile.write(f"data:{json.dumps(event)}\n\n".encode())
+            self.wfile.flush()
+
+
+class InferenceServerTestCase(StandInServerTestCase):
+    handler = InferenceHandler
+    path = "/models/test"
+
+
+class TestInferenceClient(InferenceServerTestCase):
+    # Test if the prompt is removed from the generated text.
+    def test_generate_strips_prompt(self):
+        client = hf_client.InferenceClient(self.url, api_key="test")
+        self.assertEqual(client.generate("Mayor of Berlin?"), "Kai Wegner")
+
+    # Test if a 503 "model loading" response is retried until it succeeds.
+    def test_generate_retries_model_loading(self):
+        InferenceHandler.failures = [503, 503]
+        client = hf_client.InferenceClient(self.url, api_key="test", backoff=0)
+        self.assertEqual(client.generate("Mayor of Berlin?"), "Kai Wegner")
+        self.assertEqual(InferenceHandler.requests, 3)
+
+    # Test if the error is raised once all retries are used up.
+    def test_generate_gives_up_after_max_retries(self):
+        InferenceHandler.failures = [500, 500, 500]
+        client = hf_client.InferenceClient(
+            self.url, api_key="test", max_retries=2, backoff=0
+        )
+        with self.assertRaises(requests.exceptions.HTTPError):
+            client.generate("Mayor of Berlin?")
+        self.assertEqual(InferenceHandler.requests, 3)
+
+    # Test if client errors are not retried.
+    def test_generate_does_not_retry_client_errors(self):
+        InferenceHandler.failures = [400]
+        client = hf_client.InferenceClient(self.url, api_key="test", backoff=0)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            client.generate("Mayor of Berlin?")
+        self.assertEqual(InferenceHandler.requests, 1)
+
+    # Test if streamed tokens are yielded in order without special tokens.
+    def test_generate_stream(self):
+        InferenceHandler.failures = [503]
+        client = hf_client.InferenceClient(self.url, api_key="test", backoff=0)
+        tokens = list(client.generate_stream("Mayor of Berlin?"))
+        self.assertEqual(tokens, ["Kai", " Wegner"])
+
+    # Test if the Retry-After header of a 429 response is honored.
+    def test_generate_honors_retry_after(self):
+        InferenceHandler.failures = [429]
+        client = hf_client.InferenceClient(
+            self.url, api_key="test", backoff=100, max_backoff=100
+        )
+        with mock.patch("retrying_client.time.sleep") as sleep:
+            self.assertEqual(client.generate("Mayor of Berlin?"), "Kai Wegner")
+        sleep.assert_called_once_with(0.25)
+
+    # Test if retried streamed responses are closed, so they do not hold on
+    # to pooled connections.
+    def test_generate_stream_closes_retried_responses(self):
+        InferenceHandler.failures = [503, 429]
+        client = hf_client.InferenceClient(self.url, api_key="test", backoff=0)
+        close = requests.Response.close
+        with mock.patch.object(
+            requests.Response, "close", autospec=True, side_effect=close
+        ) as closed, mock.patch("retrying_client.time.sleep"):
+            tokens = list(client.generate_stream("Mayor of Berlin?"))
+        self.assertEqual(tokens, ["Kai", " Wegner"])
+        statuses = [c.args[0].status_code for c in closed.call_args_list]
+        self.assertEqual(statuses[:2], [503, 429])
+        self.assertIn(200, statuses)
+
+    # Test if an error event of the stream raises instead of ending the answer.
+    def test_generate_stream_raises_error_event(self):
+        client = hf_client.InferenceClient(self.url, api_key="test")
+        with self.assertRaisesRegex(Exception, "overloaded"):
+            list(client.generate_stream("fail"))
+
+    # Test if a stream that ends without any token raises.
+    def test_generate_stream_raises_without_tokens(self):
+        client = hf_client.InferenceClient(self.url, api_key="test")
+        with self.assertRaisesRegex(Exception, "without tokens"):
+            list(client.generate_stream("empty"))
+
+    # Test if a missing API key raises an exception.
+    def test_generate_without_api_key(self):
+        client = hf_client.InferenceClient(self.url)
+        client.api_key = None
+        with self.assertRaises(Exception):
+            client.generate("Mayor of Berlin?")
+
+
+class TestAsyncInferenceClient(InferenceServerTestCase):
+    # Test if concurrent generations complete and retries are honored.
+    def test_generate_concurrently(self):
+        InferenceHandler.failures = [503]
+
+        async def run():
+            client = hf_client.AsyncInferenceClient(self.url, api_key="test", backoff=0)
+            try:
+                return await asyncio.gather(
+                    *(client.generate(f"Question {i}?") for i in range(4))
+                )
+            finally:
+                await client.close()
+
+        self.assertEqual(asyncio.run(run()), ["Kai Wegner"] * 4)
+        self.assertEqual(InferenceHandler.requests, 5)
+
+    # Test if the client can be used from one event loop after another, once
+    # it was closed on the first one.
+    def test_generate_on_new_event_loop(self):
+        client = hf_client.AsyncInferenceClient(self.url, api_key="test")
+
+        async def run():
+            try:
+                return await client.generate("Question?")
+            finally:
+                await client.close()
+
+        self.assertEqual(asyncio.run(run()), "Kai Wegner")
+        self.assertEqual(asyncio.run(run()), "Kai Wegner")
+        self.assertIsNone(client.async_session)
+
+    # Test if using or closing the client from another event loop than the one
+    # using it raises, instead of leaking its connections.
+    def test_rejects_other_event_loop(self):
+        client = hf_client.AsyncInferenceClient(self.url, api_key="test")
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        self.assertEqual(
+            loop.run_until_complete(client.generate("Question?")), "Kai Wegner"
+        )
+        with self.assertRaisesRegex(Exception, "another event loop"):
+            asyncio.run(client.generate("Question?"))
+        with self.assertRaisesRegex(Exception, "event loop that used"):
+            asyncio.run(client.close())
+        loop.run_until_complete(client.close())
+        self.assertIsNone(client.async_session)
@@ -0,0 +1,111 @@
+import json
+import unittest
+from unittest import mock
+
+import caches
+import metrics
+from askwikidata import AskWikidata
+
+
+class Timed:
+    def __init__(self):
+        self.metrics = metrics.Metrics()
+
+    @metrics.timed("stage_seconds", stage="rerank")
+    def rerank(self):
+        return "reranked"
+
+
+class TestMetrics(unittest.TestCase):
+    # Test if observations land in the matching cumulative buckets.
+    def test_histogram_buckets(self):
+        histogram = metrics.Histogram(buckets=(0.1, 1))
+        for value in (0.05, 0.5, 5):
+            histogram.observe(value)
+        self.assertEqual(histogram.cumulative(), [(0.1, 1), (1, 2), ("+Inf", 3)])
+        self.assertEqual(histogram.count, 3)
+
+    # Test if a timer records the elapsed time under its labels.
+    def test_timer(self):
+        m = metrics.Metrics()
+        with mock.patch("time.perf_counter", side_effect=[1.0, 1.25]):
+            with m.timer("stage_seconds", stage="rerank"):
+                pass
+        histogram = m.histograms[("stage_seconds", (("stage", "rerank"),))]
+        self.assertEqual(histogram.sum, 0.25)
+
+    # Test if a timed method is recorded and still returns its result.
+    def test_timed(self):
+        obj = Timed()
+        self.assertEqual(obj.rerank(), "reranked")
+        self.assertEqual(
+            obj.metrics.histograms[("stage_seconds", (("stage", "rerank"),))].count, 1
+        )
+
+    # Test if histograms, counters and cache hits are exported as Prometheus text.
+    def test_to_prometheus(self):
+        m = metrics.Metrics()
+        cache = caches.LRUCache()
+        cache.put("q", 1)
+        cache.get("q")
+        cache.get("other")
+        m.register_cache("answer", cache)
+        m.observe("stage_seconds", 0.003, stage="context")
+        m.inc("requests", 2)
+
+        text = m.to_prometheus()
+        self.assertIn("# TYPE askwikidata_stage_seconds histogram", text)
+        self.assertIn(
+            'askwikidata_stage_seconds_bucket{stage="context",le="0.005"} 1', text
+        )
+        self.assertIn('askwikidata_stage_seconds_count{stage="context"} 1', text)
+        self.assertIn("askwikidata_requests_total 2", text)
+        self.assertIn('askwikidata_cache_hits_total{cache="answer"} 1', text)
+        self.assertIn('askwikidata_cache_misses_total{cache="answer"} 1', text)
+
+    # Test if the JSON export lists histograms and counters with their labels.
+    def test_to_json(self):
+        m = metrics.Metrics()
+        m.observe("stage_seconds", 0.5, stage="rerank")
+        m.inc("requests")
+
+        data = json.loads(m.to_json())
+        self.assertEqual(data["histograms"][0]["labels"], {"stage": "rerank"})
+        self.assertEqual(data["histograms"][0]["count"], 1)
+        self.assertEqual(
+            data["counters"], [{"name": "requests", "labels": {}, "value": 1}]
+        )
+
+
+class TestAskStreamMetrics(unittest.TestCase):
+    # Test if time to first token is recorded once, from the start of the question.
+    def test_time_to_first_token(self):
+        askwikidata = AskWikidata()
+        askwikidata.retrieve = mock.Mock(return_value="retrieved")
+        askwikidata.rerank = mock.Mock(return_value=("reranked", 0.0))
+        askwikidata.llm_generate_stream = mock.Mock(
+            return_value=iter(["", " ", "Kai", " Wegner"])
+        )
+        askwikidata.with_sources = lambda answer, df: answer + " (sources)"
+
+        clock = iter([1.0, 3.0])
+        with mock.patch("time.perf_counter", side_effect=lambda: next(clock)):
+            pieces = list(askwikidata.ask_stream("Mayor of Berlin"))
+
+        self.assertEqual(pieces, ["Kai", " Wegner", " (sources)"])
+        histogram = askwikidata.metrics.histograms[("time_to_first_token_seconds", ())]
+        self.assertEqual(histogram.count, 1)
+        self.assertEqual(histogram.sum, 2.0)
+
+    # Test if batch generation is timed apart from single generations.
+    def test_generate_many_stage(self):
+        askwikidata = AskWikidata(qa_model_url="https://stub")
+        askwikidata.local_llm = mock.Mock()
+        askwikidata.local_llm.generate_batch = lambda prompts: ["answer"] * len(prompts)
+        self.assertEqual(askwikidata.generate_many(["a", "b"]), ["answer", "answer"])
+        stages = [dict(labels)["stage"] for _, labels in askwikidata.metrics.histograms]
+        self.assertEqual(stages, ["generation_batch"])
+
+
+if __name__ == "__main__":
+    unittest.main()
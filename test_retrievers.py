@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import retrievers
+
+
+def unit_vectors(rows, dims, seed):
+    vectors = np.random.default_rng(seed).standard_normal((rows, dims))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+class TestNumpyRetriever(unittest.TestCase):
+    def setUp(self):
+        self.embeds = unit_vectors(200, 16, seed=0)
+        self.queries = unit_vectors(10, 16, seed=1)
+        self.retriever = retrievers.NumpyRetriever(16)
+        self.retriever.build(self.embeds)
+
+    # Test if the nearest neighbors and distances match a brute force search.
+    def test_search_matches_brute_force(self):
+        for query in self.queries:
+            ids, distances = self.retriever.search(query, 5)
+            scores = self.embeds @ query
+            expected = np.argsort(-scores)[:5]
+            np.testing.assert_array_equal(ids, expected)
+            np.testing.assert_allclose(
+                distances, np.sqrt(2 - 2 * scores[expected]), atol=1e-5
+            )
+
+    # Test if searching many vectors at once equals searching each one.
+    def test_search_many_matches_search(self):
+        ids, distances = self.retriever.search_many(self.queries, 5)
+        for query, row_ids, row_distances in zip(self.queries, ids, distances):
+            expected_ids, expected_distances = self.retriever.search(query, 5)
+            np.testing.assert_array_equal(row_ids, expected_ids)
+            np.testing.assert_allclose(row_distances, expected_distances, atol=1e-5)
+
+    # Test if embeddings that are not normalized are normalized before search.
+    def test_build_normalizes(self):
+        retriever = retrievers.NumpyRetriever(16)
+        retriever.build(self.embeds * 3)
+        np.testing.assert_allclose(np.linalg.norm(retriever.embeds, axis=1), 1, 1e-5)
+        ids, _ = retriever.search(self.queries[0], 5)
+        np.testing.assert_array_equal(ids, self.retriever.search(self.queries[0], 5)[0])
+
+    # Test if normalized float32 embeddings on disk are searched without a copy.
+    def test_build_uses_mmap(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "embeddings.npy")
+            np.save(path, self.embeds)
+            embeds = np.load(path, mmap_mode="r")
+            retriever = retrievers.NumpyRetriever(16)
+            retriever.build(embeds)
+            self.assertTrue(np.shares_memory(retriever.embeds, embeds))
+            del embeds, retriever
+
+
+class TestCompareRetrievers(unittest.TestCase):
+    # Test if exact search is reported with full recall.
+    def test_numpy_recall(self):
+        results = retrievers.compare_retrievers(
+            unit_vectors(100, 8, seed=0),
+            unit_vectors(5, 8, seed=1),
+            k=4,
+            annoy_trees=(),
+        )
+        self.assertEqual([r["retriever"] for r in results], ["numpy"])
+        self.assertEqual(results[0]["recall"], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import unittest
+
+from aiohttp.test_utils import TestClient, TestServer
+
+import caches
+import metrics
+import server
+
+
+class FakeAskWikidata:
+    def __init__(self, hf_api=True):
+        self.hf_api = hf_api
+        self.answer_cache = caches.LRUCache()
+        self.metrics = metrics.Metrics()
+        self.batches = []
+        self.generated = []
+        self.generation_threads = set()
+        self.release = asyncio.Event()
+
+    def uses_hf_api(self):
+        return self.hf_api
+
+    def answer_key(self, query):
+        return caches.normalize_query(query)
+
+    def prepare_many(self, queries):
+        self.batches.append(list(queries))
+        return [f"source of {q}" for q in queries], [f"prompt {q}" for q in queries]
+
+    async def generate_async(self, prompt):
+        await self.release.wait()
+        return prompt.replace("prompt", "answer to")
+
+    def generate_many(self, prompts):
+        self.generated.append(list(prompts))
+        self.generation_threads.add(threading.get_ident())
+        return [p.replace("prompt", "answer to") for p in prompts]
+
+    async def close_async(self):
+        pass
+
+    def with_sources(self, answer, df):
+        return f"{answer} ({df})"
+
+
+class TestBatchScheduler(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.askwikidata = FakeAskWikidata()
+
+    def start(self, **kwargs):
+        scheduler = server.BatchScheduler(self.askwikidata, **kwargs)
+        task = asyncio.create_task(scheduler.run())
+        self.addCleanup(task.cancel)
+        return scheduler
+
+    # Test if concurrent questions are prepared in one shared batch.
+    async def test_coalesces_concurrent_questions(self):
+        scheduler = self.start(max_batch_size=8, max_wait_ms=50)
+        self.askwikidata.release.set()
+        responses = await asyncio.gather(*(scheduler.ask(f"q{i}") for i in range(3)))
+        self.assertEqual(
+            responses, [f"answer to q{i} (source of q{i})" for i in range(3)]
+        )
+        self.assertEqual(self.askwikidata.batches, [["q0", "q1", "q2"]])
+
+    # Test if batches are closed once max_batch_size questions arrived.
+    async def test_respects_max_batch_size(self):
+        scheduler = self.start(max_batch_size=2, max_wait_ms=50)
+        self.askwikidata.release.set()
+        await asyncio.gather(*(scheduler.ask(f"q{i}") for i in range(3)))
+        self.assertEqual(self.askwikidata.batches, [["q0", "q1"], ["q2"]])
+
+    # Test if answers are cached and served without another batch.
+    async def test_serves_cached_answers(self):
+        scheduler = self.start()
+        self.askwikidata.release.set()
+        first = await scheduler.ask("Mayor of Berlin")
+        second = await scheduler.ask("mayor  of berlin")
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.askwikidata.batches), 1)
+
+    # Test if questions are rejected once the queue is full.
+    async def test_rejects_when_queue_is_full(self):
+        scheduler = self.start(max_batch_size=1, max_queue=1, max_generations=1)
+        # q0 is generating, q1 waits for a generation slot, q2 is queued.
+        pending = []
+        for i in range(3):
+            pending.append(asyncio.create_task(scheduler.ask(f"q{i}")))
+            await asyncio.sleep(0.05)
+        with self.assertRaises(server.QueueFull):
+            await scheduler.ask("q3")
+        self.askwikidata.release.set()
+        await asyncio.gather(*pending)
+
+    # Test if a local LLM generates each batch with one call in one thread.
+    async def test_generates_local_batches_at_once(self):
+        self.askwikidata = FakeAskWikidata(hf_api=False)
+        scheduler = self.start(max_batch_size=2, max_wait_ms=50)
+        self.addCleanup(scheduler.close)
+        responses = await asyncio.gather(*(scheduler.ask(f"q{i}") for i in range(3)))
+        self.assertEqual(
+            responses, [f"answer to q{i} (source of q{i})" for i in range(3)]
+        )
+        self.assertEqual(
+            self.askwikidata.generated, [["prompt q0", "prompt q1"], ["prompt q2"]]
+        )
+        self.assertEqual(len(self.askwikidata.generation_threads), 1)
+
+
+class TestHandleAsk(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.askwikidata = FakeAskWikidata()
+        self.askwikidata.release.set()
+        self.client = TestClient(TestServer(server.create_app(self.askwikidata)))
+        await self.client.start_server()
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    # Test if a question is answered.
+    async def test_answers(self):
+        response = await self.client.post("/ask", json={"query": "q0"})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(
+            await response.json(), {"answer": "answer to q0 (source of q0)"}
+        )
+
+    # Test if a body that is not JSON is rejected as a bad request.
+    async def test_rejects_invalid_json(self):
+        response = await self.client.post("/ask", data="not json")
+        self.assertEqual(response.status, 400)
+
+    # Test if a body that is not UTF-8 is rejected as a bad request.
+    async def test_rejects_invalid_utf8(self):
+        response = await self.client.post("/ask", data=b'{"query": "\xff"}')
+        self.assertEqual(response.status, 400)
+
+    # Test if queries that are not text are rejected as bad requests.
+    async def test_rejects_query_that_is_not_text(self):
+        for query in (123, ["q0"], "  "):
+            response = await self.client.post("/ask", json={"query": query})
+            self.assertEqual(response.status, 400)
+
+    # Test if a body without a query is rejected as a bad request.
+    async def test_rejects_missing_query(self):
+        response = await self.client.post("/ask", json={"question": "q0"})
+        self.assertEqual(response.status, 400)
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+import zlib
+
+import stores
+
+
+class TestLabelStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "labels.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    # Test if the store behaves like a dict.
+    def test_mapping(self):
+        labels = stores.LabelStore(self.path)
+        labels["Q64"] = "Berlin"
+        labels.update({"Q90": "Paris", "P6": "head of government"})
+        self.assertIn("Q64", labels)
+        self.assertNotIn("Q84", labels)
+        self.assertEqual(labels["Q90"], "Paris")
+        self.assertEqual(labels.get("Q84", "Q84"), "Q84")
+        self.assertEqual(len(labels), 3)
+        del labels["Q90"]
+        self.assertEqual(sorted(labels), ["P6", "Q64"])
+        with self.assertRaises(KeyError):
+            labels["Q90"]
+
+    # Test if labels persist across instances.
+    def test_persistence(self):
+        stores.LabelStore(self.path).update({"Q64": "Berlin"})
+        self.assertEqual(dict(stores.LabelStore(self.path)), {"Q64": "Berlin"})
+
+    # Test if concurrent writers through separate connections lose no labels.
+    def test_concurrent_writers(self):
+        def write(n):
+            labels = stores.LabelStore(self.path)
+            for i in range(50):
+                labels[f"Q{n}-{i}"] = f"label {n} {i}"
+
+        stores.LabelStore(self.path)
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(stores.LabelStore(self.path)), 200)
+
+
+class TestItemStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "items.sqlite")
+        self.item = {"id": "Q64", "labels": {"en": {"value": "Berlin"}}}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    # Test if items are stored compressed and decoded on lookup.
+    def test_compressed(self):
+        items = stores.ItemStore(self.path)
+        items["Q64"] = self.item
+        stored = items.db.execute("SELECT data FROM items").fetchone()[0]
+        self.assertEqual(zlib.decompress(stored), json.dumps(self.item).encode())
+        self.assertEqual(stores.ItemStore(self.path)["Q64"], self.item)
+
+    # Test if uncompressed and compressed items can be mixed in one store.
+    def test_uncompressed(self):
+        stores.ItemStore(self.path, compress=False)["Q64"] = self.item
+        items = stores.ItemStore(self.path)
+        items["Q90"] = {"id": "Q90"}
+        self.assertEqual(items["Q64"], self.item)
+        self.assertEqual(items.get("Q90"), {"id": "Q90"})
+        self.assertIsNone(items.get("Q84"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,7 @@
+import os
+import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 import requests
@@ -5,6 +9,24 @@ import requests
 import text_representation
 
 
+class CacheTestCase(unittest.TestCase):
+    """
+    Gives each test empty item and label caches backed by in-memory stores,
+    and restores the module state afterwards.
+    """
+
+    def setUp(self):
+        for name, value in (
+            ("item_cache", {}),
+            ("label_cache", {}),
+            ("item_store_file_path", ":memory:"),
+            ("label_store_file_path", ":memory:"),
+        ):
+            patcher = mock.patch(f"text_representation.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
 class TestFormatDate(unittest.TestCase):
     # Test if only the year is extracted when month and day are not provided.
     def test_year_only(self):
@@ -46,7 +68,7 @@ class TestFormatDate(unittest.TestCase):
 
 class TestMakeHttpRequest(unittest.TestCase):
     # Test if make_http_request returns the correct JSON response for a successful request.
-    @mock.patch("text_representation.requests.get")
+    @mock.patch("text_representation.wikidata_client.session.request")
     def test_make_http_request_success(self, mock_get):
         mock_get.return_value.json.return_value = {"key": "value"}
         mock_get.return_value.raise_for_status = lambda: None
@@ -55,7 +77,7 @@ class TestMakeHttpRequest(unittest.TestCase):
         self.assertEqual(response, {"key": "value"})
 
     # Test if make_http_request raises an HTTPError for a failed request.
-    @mock.patch("text_representation.requests.get")
+    @mock.patch("text_representation.wikidata_client.session.request")
     def test_make_http_request_failure(self, mock_get):
         mock_get.return_value.raise_for_status.side_effect = (
             requests.exceptions.HTTPError
@@ -66,26 +88,26 @@ class TestMakeHttpRequest(unittest.TestCase):
 
 
 class TestLoadItemCache(unittest.TestCase):
-    # Test if load_item_cache correctly loads the cache when the cache file exists.
+    # Test if the items of the JSON lines item cache are imported into an empty item store.
+    @mock.patch("text_representation.item_store_file_path", ":memory:")
     @mock.patch("text_representation.os.path.exists")
-    @mock.patch("text_representation.json.load")
     @mock.patch(
         "text_representation.open",
         new_callable=mock.mock_open,
-        read_data='{"Q1": "entity1"}',
+        read_data='{"id": "Q1", "labels": {}}\n{"broken": true}\n',
     )
-    def test_load_item_cache_exists(self, mock_open, mock_json_load, mock_exists):
+    def test_load_item_cache_exists(self, mock_open, mock_exists):
         mock_exists.return_value = True
-        mock_json_load.return_value = {"Q1": "entity1"}
         cache = text_representation.load_item_cache()
-        self.assertEqual(cache, {"Q1": "entity1"})
+        self.assertEqual(dict(cache), {"Q1": {"id": "Q1", "labels": {}}})
 
-    # Test if load_item_cache returns an empty dictionary when the cache file does not exist.
+    # Test if load_item_cache returns an empty item store when the cache file does not exist.
+    @mock.patch("text_representation.item_store_file_path", ":memory:")
     @mock.patch("text_representation.os.path.exists")
     def test_load_item_cache_not_exists(self, mock_exists):
         mock_exists.return_value = False
         cache = text_representation.load_item_cache()
-        self.assertEqual(cache, {})
+        self.assertEqual(dict(cache), {})
 
 
 class TestReplacePropLabel(unittest.TestCase):
@@ -109,7 +131,8 @@ class TestPropSkip(unittest.TestCase):
 
 
 class TestLoadLabelCache(unittest.TestCase):
-    # Test loading label cache when cache file exists.
+    # Test if the labels of the JSON label cache are imported into an empty label store.
+    @mock.patch("text_representation.label_store_file_path", ":memory:")
     @mock.patch("text_representation.os.path.exists")
     @mock.patch("text_representation.json.load")
     @mock.patch(
@@ -121,99 +144,20 @@ class TestLoadLabelCache(unittest.TestCase):
         mock_exists.return_value = True
         mock_json_load.return_value = {"P123": "Label for P123"}
         label_cache = text_representation.load_label_cache()
-        self.assertEqual(label_cache, {"P123": "Label for P123"})
+        self.assertEqual(dict(label_cache), {"P123": "Label for P123"})
 
     # Test loading label cache when cache file does not exist.
+    @mock.patch("text_representation.label_store_file_path", ":memory:")
     @mock.patch("text_representation.os.path.exists")
     def test_load_label_cache_not_exists(self, mock_exists):
         mock_exists.return_value = False
         label_cache = text_representation.load_label_cache()
-        self.assertEqual(label_cache, {})
-
-
-class TestSaveItemCache(unittest.TestCase):
-    # Test if save_item_cache creates a new file with the correct name if it does not exist
-    @mock.patch("text_representation.open", new_callable=mock.mock_open)
-    @mock.patch("text_representation.json.dump")
-    @mock.patch("text_representation.os.path.exists")
-    def test_save_item_cache_creates_file(self, mock_exists, mock_json_dump, mock_open):
-        mock_exists.return_value = False
-        text_representation.save_item_cache()
-        mock_open.assert_called_once_with(text_representation.item_cache_file_path, "w")
-        mock_json_dump.assert_called_once()
-
-    # Test if save_item_cache writes the correct data to the file
-    @mock.patch("text_representation.open", new_callable=mock.mock_open, read_data='{}')
-    @mock.patch("text_representation.json.dump")
-    @mock.patch("text_representation.os.path.exists")
-    def test_save_item_cache_writes_data(self, mock_exists, mock_json_dump, mock_open):
-        mock_exists.return_value = True
-        test_cache = {"Q1": "entity1"}
-        text_representation.item_cache = test_cache
-        text_representation.save_item_cache()
-        mock_json_dump.assert_called_once_with(test_cache, mock_open.return_value, indent=2)
-
-    # Test if save_item_cache correctly updates the item cache when called
-    @mock.patch("text_representation.load_item_cache")
-    @mock.patch("text_representation.open", new_callable=mock.mock_open)
-    @mock.patch("text_representation.json.dump")
-    @mock.patch("text_representation.os.path.exists")
-    def test_save_item_cache_updates_cache(
-        self, mock_exists, mock_json_dump, mock_open, mock_load_item_cache
-    ):
-        mock_exists.return_value = True
-        test_cache = {"Q1": "entity1"}
-        text_representation.item_cache = test_cache
-        text_representation.save_item_cache()
-        mock_load_item_cache.assert_called_once()
-
+        self.assertEqual(dict(label_cache), {})
 
-class TestSaveLabelCache(unittest.TestCase):
-    # Test if save_label_cache creates a new file with the correct name if it does not exist
-    @mock.patch("text_representation.open", new_callable=mock.mock_open)
-    @mock.patch("text_representation.json.dump")
-    @mock.patch("text_representation.os.path.exists")
-    def test_save_label_cache_creates_file(
-        self, mock_exists, mock_json_dump, mock_open
-    ):
-        mock_exists.return_value = False
-        text_representation.save_label_cache()
-        mock_open.assert_called_once_with(
-            text_representation.label_cache_file_path, "w"
-        )
-        mock_json_dump.assert_called_once()
-
-    # Test if save_label_cache writes the correct data to the file
-    @mock.patch("text_representation.open", new_callable=mock.mock_open, read_data='{}')
-    @mock.patch("text_representation.json.dump")
-    @mock.patch("text_representation.os.path.exists")
-    def test_save_label_cache_writes_data(self, mock_exists, mock_json_dump, mock_open):
-        mock_exists.return_value = True
-        test_cache = {"P123": "Label for P123"}
-        text_representation.label_cache = test_cache
-        text_representation.save_label_cache()
-        mock_json_dump.assert_called_once_with(
-            test_cache, mock_open.return_value, indent=2
-        )
-
-    # Test if save_label_cache correctly updates the label cache when called
-    @mock.patch("text_representation.load_label_cache")
-    @mock.patch("text_representation.open", new_callable=mock.mock_open)
-    @mock.patch("text_representation.json.dump")
-    @mock.patch("text_representation.os.path.exists")
-    def test_save_label_cache_updates_cache(
-        self, mock_exists, mock_json_dump, mock_open, mock_load_label_cache
-    ):
-        mock_exists.return_value = True
-        test_cache = {"P123": "Label for P123"}
-        text_representation.label_cache = test_cache
-        text_representation.save_label_cache()
-        mock_load_label_cache.assert_called_once()
 
-class TestFetchLabelsByIds(unittest.TestCase):
+class TestFetchLabelsByIds(CacheTestCase):
     @mock.patch("text_representation.make_http_request")
-    @mock.patch("text_representation.save_label_cache")
-    def test_fetch_labels_by_ids_returns_correct_labels(self, mock_save_label_cache, mock_make_http_request):
+    def test_fetch_labels_by_ids_returns_correct_labels(self, mock_make_http_request):
         # Setup mock response from the API
         mock_response = {
             "entities": {
@@ -222,6 +166,7 @@ class TestFetchLabelsByIds(unittest.TestCase):
             }
         }
         mock_make_http_request.return_value = mock_response
+        text_representation.label_cache = {}
 
         # Call fetch_labels_by_ids with IDs that are not in the cache
         labels = text_representation.fetch_labels_by_ids(["Q1", "Q2"])
@@ -230,8 +175,6 @@ class TestFetchLabelsByIds(unittest.TestCase):
         self.assertEqual(labels, {"Q1": "Universe", "Q2": "Earth"})
         # Check that the API was called since these labels were not in the cache
         mock_make_http_request.assert_called_once()
-        # Check that the label cache is saved after fetching
-        mock_save_label_cache.assert_called_once()
 
     @mock.patch("text_representation.make_http_request")
     def test_fetch_labels_by_ids_uses_cache(self, mock_make_http_request):
@@ -247,8 +190,7 @@ class TestFetchLabelsByIds(unittest.TestCase):
         mock_make_http_request.assert_not_called()
 
     @mock.patch("text_representation.make_http_request")
-    @mock.patch("text_representation.save_label_cache")
-    def test_fetch_labels_by_ids_updates_cache(self, mock_save_label_cache, mock_make_http_request):
+    def test_fetch_labels_by_ids_updates_cache(self, mock_make_http_request):
         # Setup mock response from the API
         mock_response = {
             "entities": {
@@ -268,12 +210,11 @@ class TestFetchLabelsByIds(unittest.TestCase):
         # Check that the label cache now contains the new label
         self.assertIn("Q2", text_representation.label_cache)
         self.assertEqual(text_representation.label_cache["Q2"], "Earth")
-        # Check that the label cache is saved after fetching
-        mock_save_label_cache.assert_called_once()
 
 
-class TestCreateStatementsRepresentation(unittest.TestCase):
+class TestCreateStatementsRepresentation(CacheTestCase):
     def setUp(self):
+        super().setUp()
         self.item_label = "Sample Item"
         # Start the fetch_labels_by_ids mock and set return values for entity IDs
         self.mock_fetch_labels = mock.patch("text_representation.fetch_labels_by_ids")
@@ -358,8 +299,9 @@ class TestCreateStatementsRepresentation(unittest.TestCase):
         self.assertNotIn("Sample Item flag Douglas Adams.", result)
 
 
-class TestCreateStatementGroupRepresentation(unittest.TestCase):
+class TestCreateStatementGroupRepresentation(CacheTestCase):
     def setUp(self):
+        super().setUp()
         self.item_label = "Sample Item"
         # Start the fetch_labels_by_ids mock and set return values for entity IDs
         self.mock_fetch_labels = mock.patch(
@@ -459,10 +401,9 @@ class TestCreateStatementGroupRepresentation(unittest.TestCase):
         )
         self.assertEqual(result, "")
 
-class TestWikidataItemToText(unittest.TestCase):
+class TestWikidataItemToText(CacheTestCase):
     @mock.patch("text_representation.make_http_request")
-    @mock.patch("text_representation.save_item_cache")
-    def test_wikidata_item_to_text_not_in_cache(self, mock_save_item_cache, mock_make_http_request):
+    def test_wikidata_item_to_text_not_in_cache(self, mock_make_http_request):
         # Setup mock response from the API
         mock_response = {
             "entities": {
@@ -488,5 +429,155 @@ class TestWikidataItemToText(unittest.TestCase):
         # Check that the API was called since the item was not in the cache
         mock_make_http_request.assert_called_once()
 
-        # Check that the item cache is saved after fetching
-        mock_save_item_cache.assert_called_once()
+        # Check that the item is stored in the item cache after fetching
+        self.assertIn("Q42", text_representation.item_cache)
+
+
+class TestCollectLabelIds(unittest.TestCase):
+    # Test if property, item value and unit ids are collected, but not the 'no unit' unit.
+    def test_collect_label_ids(self):
+        item_data = {
+            "claims": {
+                "P6": [
+                    {
+                        "mainsnak": {
+                            "datatype": "wikibase-item",
+                            "datavalue": {"value": {"entity-type": "item", "id": "Q42"}},
+                        }
+                    }
+                ],
+                "P2046": [
+                    {
+                        "mainsnak": {
+                            "datatype": "quantity",
+                            "datavalue": {
+                                "value": {
+                                    "amount": "+891.3",
+                                    "unit": "http://www.wikidata.org/entity/Q712226",
+                                }
+                            },
+                        }
+                    }
+                ],
+                "P1082": [
+                    {
+                        "mainsnak": {
+                            "datatype": "quantity",
+                            "datavalue": {"value": {"amount": "+3755251", "unit": "1"}},
+                        }
+                    }
+                ],
+                "P281": [
+                    {"mainsnak": {"datatype": "string", "datavalue": {"value": "10115"}}}
+                ],
+            }
+        }
+        ids = text_representation.collect_label_ids(item_data)
+        self.assertEqual(ids, {"P6", "Q42", "P2046", "Q712226", "P1082", "P281"})
+
+
+class TestPrefetchLabels(CacheTestCase):
+    # Test if only uncached ids are fetched, in batches of at most 50 ids.
+    @mock.patch("text_representation.fetch_labels_by_ids")
+    def test_prefetch_labels_batches(self, mock_fetch_labels_by_ids):
+        text_representation.label_cache = {"Q1": "Universe"}
+        ids = [f"Q{i}" for i in range(1, 122)]
+        text_representation.prefetch_labels(ids)
+
+        batches = [c.args[0] for c in mock_fetch_labels_by_ids.call_args_list]
+        self.assertEqual([len(b) for b in batches], [50, 50, 20])
+        self.assertEqual(sorted(sum(batches, [])), sorted(ids[1:]))
+
+    # Test if nothing is fetched when all labels are cached.
+    @mock.patch("text_representation.fetch_labels_by_ids")
+    def test_prefetch_labels_cached(self, mock_fetch_labels_by_ids):
+        text_representation.label_cache = {"Q1": "Universe"}
+        text_representation.prefetch_labels(["Q1"])
+        mock_fetch_labels_by_ids.assert_not_called()
+
+
+class TestReadItems(unittest.TestCase):
+    # Test if item ids are read from entity URLs, without duplicates and non-item entities.
+    def test_read_items(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, "a.csv"), os.path.join(tmp, "b.csv")]
+            with open(paths[0], "w") as file:
+                file.write(
+                    "item,itemLabel\n"
+                    "http://www.wikidata.org/entity/Q64,Berlin\n"
+                    "http://www.wikidata.org/entity/L1217239-S1,L1217239-S1\n"
+                    '"http://www.wikidata.org/entity/Q61","Washington, D.C."\n'
+                )
+            with open(paths[1], "w") as file:
+                file.write("item,itemLabel\nhttp://www.wikidata.org/entity/Q90,Paris\nQ64,Berlin\n")
+            self.assertEqual(text_representation.read_items(paths), ["Q64", "Q61", "Q90"])
+
+
+class TestGenerateTextRepresentations(CacheTestCase):
+    # Test if a text representation file is written for every item.
+    @mock.patch("text_representation.make_http_request")
+    def test_generate_text_representations(self, mock_make_http_request):
+        text_representation.item_cache = {
+            item_id: {
+                "labels": {"en": {"value": label}},
+                "descriptions": {"en": {"value": "capital of Germany"}},
+                "claims": {},
+            }
+            for item_id, label in [("Q64", "Berlin"), ("Q1055", "Hamburg")]
+        }
+        text_representation.label_cache = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch("text_representation.text_representations_dir", tmp):
+                generated = text_representation.generate_text_representations(
+                    ["Q64", "Q1055"], render_workers=1
+                )
+            self.assertEqual(generated, ["Q64", "Q1055"])
+            with open(os.path.join(tmp, "Q64.txt")) as file:
+                self.assertEqual(file.read(), "Berlin: capital of Germany\n\n")
+        mock_make_http_request.assert_not_called()
+
+    # Test if only uncached items are fetched and the labels of a batch are
+    # prefetched once for all of its items.
+    @mock.patch("text_representation.prefetch_labels")
+    @mock.patch("text_representation.make_http_request")
+    def test_fetches_missing_items_and_prefetches_once(
+        self, mock_make_http_request, mock_prefetch_labels
+    ):
+        def item(label, prop_id):
+            value = {"entity-type": "item", "id": "Q183"}
+            claim = {"mainsnak": {"datatype": "wikibase-item", "datavalue": {"value": value}}}
+            return {"labels": {"en": {"value": label}}, "claims": {prop_id: [claim]}}
+
+        text_representation.item_cache = {"Q64": item("Berlin", "P17")}
+        text_representation.label_cache = {"P17": "country", "P131": "located in", "Q183": "Germany"}
+        mock_make_http_request.return_value = {"entities": {"Q1055": item("Hamburg", "P131")}}
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch("text_representation.text_representations_dir", tmp):
+                text_representation.generate_text_representations(
+                    ["Q64", "Q1055"], render_workers=1
+                )
+        mock_make_http_request.assert_called_once()
+        self.assertIn("Q1055", mock_make_http_request.call_args.args[0])
+        mock_prefetch_labels.assert_called_once()
+        self.assertEqual(mock_prefetch_labels.call_args.args[0], {"P17", "P131", "Q183"})
+
+
+class TestGetItemCache(CacheTestCase):
+    # Test if concurrent first uses load the item cache only once.
+    @mock.patch("text_representation.load_item_cache")
+    def test_get_item_cache_loads_once(self, mock_load_item_cache):
+        def load():
+            time.sleep(0.05)
+            return {}
+
+        mock_load_item_cache.side_effect = load
+        text_representation.item_cache = None
+        threads = [
+            threading.Thread(target=text_representation.get_item_cache)
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        mock_load_item_cache.assert_called_once()
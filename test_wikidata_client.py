@@ -0,0 +1,79 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import wikidata_client
+from stand_in_server import StandInHandler, StandInServerTestCase
+
+
+class EntityDataHandler(StandInHandler):
+    def do_GET(self):
+        status = self.next_status()
+        item_id = self.path.rsplit("/", 1)[-1].split(".")[0]
+        headers = [("Retry-After", "0")] if status == 429 else []
+        self.send_json(status, {"entities": {item_id: {"id": item_id}}}, headers)
+
+
+class TestWikidataClient(StandInServerTestCase):
+    handler = EntityDataHandler
+    path = "/wiki/Special:EntityData"
+
+    # Test if the JSON response is returned.
+    def test_get(self):
+        client = wikidata_client.WikidataClient(rps=None)
+        data = client.get(f"{self.url}/Q64.json")
+        self.assertEqual(data, {"entities": {"Q64": {"id": "Q64"}}})
+
+    # Test if rate limited and server error responses are retried.
+    def test_get_retries(self):
+        EntityDataHandler.failures = [429, 503]
+        client = wikidata_client.WikidataClient(rps=None, backoff=0)
+        self.assertIn("Q64", client.get(f"{self.url}/Q64.json")["entities"])
+        self.assertEqual(EntityDataHandler.requests, 3)
+
+    # Test if the error is raised once all retries are used up.
+    def test_get_gives_up_after_max_retries(self):
+        EntityDataHandler.failures = [500, 500, 500]
+        client = wikidata_client.WikidataClient(rps=None, max_retries=2, backoff=0)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            client.get(f"{self.url}/Q64.json")
+        self.assertEqual(EntityDataHandler.requests, 3)
+
+    # Test if client errors are not retried.
+    def test_get_does_not_retry_client_errors(self):
+        EntityDataHandler.failures = [404]
+        client = wikidata_client.WikidataClient(rps=None, backoff=0)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            client.get(f"{self.url}/Q64.json")
+        self.assertEqual(EntityDataHandler.requests, 1)
+
+    # Test if concurrent requests share the rate limit and keep their order.
+    def test_get_concurrently_rate_limited(self):
+        client = wikidata_client.WikidataClient(rps=50)
+        ids = [f"Q{i}" for i in range(10)]
+        start = time.monotonic()
+        with ThreadPoolExecutor(4) as executor:
+            results = list(
+                executor.map(lambda i: client.get(f"{self.url}/{i}.json"), ids)
+            )
+        self.assertGreaterEqual(time.monotonic() - start, 9 / 50)
+        self.assertEqual([list(r["entities"])[0] for r in results], ids)
+
+
+class TestRateLimiter(unittest.TestCase):
+    # Test if a burst is allowed immediately and further calls are spaced out.
+    def test_acquire(self):
+        limiter = wikidata_client.RateLimiter(rate=100, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        self.assertLess(time.monotonic() - start, 0.04)
+        for _ in range(5):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.045)
+
+
+if __name__ == "__main__":
+    unittest.main()
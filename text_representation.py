@@ -1,16 +1,40 @@
-import requests
+import argparse
+import csv
+import functools
+import glob
 import json
+import multiprocessing
 import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from tqdm import tqdm
 
-# Path to the item cache file
+from stores import ItemStore, LabelStore
+from wikidata_client import WikidataClient
+
+# Path to the item cache file of older versions, migrated to the item store
 item_cache_file_path = "wikidata_item_cache.json"
-# Path to the label cache file
+# Path to the item store database
+item_store_file_path = "wikidata_items.sqlite"
+# Path to the label cache file of older versions, migrated to the label store
 label_cache_file_path = "wikidata_label_cache.json"
+# Path to the label store database
+label_store_file_path = "wikidata_labels.sqlite"
 
 # Path to text_representations directory
 text_representations_dir = "./text_representations"
 
+# Shared by all worker threads, limits the total request rate to Wikidata
+wikidata_client = WikidataClient(rps=10)
+
+# Item and label caches, loaded on first use, see get_item_cache and
+# get_label_cache
+item_cache = None
+label_cache = None
+# Makes sure each cache is loaded, and migrated, only once by concurrent threads
+cache_init_lock = threading.Lock()
+
 
 def make_http_request(url):
     """
@@ -23,37 +47,55 @@ def make_http_request(url):
         dict: The JSON response from the request.
     """
     tqdm.write(f"  GET {url}...")
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
+    return wikidata_client.get(url)
 
 
 def load_item_cache():
-    if os.path.exists(item_cache_file_path):
-        cache = {}
+    item_store = ItemStore(item_store_file_path)
+    # Import the items of the JSON lines item cache once, a batch at a time
+    if len(item_store) == 0 and os.path.exists(item_cache_file_path):
+        print(f"Importing items from {item_cache_file_path}...")
+        batch = {}
         with open(item_cache_file_path, 'r') as file:
             for line in file:
                 item = json.loads(line)
                 if "id" in item:
-                    cache[item["id"]] = item
+                    batch[item["id"]] = item
                 else:
                     print("Broken cache entry:", item)
-        return cache
-    else:
-        return {}
+                if len(batch) == 1000:
+                    item_store.update(batch)
+                    batch = {}
+        item_store.update(batch)
+    return item_store
 
 
 def load_label_cache():
-    if os.path.exists(label_cache_file_path):
+    label_store = LabelStore(label_store_file_path)
+    # Import the labels of the JSON label cache once
+    if len(label_store) == 0 and os.path.exists(label_cache_file_path):
+        print(f"Importing labels from {label_cache_file_path}...")
         with open(label_cache_file_path, "r") as cache_file:
-            return json.load(cache_file)
-    else:
-        return {}
+            label_store.update(json.load(cache_file))
+    return label_store
+
+
+def get_item_cache():
+    global item_cache
+    if item_cache is None:
+        with cache_init_lock:
+            if item_cache is None:
+                item_cache = load_item_cache()
+    return item_cache
 
 
-# Load item cache from file if it exists
-item_cache = load_item_cache()
-label_cache = load_label_cache()
+def get_label_cache():
+    global label_cache
+    if label_cache is None:
+        with cache_init_lock:
+            if label_cache is None:
+                label_cache = load_label_cache()
+    return label_cache
 
 
 # Replacements for property labels
@@ -110,26 +152,9 @@ def prop_skip(label):
     return label in skip
 
 
-# Save label cache to file
-def save_label_cache():
-    with open(label_cache_file_path, "w") as cache_file:
-        json.dump(label_cache, cache_file, indent=2)
-    load_label_cache()
-
-
-# Save item cache to file
-def save_item_cache():
-    with open(item_cache_file_path, "w") as cache_file:
-        for _, i in item_cache.items():
-            cache_file.write(json.dumps(i) + "\n")
-
-def append_item_cache(item):
-    with open(item_cache_file_path, "a") as cache_file:
-        cache_file.write(json.dumps(item) + "\n")
-
-
 # Modified fetch_labels_by_ids function with caching
 def fetch_labels_by_ids(ids):
+    label_cache = get_label_cache()
     # Check the cache first
     uncached_ids = [id_ for id_ in ids if id_ not in label_cache]
     labels_to_fetch = "|".join(uncached_ids)
@@ -138,17 +163,82 @@ def fetch_labels_by_ids(ids):
         url = f"https://www.wikidata.org/w/api.php?action=wbgetentities&ids={labels_to_fetch}&format=json&props=labels"
         data = make_http_request(url)
 
+        fetched_labels = {}
         for entity_id, content in data["entities"].items():
-            entity_label = content["labels"].get("en", {}).get("value", entity_id)
-            label_cache[entity_id] = entity_label
-        # Save updated label cache to disk
-        save_label_cache()
+            # Missing or deleted entities come without labels
+            entity_label = content.get("labels", {}).get("en", {}).get("value", entity_id)
+            fetched_labels[entity_id] = entity_label
+        # Store the new labels at once, the label store writes only these
+        label_cache.update(fetched_labels)
 
     # Now build the result using the label cache
     labels = {id_: label_cache.get(id_, id_) for id_ in ids}
     return labels
 
 
+# wbgetentities accepts at most 50 ids per request
+label_batch_size = 50
+
+
+def prefetch_labels(ids, executor=None):
+    """
+    Fetch the labels of all uncached ids in batches of label_batch_size, so
+    later lookups of these ids are answered from the label cache.
+
+    Args:
+        ids (iterable): The property and entity IDs.
+        executor (Executor): Fetches batches concurrently if given.
+    """
+    label_cache = get_label_cache()
+    uncached_ids = sorted({id_ for id_ in ids if id_ not in label_cache})
+    batches = [
+        uncached_ids[i : i + label_batch_size]
+        for i in range(0, len(uncached_ids), label_batch_size)
+    ]
+    if executor is None:
+        for batch in batches:
+            fetch_labels_by_ids(batch)
+    else:
+        list(executor.map(fetch_labels_by_ids, batches))
+
+
+def quantity_unit_id(value):
+    # Check if the 'unit' key exists and if it's not the 'no unit' URL
+    if "unit" in value and value["unit"] not in [
+        "http://www.wikidata.org/entity/Q199",
+        "1",
+    ]:
+        return value["unit"].split("/")[-1]  # Extract the unit ID from the URL
+    return None
+
+
+def collect_label_ids(item_data):
+    """
+    Collect the IDs of all labels the text representation of an item needs:
+    its properties, item values and quantity units.
+
+    Args:
+        item_data (dict): The entity data of the Wikidata item.
+
+    Returns:
+        set: The property and entity IDs.
+    """
+    ids = set()
+    for prop_id, statement_group in item_data.get("claims", {}).items():
+        ids.add(prop_id)
+        for statement in statement_group:
+            mainsnak = statement.get("mainsnak", {})
+            value = mainsnak.get("datavalue", {}).get("value")
+            datatype = mainsnak.get("datatype")
+            if datatype == "wikibase-item" and value and value.get("entity-type") == "item":
+                ids.add(value.get("id"))
+            elif datatype == "quantity" and value:
+                unit_id = quantity_unit_id(value)
+                if unit_id:
+                    ids.add(unit_id)
+    return ids
+
+
 def format_date(date_value):
     """
     Format a Wikidata date value to a common date format or as text if incomplete.
@@ -197,12 +287,8 @@ def format_quantity(value):
     amount = value.get("amount", "Unknown quantity").lstrip(
         "+"
     )  # Remove '+' prefix if it exists
-    # Check if the 'unit' key exists and if it's not the 'no unit' URL
-    if "unit" in value and value["unit"] not in [
-        "http://www.wikidata.org/entity/Q199",
-        "1",
-    ]:
-        unit_id = value["unit"].split("/")[-1]  # Extract the unit ID from the URL
+    unit_id = quantity_unit_id(value)
+    if unit_id:
         labels = fetch_labels_by_ids([unit_id])
         unit_label = labels.get(unit_id, unit_id)
         return f"{amount} {unit_label}"
@@ -339,26 +425,41 @@ def create_statements_representation(item_label, statements):
     return "\n".join(statements_representation)
 
 
+def fetch_item(item_id):
+    item_cache = get_item_cache()
+    # Check if the item is already in the cache
+    item_data = item_cache.get(item_id)
+    if not item_data:
+        url = f"https://www.wikidata.org/wiki/Special:EntityData/{item_id}.json"
+        data = make_http_request(url)
+        item_data = data.get("entities", {}).get(item_id, {})
+        item_cache[item_id] = item_data
+    return item_data
+
+
+def item_label_ids(item_id):
+    """The IDs of the labels the text representation of a cached item needs."""
+    return collect_label_ids(fetch_item(item_id))
+
+
 # Function to get the label, description, and statements of a Wikidata item
-def wikidata_item_to_text(item_id):
+def wikidata_item_to_text(item_id, prefetch=True):
     """
     Get the text representation of a Wikidata item including its label, description, and statements.
 
     Args:
         item_id (str): The ID of the Wikidata item.
+        prefetch (bool): Whether to fetch the labels of the item up front.
+            False if they were prefetched already.
 
     Returns:
         str: The text representation of the Wikidata item.
     """
-    # Check if the item is already in the cache
-    item_data = item_cache.get(item_id)
-    if not item_data:
-        url = f"https://www.wikidata.org/wiki/Special:EntityData/{item_id}.json"
-        data = make_http_request(url)
-        item_data = data.get("entities", {}).get(item_id, {})
-        item_cache[item_id] = item_data
-        # save_item_cache()
-        append_item_cache(item_data)
+    item_data = fetch_item(item_id)
+    # Resolve all labels up front in few requests, rendering then only reads
+    # the label cache
+    if prefetch:
+        prefetch_labels(collect_label_ids(item_data))
 
     item_label = (
         item_data.get("labels", {}).get("en", {}).get("value", "No item label found")
@@ -375,18 +476,167 @@ def wikidata_item_to_text(item_id):
     return text_representation
 
 
-# items = ["Q64", "Q84", "Q90", "Q1085"]
-# capitals
-items = ["Q61", "Q64", "Q70", "Q84", "Q85", "Q90", "Q216", "Q220", "Q269", "Q270", "Q384", "Q437", "Q472", "Q585", "Q598", "Q649", "Q807", "Q911", "Q956", "Q987", "Q994", "Q1085", "Q1335", "Q1362", "Q1486", "Q1515", "Q1520", "Q1524", "Q1530", "Q1533", "Q1555", "Q1563", "Q1741", "Q1748", "Q1754", "Q1757", "Q1761", "Q1770", "Q1780", "Q1781", "Q1844", "Q1848", "Q1850", "Q1858", "Q1861", "Q1863", "Q1865", "Q1867", "Q1899", "Q1930", "Q1947", "Q1963", "Q2082", "Q2280", "Q2337", "Q2449", "Q2471", "Q2841", "Q2844", "Q2868", "Q2887", "Q2900", "Q2933", "Q3001", "Q3037", "Q3043", "Q3070", "Q3110", "Q3114", "Q3238", "Q3274", "Q3306", "Q3551", "Q3561", "Q3579", "Q3604", "Q3616", "Q3642", "Q3659", "Q3692", "Q3703", "Q3711", "Q3718", "Q3726", "Q3748", "Q3751", "Q3761", "Q3768", "Q3780", "Q3787", "Q3792", "Q3805", "Q3808", "Q3818", "Q3820", "Q3825", "Q3826", "Q3832", "Q3844", "Q3856", "Q101418", "Q103717", "Q112813", "Q129072", "Q131233", "Q131620", "Q131694", "Q132572", "Q132679", "Q132754", "Q132997", "Q147738", "Q154002", "Q157035", "Q159273", "Q165341", "Q166065", "Q167436", "Q167551", "Q168652", "Q168929", "Q170454", "Q170578", "Q170762", "Q172512", "Q173310", "Q174461", "Q178993", "Q180773", "Q181007", "Q181056", "Q192541", "Q211030", "Q217610", "Q232615", "Q277540", "Q319476", "Q331584", "Q385445", "Q429059", "Q569107", "Q605319", "Q624467", "Q696193", "Q706215", "Q738250", "Q752394", "Q822679", "Q834162", "Q841342", "Q854672", "Q977305", "Q993064", "Q1000140", "Q1020758", "Q1069007", "Q1107569", "Q1113311", "Q1131299", "Q1136681", "Q1190403", "Q1199713", "Q1330294", "Q1518300", "Q1769924", "Q1815305", "Q2313393", "Q2483679", "Q2594448", "Q3233968", "Q3344424", "Q3344926", "Q3393642", "Q3528033", "Q3683885", "Q3894902", "Q3947434", "Q3947744", "Q3947745", "Q3948919", "Q4070999", "Q4803191", "Q5316658", "Q5865090", "Q7223839", "Q7856199", "Q8262638", "Q10054424", "Q11955673", "Q12254217", "Q12259792", "Q12489692", "Q14634615", "Q14934767", "Q15941322", "Q18342086", "Q23000330", "Q23986680", "Q24008400", "Q28519583", "Q31877477", "Q31878333", "Q31879456", "Q31880915", "Q31887734", "Q31911550", "Q31912265", "Q31924170", "Q31924457", "Q47461088", "Q49286541", "Q49344178", "Q65300020", "Q70591145", "Q97132512", "Q98008573", "Q98686735", "Q101186473", "Q105076255", "Q3859", "Q3861", "Q3866", "Q3870", "Q3876", "Q3881", "Q3889", "Q3894", "Q3897", "Q3901", "Q3904", "Q3909", "Q3915", "Q3919", "Q3921", "Q3926", "Q3929", "Q3932", "Q3935", "Q3940", "Q4361", "Q5426", "Q5465", "Q8678", "Q8684", "Q9022", "Q9248", "Q9279", "Q9310", "Q9347", "Q9361", "Q9365", "Q10686", "Q10690", "Q10717", "Q11194", "Q12919", "Q16666", "Q18808", "Q19660", "Q19689", "Q21197", "Q23436", "Q23438", "Q25270", "Q25390", "Q27660", "Q30958", "Q30970", "Q30985", "Q31026", "Q31487", "Q33929", "Q34126", "Q34261", "Q34692", "Q34820", "Q35178", "Q35381", "Q36168", "Q36260", "Q36281", "Q36378", "Q36526", "Q37400", "Q37701", "Q37806", "Q37995", "Q38807", "Q38834", "Q40236", "Q40269", "Q40921", "Q41128", "Q41295", "Q41474", "Q41547", "Q41699", "Q41963", "Q42751", "Q42800", "Q44059", "Q44211", "Q44215", "Q44244", "Q47916", "Q48329", "Q48338", "Q52101", "Q63964", "Q66485", "Q68481", "Q69345", "Q79281", "Q80484", "Q80989", "Q82500", "Q83189", "Q83442", "Q83786",]
-# cities
-items = items + ["Q1858", "Q1861", "Q1862", "Q1863", "Q1865", "Q1867", "Q1891", "Q1903", "Q1906", "Q1947", "Q1960", "Q1963", "Q2028", "Q2044", "Q2055", "Q2061", "Q2079", "Q2096", "Q2123", "Q2127", "Q2135", "Q2138", "Q2141", "Q2256", "Q2467", "Q2471", "Q2634", "Q2656", "Q2683", "Q2704", "Q2734", "Q2751", "Q2759", "Q2773", "Q2790", "Q2807", "Q2844", "Q2868", "Q2933", "Q2999", "Q3001", "Q3012", "Q3037", "Q3043", "Q3070", "Q3114", "Q3130", "Q3138", "Q3141", "Q3183", "Q3214", "Q3306", "Q3370", "Q3415", "Q3437", "Q3476", "Q3489", "Q3519", "Q3543", "Q3551", "Q3561", "Q3579", "Q3602", "Q3604", "Q3620", "Q3630", "Q3639", "Q3642", "Q3646", "Q3656", "Q3657", "Q3659", "Q3674", "Q3688", "Q3703", "Q3711", "Q3713", "Q3726", "Q3733", "Q3739", "Q3742", "Q3748", "Q3751", "Q3752", "Q3753", "Q3761", "Q3765", "Q3766", "Q3771", "Q3780", "Q3786", "Q3787", "Q3792", "Q3799", "Q3805", "Q3818", "Q3825", "Q3832", "Q3834", "Q3838", "Q3841", "Q3844", "Q3850", "Q3854", "Q3860", "Q3873", "Q3876", "Q3881", "Q3882", "Q3883", "Q3889", "Q3892", "Q3894", "Q3897", "Q3901", "Q3904", "Q3909", "Q3921", "Q3922", "Q3928", "Q3929", "Q3932", "Q3935", "Q3939", "Q3940", "Q3958", "Q3992", "Q4011", "Q4024", "Q4044", "Q4045", "Q4051", "Q4093", "Q4108", "Q4113", "Q4133", "Q4301", "Q4549", "Q4629", "Q4709", "Q4999", "Q5001", "Q5004", "Q5008", "Q5029", "Q5030", "Q5042", "Q5045", "Q5112", "Q5168", "Q5266", "Q5276", "Q5398", "Q5460", "Q5468", "Q5475", "Q5687", "Q5713", "Q5724", "Q5753", "Q5760", "Q5764", "Q5776", "Q5788", "Q5832", "Q5838", "Q5867", "Q5869", "Q5968", "Q5980", "Q5981", "Q5992", "Q6009", "Q6016", "Q6046", "Q6088", "Q6122", "Q6157", "Q6172", "Q6221", "Q6225", "Q6226", "Q6231", "Q6252", "Q6285", "Q6364", "Q6397", "Q6454", "Q6487", "Q6537", "Q6616", "Q6647", "Q6681", "Q6737", "Q6761", "Q6780", "Q6855", "Q7019", "Q7024", "Q7030", "Q7036", "Q7039", "Q7436", "Q7568", "Q7903", "Q8621", "Q8646", "Q8673", "Q8684", "Q8692", "Q8693", "Q8745", "Q8826", "Q8856", "Q8969", "Q9022", "Q9270", "Q9279", "Q9347", "Q9365", "Q9427", "Q9783", "Q9824", "Q9844", "Q9863", "Q9871", "Q9885", "Q9888", "Q9918", "Q9920", "Q9954", "Q9974", "Q10006", "Q10014", "Q10045", "Q10052", "Q10086", "Q10509", "Q10566", "Q10686", "Q10690", "Q10717", "Q10743", "Q10779", "Q11043", "Q11194", "Q11285", "Q11568", "Q11725", "Q11736", "Q11739", "Q11864", "Q11909", "Q11910", "Q11959", "Q11977", "Q11994", "Q12258", "Q12292", "Q12303", "Q12618", "Q12994", "Q13077", "Q13153", "Q13318", "Q13320", "Q13329", "Q13360", "Q13362", "Q13364", "Q13367", "Q13369", "Q13372", "Q13373", "Q13375", "Q13377", "Q13386", "Q13410", "Q13464", "Q13470", "Q13486", "Q13498", "Q13625", "Q13629", "Q13648", "Q13666", "Q13670", "Q13678", "Q13934", "Q14182", "Q14433", "Q14453", "Q14499", "Q14649", "Q14903", "Q14912", "Q14956", "Q14957", "Q15092", "Q15174", "Q15468", "Q15471", "Q15639", "Q15640", "Q15855", "Q15858", "Q15860", "Q15861", "Q15865", "Q15867", "Q15868", "Q15870", "Q15871", "Q15876", "Q15877", "Q15883", "Q15885", "Q15890", "Q15896", "Q15898", "Q15899", "Q15901", "Q15906", "Q15908", "Q15911", "Q15914", "Q15916", "Q15917", "Q15918", "Q15926", "Q15928", "Q15930", "Q15984", "Q16010", "Q16012", "Q16022", "Q16258", "Q16461", "Q16520", "Q16666", "Q16869", "Q16978", "Q17856", "Q17895", "Q18021", "Q18125", "Q18709", "Q18730", "Q18737", "Q18746", "Q18751", "Q18768", "Q18772", "Q18774", "Q18777", "Q18780", "Q18791", "Q18808", "Q19258", "Q19259", "Q19300", "Q19344", "Q19429", "Q19583", "Q19689", "Q20835", "Q21166", "Q21176", "Q21178", "Q21179", "Q21180", "Q21181", "Q21184", "Q21185", "Q21197", "Q22889", "Q22905", "Q22953", "Q23044", "Q23051", "Q23070", "Q23154", "Q23311", "Q23430", "Q23436", "Q23438", "Q23551", "Q23564", "Q23725", "Q24149", "Q24231", "Q24341", "Q24826", "Q25270", "Q25282", "Q25286", "Q25390", "Q25409", "Q25475", "Q25659", "Q62", "Q65", "Q70", "Q84", "Q85", "Q87", "Q88", "Q172", "Q174", "Q226", "Q269", "Q270", "Q279", "Q334", "Q350", "Q384", "Q385", "Q393", "Q436", "Q437", "Q438", "Q439", "Q490", "Q546", "Q580", "Q585", "Q588", "Q598", "Q612", "Q617", "Q622", "Q628", "Q641", "Q644", "Q727", "Q749", "Q761", "Q798", "Q802", "Q956", "Q994", "Q995", "Q1010", "Q1012", "Q1015", "Q1018", "Q1021", "Q1070", "Q1083", "Q1154", "Q1156", "Q1218", "Q1305", "Q1308", "Q1309", "Q1310", "Q1352", "Q1354", "Q1355", "Q1362", "Q1410", "Q1449", "Q1486", "Q1489", "Q1492", "Q1513", "Q1515", "Q1519", "Q1524", "Q1533", "Q1538", "Q1555", "Q1640", "Q1709", "Q1715", "Q1722", "Q1726", "Q1729", "Q1731", "Q1733", "Q1735", "Q1737", "Q1754", "Q1757", "Q1764", "Q1780", "Q1800", "Q1842", "Q1848", "Q1850", "Q1854", "Q25797", "Q25804", "Q26119", "Q26134", "Q26155", "Q26175", "Q26234", "Q26268", "Q26393", "Q26397", "Q26421", "Q26432", "Q26563", "Q26569", "Q26793", "Q26881", "Q26906", "Q26958", "Q27001", "Q27116", "Q27119", "Q27161", "Q27162", "Q27163", "Q27168", "Q27176", "Q27212", "Q27222", "Q27223", "Q27234", "Q27242", "Q27359", "Q27393", "Q27402", "Q27425", "Q27452", "Q27660", "Q27678", "Q28031", "Q28042", "Q28516", "Q28729", "Q28911", "Q29042", "Q29303", "Q29585", "Q29888", "Q29962", "Q30002", "Q30520", "Q30616", "Q30617", "Q30620", "Q30687", "Q30771", "Q30951", "Q30963", "Q30970", "Q30985", "Q30990", "Q30994", "Q30996", "Q31350", "Q31565", "Q31572", "Q31594", "Q31616", "Q31805", "Q33334", "Q33377", "Q33412", "Q33414", "Q33428", "Q33532", "Q33935", "Q33962", "Q34001", "Q34106", "Q34116", "Q34126", "Q34180", "Q34183", "Q34217", "Q34218", "Q34227", "Q34370", "Q34427", "Q34647", "Q34692", "Q34820", "Q34932", "Q34986", "Q34995", "Q35001", "Q35004", "Q35045", "Q35178", "Q35246", "Q35362", "Q35381", "Q35493", "Q35784", "Q36168", "Q36219", "Q36260", "Q36262", "Q36281", "Q36307", "Q36312", "Q36405", "Q36600", "Q36647", "Q36796", "Q36989", "Q37013", "Q37100", "Q37104", "Q37333", "Q37400", "Q37701", "Q37801", "Q37806", "Q37995", "Q38380", "Q38545", "Q38807", "Q38811", "Q38834", "Q38855", "Q38902", "Q39042", "Q39121", "Q39178", "Q39383", "Q39583", "Q39984", "Q40104", "Q40191", "Q40194", "Q40738", "Q40811", "Q40816", "Q40844", "Q40921", "Q41128", "Q41183", "Q41252", "Q41262", "Q41278", "Q41295", "Q41339", "Q41473", "Q41474", "Q41496", "Q41543", "Q41547", "Q41562", "Q41621", "Q41699", "Q41843", "Q42117", "Q42120", "Q42146", "Q42160", "Q42448", "Q42462", "Q42678", "Q42751", "Q42763", "Q42780", "Q42941", "Q42956", "Q43382", "Q43387", "Q43418", "Q43433", "Q43453", "Q43475", "Q43509", "Q43595", "Q43631", "Q44013", "Q44016", "Q44162", "Q44198", "Q44206", "Q44208", "Q44211", "Q44213", "Q44214", "Q44217", "Q44236", "Q44237", "Q44238", "Q44239", "Q44240", "Q44242", "Q44243", "Q44253", "Q44254", "Q44401", "Q44948", "Q44950", "Q45197", "Q45301", "Q45313", "Q45604", "Q45797", "Q45942", "Q46135", "Q46319", "Q46702", "Q47034", "Q47048", "Q47138", "Q47166", "Q47264", "Q47282", "Q47492", "Q47554", "Q47571", "Q47952", "Q48278", "Q48285", "Q48288", "Q48290", "Q48293", "Q48338", "Q48403", "Q48472", "Q48814", "Q49218", "Q49303", "Q50816", "Q50968", "Q50991", "Q50992", "Q51003", "Q51049", "Q51093", "Q51098", "Q51103", "Q51111", "Q51408", "Q51427", "Q51432", "Q51441", "Q51594", "Q51679", "Q51878", "Q52101", "Q52506", "Q52578", "Q52585", "Q52591", "Q52602", "Q52603", "Q52828", "Q52829", "Q52840", "Q52842", "Q52845", "Q52850", "Q52892", "Q52893", "Q52896", "Q52898", "Q52900", "Q52902", "Q52903", "Q52981", "Q52998", "Q53543", "Q54118", "Q54119", "Q54880", "Q54884", "Q54886", "Q54902", "Q55377", "Q55378", "Q55385", "Q55630", "Q55855", "Q55862", "Q56064", "Q56069", "Q57278", "Q57924", "Q58349", "Q58462", "Q58794", "Q58797", "Q58900", "Q59086", "Q59101", "Q59473", "Q59698", "Q59975", "Q60425", "Q60956", "Q61089", "Q61092", "Q61301", "Q61302", "Q61320", "Q61394", "Q61432", "Q61434", "Q61445", "Q61944", "Q62677", "Q62823", "Q62868", "Q62937", "Q63092", "Q63233", "Q64181", "Q66568", "Q66616", "Q68144", "Q69060", "Q71037", "Q72125", "Q72248", "Q72259", "Q72571", "Q72818", "Q73022", "Q73639", "Q74176", "Q75621", "Q79305", "Q79322", "Q79546", "Q79808", "Q79848", "Q79857", "Q79863", "Q79980", "Q79990", "Q80484", "Q81033", "Q81046", "Q81137", "Q81398", "Q81562", "Q81581", "Q81621", "Q81656", "Q81788", "Q82030", "Q82070", "Q82185", "Q82500", "Q82765", "Q82960", "Q83061", "Q83065", "Q83178", "Q83285", "Q83317", "Q83387", "Q83531", "Q83786", "Q92161", "Q92212", "Q92237", "Q92561", "Q92689", "Q93230", "Q93323", "Q93338", "Q93347", "Q99648", "Q100188", "Q101254", "Q101418", "Q101530", "Q101625", "Q101704", "Q102317", "Q102350", "Q102397", "Q103011", "Q103217", "Q103717", "Q103725", "Q103892", "Q104302", "Q104712", "Q104720", "Q104725", "Q104731", "Q104740", "Q105037", "Q105048", "Q105060", "Q105084", "Q106115", "Q106122", "Q106274", "Q106583", "Q106896", "Q107094", "Q107106", "Q107398", "Q108223", "Q108672", "Q108679", "Q109092", "Q109386", "Q109494", "Q109535", "Q109949", "Q110011", "Q110218", "Q110732", "Q112657", "Q112817", "Q113464", "Q114093", "Q114257", "Q114970", "Q114977", "Q114984", "Q115006", "Q115256", "Q115276", "Q115323", "Q115329", "Q115382", "Q115403", "Q115465", "Q116156", "Q116341", "Q116524", "Q117040", "Q117625", "Q117731", "Q118910", "Q118995", "Q120641", "Q120740", "Q121551", "Q122044", "Q122758", "Q122803", "Q123160", "Q123196", "Q123438", "Q123511", "Q123709", "Q124385", "Q124739", "Q124919", "Q125080", "Q125293", "Q125434", "Q125646", "Q125924", "Q126084", "Q126148", "Q126269", "Q126308", "Q126415", "Q126805", "Q126898", "Q127041", "Q127063", "Q127623", "Q128139", "Q128147", "Q129259", "Q129352", "Q129610", "Q129649", "Q129789", "Q130191", "Q130212", "Q130228", "Q130238", "Q130469", "Q130514", "Q130536", "Q130800", "Q131127", "Q131128", "Q131233", "Q131243", "Q131323", "Q131495", "Q131605", "Q131612", "Q131638", "Q131694", "Q131818", "Q132043", "Q132189", "Q132409", "Q132671", "Q132679", "Q132754", "Q133073", "Q133116", "Q133118", "Q133123", "Q133315", "Q134086", "Q134121", "Q134287", "Q134291", "Q134509", "Q134514", "Q134620", "Q134672", "Q134703", "Q134712", "Q134902", "Q135432", "Q135864", "Q135970", "Q135975", "Q135983", "Q135993", "Q136217", "Q136818", "Q137203", "Q137271", "Q137863", "Q138833", "Q138986", "Q139045", "Q139242", "Q139248", "Q139706", "Q139725", "Q140075", "Q140304", "Q140314", "Q140476", "Q140631", "Q141263", "Q141687", "Q142101", "Q142778", "Q143892", "Q144416", "Q144773", "Q144845", "Q144983", "Q145002", "Q145127", "Q145715", "Q145764", "Q145865", "Q145972", "Q146307", "Q146342", "Q146356", "Q146509", "Q146723", "Q147089", "Q147196", "Q147243", "Q147402", "Q147548", "Q147697", "Q147750", "Q147782", "Q147934", "Q147975", "Q148062", "Q148327", "Q148615", "Q148947", "Q148956", "Q149111", "Q149155", "Q149411", "Q149955", "Q151920", "Q152368", "Q152374", "Q152379", "Q152385", "Q152387", "Q152396", "Q152406", "Q152413", "Q152418", "Q152436", "Q152449", "Q152462", "Q152467", "Q152473", "Q152491", "Q152501", "Q152567", "Q152593", "Q152602", "Q152659", "Q152831", "Q152902", "Q153331", "Q153511", "Q154897", "Q155277", "Q155530", "Q155915", "Q155993", "Q156713", "Q156858", "Q156974", "Q157024", "Q157032", "Q157034", "Q157050", "Q157058", "Q157246", "Q157516", "Q157915", "Q158004", "Q158006", "Q158079", "Q158088", "Q158119", "Q158242", "Q158467", "Q158485", "Q158488", "Q158903", "Q159325", "Q159610", "Q159835", "Q160450", "Q160493", "Q160544", "Q160642", "Q160884", "Q160927", "Q161893", "Q161905", "Q161909", "Q161912", "Q161914", "Q161945", "Q162279", "Q162411", "Q162442", "Q162548", "Q162782", "Q163352", "Q163464", "Q163490", "Q163584", "Q163607", "Q163798", "Q164003", "Q164023", "Q164197", "Q164241", "Q164954", "Q165066", "Q165090", "Q165140", "Q165204", "Q165285", "Q165380", "Q165413", "Q165422", "Q165444", "Q165450", "Q165736", "Q165867", "Q165988", "Q165995", "Q166002", "Q166065", "Q166427", "Q166717", "Q166824", "Q166838", "Q167235", "Q167301", "Q167394", "Q167551", "Q167582", "Q167594", "Q167617", "Q167632", "Q167649", "Q167659", "Q167677", "Q167715", "Q167731", "Q167744", "Q167749", "Q167800", "Q167895", "Q167974", "Q168140", "Q168162", "Q168176", "Q168193", "Q168197", "Q168202", "Q168215", "Q168225", "Q168245", "Q168330", "Q168337", "Q168824", "Q168866", "Q168902", "Q168905", "Q168954", "Q168965", "Q169160", "Q169224", "Q169247", "Q170115", "Q170244", "Q170263", "Q170287", "Q170313", "Q170315", "Q170457", "Q170497", "Q170507", "Q170525", "Q170532", "Q170616", "Q170642", "Q170660", "Q170663", "Q170668", "Q170688", "Q170693", "Q170711", "Q170714", "Q170715", "Q170717", "Q170724", "Q170725", "Q170727", "Q170730", "Q170732", "Q170755", "Q170816", "Q170919", "Q170967", "Q171012", "Q171031", "Q171032", "Q171065", "Q171080", "Q171101", "Q171219", "Q171223", "Q171632", "Q171639", "Q171771", "Q171810", "Q172157", "Q172251", "Q172343", "Q172415", "Q172438", "Q172581", "Q172597", "Q172996", "Q173037", "Q173121", "Q173270", "Q173310", "Q173338", "Q173532", "Q173545", "Q173690", "Q173731", "Q173985", "Q174002", "Q174019", "Q174060", "Q174237", "Q174262", "Q174266", "Q174341", "Q174684", "Q174916", "Q175191", "Q175262", "Q175323", "Q175596", "Q175617", "Q175651", "Q175903", "Q175923", "Q176086", "Q176728", "Q176823", "Q176924", "Q177880", "Q178067", "Q178168", "Q178405", "Q178582", "Q178663", "Q178835", "Q178931", "Q178948", "Q179007", "Q179046", "Q179290", "Q179351", "Q179701", "Q179815", "Q179843", "Q180057", "Q180084", "Q180139", "Q180176", "Q180233", "Q180294", "Q180333", "Q180522", "Q180803", "Q180810", "Q180921", "Q181379", "Q181557", "Q181854", "Q181966", "Q182009", "Q182025", "Q182049", "Q182059", "Q182092", "Q182299", "Q182481", "Q182521", "Q182625", "Q182892", "Q182923", "Q182984", "Q183104", "Q183124", "Q183199", "Q183298", "Q183303", "Q183405", "Q183551", "Q183584", "Q183651", "Q184046", "Q184090", "Q184163", "Q184184", "Q184459", "Q184539", "Q184864", "Q185066", "Q185084", "Q185134", "Q185156", "Q185280", "Q185336", "Q185345", "Q185346", "Q185404", "Q185453", "Q185518", "Q185555", "Q185689", "Q186040", "Q186056", "Q186141", "Q186142", "Q186182", "Q186234", "Q186237", "Q186362", "Q186441", "Q186935", "Q187284", "Q187346", "Q187352", "Q187593", "Q187861", "Q187895", "Q187961", "Q188022", "Q188304", "Q188336", "Q188693", "Q188894", "Q189059", "Q189128", "Q189133", "Q189134", "Q189138", "Q189157", "Q189273", "Q189383", "Q189392", "Q189471", "Q189546", "Q189685", "Q189697", "Q189715", "Q189792", "Q189901", "Q189969", "Q190005", "Q190021", "Q190113", "Q190165", "Q190184", "Q190235", "Q190583", "Q190828", "Q190847", "Q190897", "Q191015", "Q191047", "Q191170", "Q191204", "Q191376", "Q191415", "Q191687", "Q191718", "Q191805", "Q192155", "Q192176", "Q192213", "Q192225", "Q192235", "Q192378", "Q192379", "Q192508", "Q192518", "Q192773", "Q192807", "Q192870", "Q192896", "Q192898", "Q192918", "Q192961", "Q192980", "Q193103", "Q193180", "Q193229", "Q193250", "Q193289", "Q193367", "Q193409", "Q193445", "Q193452", "Q193478", "Q193486", "Q193787", "Q193802", "Q193821", "Q193920", "Q194146", "Q194164", "Q194165", "Q194452", "Q195410", "Q195492", "Q195531", "Q196163", "Q198444", "Q198989", "Q199500", "Q199528", "Q199605", "Q199712", "Q199723", "Q199762", "Q199909", "Q199970", "Q200019", "Q200028", "Q200030", "Q200036", "Q200049", "Q200054", "Q200061", "Q200078", "Q200119", "Q200122", "Q200123", "Q200133", "Q200166", "Q200237", "Q200663", "Q200709", "Q200713", "Q200718", "Q200733", "Q200805", "Q200878", "Q200908", "Q200951", "Q200999", "Q201051", "Q201095", "Q201101", "Q201186", "Q201342", "Q201442", "Q201613", "Q201631", "Q201722", "Q201832", "Q202158", "Q202162", "Q202188", "Q202195", "Q202453", "Q202776", "Q202852", "Q202889", "Q202973", "Q203000", "Q203040", "Q203197", "Q203299", "Q203301", "Q203370", "Q203380", "Q203476", "Q203619", "Q203675", "Q203995", "Q204234", "Q204266", "Q204271", "Q204317", "Q204365", "Q204381", "Q204382", "Q204391", "Q204434", "Q204439", "Q204472", "Q204709", "Q204720", "Q204905", "Q204957", "Q204966", "Q205119", "Q205327", "Q205632", "Q205648", "Q205792", "Q205832", "Q205905", "Q205942", "Q206125", "Q206317", "Q206484", "Q206687", "Q206760", "Q206879", "Q206881", "Q206885", "Q206891", "Q206895", "Q206900", "Q206954", "Q206957", "Q207098", "Q207100", "Q207223", "Q207259", "Q207295", "Q207322", "Q207324", "Q207350", "Q207371", "Q207467", "Q207470", "Q207540", "Q207639", "Q207749", "Q207752", "Q207753", "Q207754", "Q207756", "Q207801", "Q207891", "Q207972", "Q207998", "Q207999", "Q208005", "Q208006", "Q208015", "Q208022", "Q208038", "Q208097", "Q208098", "Q208151", "Q208162", "Q208200", "Q208287", "Q208293", "Q208318", "Q208352", "Q208403", "Q208472", "Q208473", "Q208715", "Q208718", "Q208725", "Q208948", "Q209009", "Q209034", "Q209176", "Q209393", "Q209423", "Q209537", "Q209698", "Q209925", "Q209978", "Q210007", "Q210161", "Q210197", "Q210292", "Q210296", "Q210307", "Q210470", "Q210985", "Q210987", "Q211020", "Q211070", "Q211073", "Q211195", "Q211218", "Q211252", "Q211318", "Q211343", "Q211563", "Q211590", "Q211805", "Q211811", "Q211828", "Q211867", "Q211950", "Q211952", "Q211970", "Q212283", "Q212289", "Q212332", "Q212546", "Q212680", "Q212686", "Q212757", "Q212773", "Q212841", "Q212856", "Q212984", "Q213014", "Q213026", "Q213127", "Q213248", "Q213898", "Q214021", "Q214057", "Q214173", "Q214178", "Q214212", "Q214248", "Q214303", "Q214344", "Q214347", "Q214485", "Q214495", "Q214651", "Q214655", "Q214681", "Q214777", "Q215080", "Q215238", "Q215277", "Q215633", "Q215826", "Q216075", "Q216307", "Q216363", "Q216638", "Q216790", "Q216835", "Q216847", "Q216853", "Q216900", "Q216902", "Q216912", "Q216939", "Q216990", "Q217040", "Q217071", "Q217125", "Q217156", "Q217426", "Q217443", "Q217720", "Q217990", "Q218768", "Q218861", "Q218954", "Q219039", "Q219093", "Q219117", "Q219382", "Q219417", "Q219547", "Q219583", "Q219664", "Q219671", "Q220049", "Q220843", "Q221436", "Q221447", "Q221734", "Q221914", "Q221921", "Q222267", "Q222755", "Q223314", "Q223587", "Q223761", "Q223914", "Q223917", "Q223920", "Q223966", "Q225641", "Q227072", "Q227156", "Q227509", "Q228153", "Q228405", "Q229677", "Q230104", "Q230368", "Q230628", "Q230818", "Q231167", "Q231765", "Q232842", "Q233467", "Q234056", "Q234178", "Q234184", "Q234600", "Q235571", "Q236083", "Q236673", "Q237847", "Q238217", "Q238452", "Q238508", "Q239097", "Q239107", "Q239266", "Q239421", "Q239580", "Q241122", "Q241767", "Q242059", "Q242144", "Q242497", "Q242587", "Q242895", "Q242898", "Q242992", "Q242995", "Q243319", "Q243322", "Q243325", "Q243327", "Q243456", "Q243699", "Q243846", "Q243859", "Q244004", "Q244139", "Q244154", "Q244159", "Q244230", "Q244236", "Q244509", "Q244652", "Q244745", "Q244747", "Q244898", "Q245023", "Q246069", "Q246139", "Q246145", "Q246288", "Q246554", "Q246590", "Q246685", "Q246693", "Q246956", "Q247128", "Q247248", "Q248144", "Q249022", "Q249049", "Q249059", "Q249122", "Q249226", "Q249259", "Q249480", "Q249884", "Q249941", "Q249994", "Q249996", "Q250276", "Q250531", "Q250733", "Q251181", "Q251329", "Q251678", "Q251929", "Q253903", "Q255008", "Q255385", "Q255455", "Q255780", "Q256060", "Q256711", "Q256782", "Q257326", "Q258447", "Q259030", "Q259272", "Q259489", "Q259497", "Q259636", "Q260317", "Q260547", "Q260911", "Q261076", "Q261243", "Q261705", "Q261711", "Q261887", "Q261892", "Q262579", "Q263684", "Q263808", "Q263877", "Q263922", "Q264075", "Q264172", "Q264464", "Q264679", "Q265115", "Q266896", "Q268247", "Q269168", "Q269222", "Q269899", "Q269960", "Q269980", "Q270041", "Q270176", "Q270225", "Q270297", "Q270310", "Q270500", "Q270535", "Q270734", "Q270754", "Q270787", "Q270821", "Q271083", "Q271404", "Q271564", "Q271733", "Q271771", "Q271911", "Q272362", "Q272471", "Q272680", "Q272795", "Q272978", "Q272992", "Q273030", "Q273413", "Q273779", "Q274120", "Q274584", "Q275592", "Q275630", "Q275635", "Q275694", "Q275919", "Q276537", "Q276746", "Q276747", "Q276857", "Q277372", "Q277505", "Q277674", "Q277936", "Q277966", "Q278204", "Q278613", "Q279009", "Q279048", "Q279951", "Q280243", "Q280407", "Q280709", "Q280853", "Q280929", "Q280950", "Q281016", "Q281057", "Q281104", "Q281186", "Q281205", "Q281213", "Q281932", "Q282380", "Q283368", "Q283658", "Q284308", "Q284529", "Q284604", "Q285672", "Q286554", "Q286563", "Q286696", "Q287136", "Q287731", "Q288864", "Q289267", "Q289328", "Q289693", "Q290504", "Q291729", "Q291912", "Q297060", "Q300577", "Q301627", "Q301924", "Q302099", "Q302268", "Q302654", "Q302745", "Q302912", "Q303160", "Q305067", "Q305154", "Q305508", "Q305542", "Q305697", "Q309164", "Q309348", "Q309355", "Q309442", "Q309475", "Q310114", "Q310117", "Q310350", "Q310751", "Q310772", "Q310844", "Q310892", "Q310893", "Q310895", "Q311099", "Q311199", "Q311321", "Q311326", "Q311862", "Q311946", "Q312209", "Q312723", "Q312759", "Q316211", "Q317145", "Q318156", "Q318245", "Q318418", "Q318686", "Q319272", "Q319366", "Q319476", "Q319660", "Q319729", "Q319813", "Q320519", "Q320704", "Q320792", "Q321079", "Q321279", "Q321475", "Q322126", "Q322149", "Q322155", "Q322828", "Q322917", "Q322986", "Q323801", "Q323873", "Q323986", "Q324394", "Q324880", "Q324884", "Q324888", "Q324892", "Q324897", "Q324903", "Q324907", "Q324927", "Q324934", "Q324941", "Q324971", "Q325124", "Q325244", "Q325550", "Q325627", "Q325631", "Q325910", "Q326123", "Q326142", "Q326577", "Q327348", "Q327413", "Q328030", "Q328153", "Q328176", "Q328402", "Q329503", "Q329597", "Q329984", "Q330531", "Q330643", "Q331099", "Q331384", "Q331764", "Q332319", "Q333074", "Q333476", "Q333928", "Q334577", "Q335322", "Q335446", "Q335478", "Q335548", "Q335596", "Q335708", "Q335716", "Q335769", "Q336350", "Q336375", "Q336386", "Q336448", "Q336661", "Q336724", "Q336966", "Q337123", "Q337530", "Q337539", "Q337683", "Q337751", "Q337814", "Q338059", "Q338696", "Q338844", "Q339258", "Q339527", "Q340566", "Q340572", "Q343973", "Q345163", "Q345204", "Q345233", "Q345243", "Q345316", "Q345339", "Q345386", "Q345389", "Q346649", "Q351427", "Q356811", "Q356816", "Q357101", "Q359955", "Q364601", "Q365146", "Q366010", "Q395201", "Q395433", "Q395863", "Q396807", "Q397826", "Q398365", "Q399083", "Q399270", "Q399316", "Q399322", "Q403112", "Q403166", "Q403446", "Q403929", "Q403941", "Q406033", "Q412703", "Q413747", "Q415943", "Q416835", "Q418402", "Q422197", "Q422286", "Q423258", "Q423831", "Q424704", "Q424773", "Q425646", "Q426891", "Q427693", "Q428006", "Q429059", "Q429063", "Q429215", "Q429741", "Q429855", "Q429864", "Q430470", "Q430776", "Q430862", "Q431533", "Q431628", "Q432353", "Q432397", "Q433632", "Q433861", "Q446394", "Q447844", "Q448120", "Q448370", "Q450625", "Q451529", "Q451589", "Q451850", "Q454510", "Q454756", "Q454982", "Q455231", "Q455701", "Q456577", "Q456624", "Q456642", "Q456842", "Q457334", "Q457697", "Q457865", "Q459360", "Q459369", "Q459553", "Q459600", "Q459714", "Q460222", "Q460697", "Q460736", "Q460925", "Q460971", "Q461287", "Q461307", "Q461313", "Q461922", "Q462766", "Q463165", "Q463252", "Q463384", "Q464699", "Q464904", "Q465022", "Q466221", "Q467501", "Q467632", "Q468782", "Q470445", "Q470481", "Q471886", "Q472621", "Q472822", "Q472925", "Q473078", "Q473144", "Q474651", "Q474669", "Q474868", "Q475066", "Q475802", "Q476436", "Q476688", "Q476800", "Q477148", "Q477152", "Q477232", "Q477238", "Q477580", "Q477955", "Q478031", "Q478066", "Q478207", "Q478518", "Q478675", "Q481427", "Q482858", "Q483331", "Q483522", "Q484552", "Q484706", "Q484799", "Q485198", "Q485329", "Q485496", "Q486195", "Q486282", "Q486329", "Q486913", "Q487439", "Q487672", "Q487681", "Q487684", "Q487689", "Q487801", "Q487981", "Q488004", "Q488030", "Q488052", "Q488379", "Q488987", "Q489236", "Q489569", "Q489660", "Q489679", "Q489776", "Q489898", "Q490573", "Q490579", "Q490643", "Q490708", "Q490878", "Q490883", "Q490991", "Q491102", "Q491521", "Q491603", "Q491829", "Q491879", "Q492312", "Q492552", "Q493472", "Q493634", "Q494693", "Q495387", "Q495547", "Q495730", "Q496368", "Q496442", "Q496567", "Q497115", "Q497130", "Q497154", "Q497373", "Q497445", "Q497793", "Q498048", "Q498192", "Q498968", "Q499318", "Q499375", "Q500080", "Q500111", "Q500189", "Q500366", "Q500552", "Q500560", "Q500641", "Q500877", "Q500888", "Q501077", "Q501090", "Q501543", "Q501656", "Q501715", "Q502023", "Q502141", "Q502216", "Q502272", "Q503379", "Q503469", "Q503862", "Q504114", "Q504215", "Q504394", "Q504657", "Q505416", "Q506578", "Q506745", "Q506775", "Q506811", "Q507080", "Q507144", "Q509739", "Q510413", "Q510827", "Q510842", "Q511956", "Q512111", "Q512116", "Q513727", "Q515117", "Q515229", "Q515240", "Q516116", "Q516416", "Q516769", "Q518431", "Q518785", "Q518791", "Q519026", "Q520600", "Q520687", "Q520821", "Q520858", "Q521322", "Q521702", "Q521851", "Q522912", "Q523000", "Q523287", "Q523394", "Q523618", "Q523657", "Q523778", "Q524851", "Q525118", "Q525817", "Q526169", "Q526539", "Q526568", "Q526757", "Q526822", "Q527268", "Q527318", "Q527748", "Q527768", "Q528432", "Q528679", "Q528941", "Q529282", "Q529834", "Q530171", "Q530191", "Q530309", "Q530644", "Q532102", "Q533922", "Q534409", "Q536826", "Q537161", "Q537462", "Q539154", "Q540844", "Q540895", "Q541435", "Q541656", "Q542678", "Q542966", "Q543800", "Q544701", "Q544733", "Q545707", "Q545767", "Q546010", "Q546955", "Q546964", "Q547381", "Q548210", "Q548248", "Q548441", "Q548805", "Q550407", "Q551422", "Q552390", "Q554417", "Q554824", "Q554829", "Q555042", "Q555053", "Q555150", "Q555876", "Q556095", "Q556193", "Q556344", "Q556484", "Q556944", "Q557257", "Q557306", "Q557383", "Q557397", "Q557529", "Q557643", "Q557906", "Q558195", "Q558579", "Q558614", "Q558719", "Q558723", "Q559793", "Q559801", "Q563067", "Q565568", "Q567332", "Q567350", "Q567827", "Q568137", "Q568212", "Q568905", "Q569766", "Q569804", "Q569838", "Q569904", "Q569938", "Q570108", "Q571185", "Q571215", "Q571968", "Q572013", "Q572041", "Q572152", "Q572380", "Q572951", "Q574469", "Q574555", "Q574593", "Q575774", "Q576368", "Q578026", "Q578396", "Q579199", "Q579291", "Q579689", "Q579702", "Q580017", "Q580533", "Q580743", "Q580965", "Q580968", "Q580973", "Q581179", "Q581187", "Q581379", "Q582043", "Q583184", "Q583445", "Q583619", "Q583818", "Q583982", "Q584001", "Q584008", "Q584295", "Q584494", "Q584515", "Q584605", "Q584966", "Q585153", "Q586498", "Q586758", "Q587085", "Q588048", "Q588587", "Q589067", "Q589108", "Q589163", "Q590115", "Q590133", "Q590361", "Q591213", "Q591791", "Q592262", "Q592609", "Q592809", "Q593156", "Q593193", "Q593256", "Q593435", "Q593652", "Q593695", "Q595441", "Q595542", "Q596012", "Q596688", "Q597086", "Q597122", "Q597458", "Q597843", "Q598658", "Q598667", "Q598676", "Q599416", "Q599533", "Q599897", "Q599929", "Q600405", "Q600680", "Q600706", "Q600883", "Q600893", "Q600959", "Q601142", "Q602426", "Q602564", "Q602729", "Q603115", "Q603136", "Q603146", "Q603163", "Q603592", "Q604251", "Q604283", "Q604717", "Q605113", "Q605160", "Q605167", "Q605235", "Q605267", "Q605318", "Q605427", "Q605483", "Q605544", "Q606126", "Q606153", "Q606162", "Q606169", "Q606288", "Q606307", "Q606324", "Q606335", "Q606357", "Q606385", "Q606485", "Q607132", "Q607167", "Q608073", "Q608376", "Q608752", "Q608985", "Q609024", "Q609246", "Q609395", "Q609649", "Q609892", "Q610600", "Q610917", "Q611086", "Q611297", "Q611784", "Q612160", "Q612250", "Q612328", "Q613003", "Q613246", "Q613441", "Q613529", "Q613701", "Q613791", "Q613913", "Q614055", "Q614072", "Q614754", "Q615006", "Q615244", "Q615470", "Q615633", "Q615707", "Q615791", "Q616404", "Q616551", "Q616583", "Q616877", "Q616895", "Q616927", "Q617032", "Q617535", "Q617624", "Q617987", "Q366948", "Q367273", "Q367780", "Q367842", "Q368320", "Q369699", "Q370254", "Q371532", "Q372075", "Q372773", "Q372920", "Q373059", "Q373808", "Q373865", "Q374013", "Q374465", "Q374748", "Q374768", "Q374795", "Q375507", "Q376295", "Q376903", "Q377396", "Q377588", "Q377696", "Q377965", "Q377975", "Q377994", "Q378649", "Q378821", "Q378879", "Q379338", "Q379509", "Q379669", "Q381560", "Q382249", "Q382587", "Q383170", "Q383434", "Q384433", "Q384544", "Q384755", "Q384774", "Q384944", "Q385070", "Q385085", "Q385155", "Q385229", "Q385341", "Q385825", "Q386626", "Q386659", "Q386858", "Q386991", "Q387095", "Q387117", "Q387194", "Q387260", "Q387307", "Q387396", "Q387463", "Q387502", "Q387591", "Q388108", "Q388242", "Q388575", "Q389412", "Q389860", "Q390096", "Q390162", "Q390605", "Q390783", "Q390897", "Q390969", "Q391011", "Q391125", "Q391221", "Q391461", "Q391582", "Q391599", "Q391626", "Q391747", "Q391764", "Q392772", "Q392988", "Q393043", "Q393091", "Q393119", "Q393138", "Q393171", "Q393220", "Q393228", "Q393332", "Q393495", "Q393498", "Q393594", "Q393829", "Q394080", "Q394756", "Q394888", "Q653855", "Q654169", "Q654259", "Q655210", "Q655412", "Q655771", "Q655956", "Q656189", "Q656988", "Q657072", "Q657428", "Q657637", "Q657734", "Q657744", "Q657763", "Q658168", "Q658230", "Q659435", "Q659642", "Q659905", "Q661529", "Q661548", "Q664156", "Q664371", "Q664550", "Q664599", "Q666831", "Q667224", "Q667576", "Q667588", "Q667650", "Q667828", "Q667845", "Q668180", "Q668322", "Q668462", "Q668616", "Q671062", "Q671366", "Q671431", "Q671704", "Q672458", "Q673185", "Q673275", "Q674175", "Q674320", "Q676778", "Q676931", "Q677300", "Q678425", "Q678980", "Q679056", "Q679169", "Q679238", "Q679745", "Q680596", "Q681893", "Q681999", "Q683512", "Q683525", "Q683938", "Q685330", "Q685509", "Q685808", "Q685941", "Q686167", "Q686736", "Q686813", "Q688539", "Q688654", "Q689820", "Q690052", "Q690062", "Q690333", "Q691016", "Q693093", "Q693140", "Q693554", "Q693913", "Q693929", "Q694109", "Q694939", "Q695330", "Q695425", "Q695623", "Q695631", "Q696193", "Q696605", "Q697662", "Q698941", "Q700050", "Q701606", "Q701651", "Q703139", "Q704371", "Q704978", "Q705699", "Q705705", "Q705829", "Q705867", "Q618060", "Q618643", "Q619594", "Q619937", "Q620625", "Q620804", "Q621001", "Q621181", "Q621925", "Q622030", "Q622592", "Q622780", "Q622841", "Q623159", "Q623298", "Q623504", "Q624467", "Q624740", "Q625134", "Q626031", "Q626295", "Q626670", "Q626861", "Q627392", "Q627885", "Q630533", "Q630692", "Q630805", "Q631087", "Q631325", "Q631483", "Q632361", "Q633929", "Q634063", "Q634698", "Q635045", "Q636209", "Q637500", "Q637555", "Q638509", "Q638621", "Q638695", "Q638704", "Q638725", "Q639212", "Q639241", "Q639340", "Q639408", "Q639421", "Q639467", "Q639674", "Q640223", "Q640368", "Q640453", "Q640493", "Q641130", "Q641706", "Q642109", "Q642164", "Q642192", "Q642631", "Q642696", "Q642787", "Q643025", "Q643028", "Q643047", "Q643052", "Q643059", "Q643074", "Q643081", "Q643112", "Q643313", "Q643617", "Q643761", "Q643883", "Q644079", "Q644663", "Q644799", "Q645725", "Q646498", "Q646684", "Q646809", "Q647051", "Q647417", "Q647543", "Q647982", "Q648215", "Q648567", "Q648709", "Q648732", "Q650018", "Q650208", "Q650394", "Q650951", "Q651744", "Q652376", "Q653420", "Q653797", "Q653808", "Q653844", "Q705884", "Q706029", "Q706105", "Q707030", "Q707848", "Q709254", "Q709319", "Q711386", "Q711996", "Q712015", "Q712356", "Q712521", "Q712567", "Q712644", "Q713088", "Q713146", "Q713377", "Q714606", "Q714617", "Q715199", "Q715385", "Q717371", "Q717399", "Q717404", "Q717684", "Q717774", "Q717933", "Q717938", "Q717942", "Q717947", "Q718038", "Q718108", "Q719954", "Q720842", "Q721374", "Q721678", "Q722522", "Q722827", "Q722997", "Q723246", "Q723584", "Q723588", "Q723677", "Q724474", "Q724815", "Q726751", "Q727233", "Q727464", "Q728226", "Q728412", "Q728519", "Q729978", "Q730791", "Q730806", "Q731020", "Q731256", "Q732759", "Q732801", "Q732879", "Q733005", "Q733093", "Q733155", "Q733744", "Q734284", "Q735133", "Q735138", "Q735563", "Q735583", "Q735609", "Q735645", "Q735765", "Q735815", "Q736061", "Q736905", "Q737270", "Q737375", "Q737790", "Q737984", "Q738353", "Q738563", "Q738748", "Q738901", "Q739353", "Q739664", "Q739808", "Q740050", "Q740236", "Q740246", "Q740477", "Q740499", "Q740687", "Q740756", "Q740832", "Q740865", "Q741134", "Q741667", "Q741876", "Q741991", "Q742128", "Q742720", "Q742835", "Q742854", "Q743016", "Q743218", "Q743282", "Q743910", "Q744239", "Q744673", "Q744704", "Q745567", "Q745871", "Q745906", "Q746041", "Q746395", "Q746407", "Q746773", "Q747140", "Q747362", "Q747470", "Q747796", "Q747840", "Q747898", "Q748028", "Q748037", "Q748336", "Q748513", "Q748533", "Q748832", "Q749170", "Q749187", "Q749372", "Q749623", "Q750679", "Q751077", "Q751153", "Q751418", "Q752113", "Q752262", "Q752267", "Q753121", "Q753642", "Q753752", "Q753906", "Q754480", "Q754592", "Q754724", "Q755752", "Q755763", "Q755765", "Q755791", "Q755860", "Q756645", "Q756649", "Q757133", "Q757401", "Q757855", "Q757873", "Q757905", "Q759204", "Q759348", "Q760146", "Q760153", "Q760235", "Q760714", "Q761408", "Q761508", "Q762430", "Q762656", "Q762727", "Q763015", "Q763595", "Q763662", "Q763770", "Q764030", "Q764231", "Q764359", "Q764943", "Q764968", "Q765521", "Q765820", "Q765887", "Q766309", "Q766464", "Q766735", "Q768086", "Q768416", "Q768591", "Q768689", "Q768920", "Q769578", "Q769631", "Q770184", "Q770309", "Q770336", "Q770447", "Q770518", "Q770653", "Q771267", "Q771345", "Q771907", "Q772458", "Q772875", "Q773225", "Q773227", "Q773238", "Q773603", "Q773764", "Q774098", "Q774264", "Q774352", "Q774405", "Q775087", "Q775610", "Q776418", "Q776499", "Q776887", "Q776930", "Q776965", "Q777028", "Q777091", "Q777169", "Q777802", "Q778941", "Q780529", "Q780534", "Q780771", "Q780815", "Q781245", "Q781249", "Q781354", "Q781403", "Q782278", "Q782743", "Q782760", "Q782857", "Q783749", "Q783984", "Q785823", "Q785888", "Q786124", "Q786758", "Q787824", "Q787968", "Q790314", "Q791636", "Q791685", "Q791766", "Q792199", "Q792713", "Q793377", "Q793765", "Q793809", "Q794668", "Q794712", "Q794813", "Q794958", "Q796497", "Q796664", "Q796669", "Q797036", "Q797132", "Q797499", "Q797568", "Q797696", "Q797713", "Q797756", "Q798382", "Q798765", "Q799788", "Q799790", "Q799794", "Q799808", "Q799920", "Q800009", "Q800122", "Q800155", "Q803712", "Q803960", "Q803984", "Q803986", "Q803990", "Q804117", "Q804289", "Q804607", "Q804654", "Q805515", "Q805876", "Q805946", "Q806082", "Q806249", "Q806424", "Q806478", "Q806551", "Q806552", "Q806916", "Q806929", "Q807271", "Q807311", "Q807901", "Q807991", "Q808036", "Q808100", "Q808344", "Q808365", "Q808981", "Q809428", "Q809657", "Q809660", "Q809664", "Q809787", "Q809821", "Q810474", "Q810710", "Q810807", "Q811130", "Q811144", "Q811831", "Q812706", "Q812717", "Q814033", "Q814922", "Q815044", "Q815053", "Q815370", "Q815721", "Q815777", "Q815782", "Q816187", "Q816341", "Q816364", "Q816699", "Q816845", "Q817118", "Q817218", "Q817247", "Q817269", "Q817279", "Q818019", "Q818403", "Q818765", "Q818824", "Q819123", "Q819314", "Q819387", "Q820024", "Q820224", "Q820235", "Q820972", "Q821023", "Q821321", "Q822196", "Q822679", "Q822808", "Q822815", "Q824043", "Q824594", "Q825818", "Q826068", "Q826112", "Q827047", "Q827640", "Q829842", "Q829886", "Q830390", "Q830631", "Q833016", "Q833866", "Q833946", "Q834189", "Q834310", "Q835000", "Q835423", "Q835838", "Q835843", "Q835848", "Q835856", "Q836527", "Q836961", "Q837035", "Q837062", "Q837807", "Q838954", "Q840712", "Q840962", "Q841086", "Q841342", "Q841557", "Q842200", "Q842228", "Q842347", "Q842355", "Q842360", "Q842373", "Q842407", "Q842472", "Q842779", "Q842806", "Q842810", "Q842854", "Q842869", "Q843138", "Q843868", "Q844091", "Q844417", "Q844423", "Q844430", "Q844878", "Q844914", "Q845097", "Q845266", "Q845662", "Q845717", "Q845720", "Q845866", "Q846502", "Q846939", "Q847315", "Q847606", "Q847668", "Q847677", "Q847691", "Q847715", "Q848403", "Q848638", "Q849292", "Q849524", "Q849561", "Q849835", "Q849934", "Q851576", "Q851946", "Q852238", "Q852272", "Q852276", "Q852363", "Q852469", "Q852515", "Q852528", "Q852550", "Q853258", "Q853261", "Q853708", "Q853785", "Q853945", "Q854109", "Q854333", "Q854624", "Q854791", "Q854934", "Q855122", "Q855330", "Q855634", "Q855645", "Q855717", "Q855724", "Q855820", "Q855940", "Q855976", "Q855997", "Q856028", "Q856151", "Q856162", "Q856662", "Q857331", "Q857577", "Q857612", "Q858120", "Q858130", "Q858250", "Q858312", "Q858501", "Q858713", "Q859133", "Q859319", "Q859708", "Q860179", "Q860452", "Q860689", "Q861194", "Q861248", "Q861630", "Q861701", "Q861827", "Q862041", "Q862092", "Q862114", "Q862508", "Q862612", "Q863058", "Q863461", "Q863727", "Q863795", "Q864024", "Q864100", "Q864655", "Q865146", "Q865586", "Q865630", "Q865949", "Q867005", "Q923811", "Q924078", "Q924098", "Q924100", "Q924124", "Q924793", "Q925506", "Q925686", "Q926426", "Q926587", "Q927527", "Q927541", "Q927713", "Q927794", "Q927933", "Q928162", "Q928349", "Q929022", "Q929062", "Q929689", "Q930149", "Q930789", "Q931224", "Q931553", "Q932261", "Q932640", "Q932901", "Q933165", "Q933255", "Q934086", "Q934149", "Q934205", "Q934436", "Q934450", "Q934785", "Q935454", "Q935847", "Q935886", "Q936101", "Q936316", "Q936464", "Q936510", "Q937487", "Q938046", "Q938457", "Q938589", "Q938739", "Q938803", "Q938820", "Q938835", "Q939109", "Q939610", "Q939701", "Q939727", "Q939758", "Q939771", "Q940082", "Q940829", "Q940973", "Q941451", "Q941844", "Q941948", "Q941980", "Q943270", "Q943290", "Q943374", "Q944697", "Q945055", "Q945288", "Q945473", "Q945484", "Q945651", "Q946097", "Q946143", "Q946150", "Q946384", "Q946827", "Q946959", "Q947069", "Q947414", "Q948050", "Q948267", "Q948304", "Q948343", "Q948367", "Q948448", "Q949535", "Q949746", "Q949907", "Q950347", "Q950436", "Q950924", "Q950991", "Q951268", "Q951324", "Q951602", "Q951906", "Q952118", "Q952273", "Q952374", "Q952665", "Q952748", "Q953070", "Q953081", "Q953449", "Q953490", "Q953723", "Q954036", "Q954116", "Q954143", "Q954157", "Q954186", "Q954300", "Q954748", "Q955523", "Q956117", "Q956371", "Q956602", "Q956690", "Q956745", "Q956893", "Q956911", "Q956922", "Q956932", "Q956954", "Q956966", "Q957326", "Q957530", "Q958586", "Q958621", "Q958747", "Q958899", "Q959021", "Q959508", "Q959528", "Q959859", "Q962774", "Q963947", "Q965360", "Q965754", "Q965924", "Q966350", "Q966592", "Q966990", "Q967547", "Q968211", "Q968765", "Q969144", "Q969396", "Q969880", "Q969998", "Q970536", "Q971555", "Q972113", "Q972756", "Q973385", "Q973407", "Q973781", "Q973908", "Q974009", "Q974239", "Q974354", "Q974977", "Q975904", "Q975960", "Q976223", "Q976318", "Q976847", "Q976955", "Q976975", "Q977149", "Q977255", "Q977305", "Q978419", "Q978780", "Q979021", "Q979808", "Q979980", "Q980895", "Q980917", "Q983435", "Q983540", "Q983726", "Q983729", "Q983871", "Q983896", "Q983983", "Q984274", "Q984462", "Q984538", "Q984575", "Q984646", "Q984701", "Q984755", "Q984765", "Q984786", "Q984788", "Q984857", "Q984858", "Q984863", "Q984900", "Q984927", "Q985005", "Q985386", "Q985458", "Q985459", "Q985462", "Q985467", "Q985528", "Q985531", "Q985548", "Q985562", "Q985614", "Q985618", "Q985622", "Q985627", "Q985642", "Q985646", "Q985649", "Q985661", "Q985669", "Q985674", "Q985687", "Q985803", "Q985991", "Q986089", "Q986100", "Q986130", "Q986207", "Q986288", "Q986325", "Q986336", "Q986387", "Q986406", "Q986409", "Q986429", "Q986435", "Q986578", "Q986763", "Q986821", "Q986841", "Q986875", "Q986912", "Q986966", "Q986984", "Q987012", "Q987160", "Q987193", "Q987235", "Q987471", "Q987745", "Q987748", "Q987754", "Q987786", "Q987986", "Q987997", "Q988169", "Q988179", "Q988185", "Q988225", "Q988485", "Q988574", "Q988576", "Q988582", "Q988586", "Q988588", "Q988593", "Q988602", "Q988604", "Q988612", "Q988622", "Q988628", "Q988632", "Q988636", "Q988638", "Q988639", "Q988644", "Q988651", "Q988658", "Q988663", "Q989283", "Q989297", "Q989419", "Q989423", "Q989427", "Q989432", "Q989441", "Q989492", "Q989498", "Q989561", "Q989801", "Q989863", "Q989973", "Q990095", "Q990115", "Q990122", "Q990186", "Q990188", "Q990427", "Q990569", "Q990573", "Q990651", "Q990657", "Q990685", "Q990698", "Q990706", "Q990709", "Q990738", "Q990746", "Q990764", "Q990779", "Q990785", "Q990791", "Q990795", "Q990799", "Q990808", "Q990816", "Q990823", "Q990828", "Q990830", "Q990837", "Q990841", "Q991006", "Q991022", "Q991036", "Q991201", "Q991268", "Q991291", "Q991295", "Q991298", "Q991310", "Q991318", "Q991363", "Q991395", "Q991400", "Q991408", "Q991435", "Q991590", "Q991797", "Q991819", "Q991829", "Q991840", "Q991849", "Q991866", "Q991887", "Q991895", "Q991912", "Q991917", "Q991924", "Q991929", "Q991962", "Q991973", "Q991998", "Q992136", "Q992154", "Q992162", "Q992173", "Q992247", "Q992265", "Q992364", "Q992829", "Q992910", "Q992920", "Q993076", "Q993149", "Q993200", "Q993322", "Q993697", "Q993721", "Q993859", "Q994061", "Q994085", "Q994096", "Q994105", "Q994114", "Q994203", "Q994217", "Q994245", "Q994255", "Q994271", "Q994312", "Q994351", "Q994514", "Q994585", "Q994662", "Q995141", "Q995145", "Q995159", "Q995163", "Q995172", "Q995249", "Q995413", "Q995429", "Q995690", "Q995695", "Q995707", "Q995718", "Q995727", "Q995752", "Q995806", "Q995820", "Q995828", "Q995839", "Q995847", "Q995855", "Q995859", "Q995865", "Q995872", "Q995877", "Q995889", "Q995903", "Q996478", "Q996670", "Q996730", "Q996786", "Q996851", "Q997047", "Q997069", "Q997084", "Q997121", "Q997314", "Q997402", "Q997447", "Q997821", "Q998476", "Q998813", "Q999070", "Q999076", "Q999269", "Q999384", "Q999482", "Q999498", "Q999572", "Q999598", "Q999604", "Q999607", "Q999614", "Q999623", "Q999632", "Q999638", "Q999644", "Q999654", "Q1000143", "Q1000333", "Q1000341", "Q1000346", "Q1000373", "Q1000438", "Q1000495", "Q1000609", "Q1000839", "Q1000844", "Q1000883", "Q1000887", "Q1000938", "Q1001200", "Q1001307", "Q1001322", "Q1001440", "Q1001496", "Q1001517", "Q1001522", "Q1001571", "Q1001758", "Q1001817", "Q1001887", "Q1001897", "Q1001914", "Q1001927", "Q1001941", "Q1001959", "Q1001989", "Q1001995", "Q1002035", "Q1002052", "Q1002076", "Q1002084", "Q1002105", "Q1002144", "Q1002286", "Q1002533", "Q1002557", "Q1002560", "Q1002580", "Q1002638", "Q1002658", "Q1002670", "Q1002685", "Q1002696", "Q1002776", "Q1002807", "Q1002823", "Q1002841", "Q1002900", "Q1002944", "Q1003016", "Q1003112", "Q1003264", "Q1003267", "Q1003272", "Q1003276", "Q1003279", "Q1003283", "Q1003318", "Q1003328", "Q1003511", "Q1003903", "Q1004048", "Q1004283", "Q1004290", "Q1004295", "Q1004298", "Q1004302", "Q1004312", "Q1004320", "Q1004328", "Q1004686", "Q1004716", "Q1004822", "Q1005350", "Q1005356", "Q1005359", "Q1005384", "Q1005394", "Q1005403", "Q1005409", "Q1005414", "Q1005419", "Q1005428", "Q1005435", "Q1005442", "Q1005453", "Q1005464", "Q1005472", "Q1005483", "Q1005492", "Q1005503", "Q1005511", "Q1005538", "Q1005584", "Q1005725", "Q1005770", "Q1005786", "Q1005827", "Q1005837", "Q1005855", "Q1005885", "Q1005905", "Q1005972", "Q1006065", "Q1006081", "Q1006116", "Q1006137", "Q1006155", "Q1006165", "Q1006240", "Q1006277", "Q1006296", "Q1006303", "Q1006321", "Q1006343", "Q1006350", "Q1006355", "Q1006363", "Q1006764", "Q1006772", "Q1006788", "Q1006813", "Q1007275", "Q1007342", "Q1007355", "Q1007479", "Q1007634", "Q1007647", "Q1007702", "Q1007719", "Q1008008", "Q1008152", "Q1008368", "Q1008390", "Q1008456", "Q1008761", "Q1008853", "Q1008963", "Q1009161", "Q1009179", "Q1009199", "Q1009253", "Q1009276", "Q1009308", "Q1009336", "Q1009509", "Q1009549", "Q1009864", "Q1010153", "Q1010278", "Q1010287", "Q1010367", "Q1010550", "Q1010806", "Q1010816", "Q1010823", "Q1010954", "Q1010960", "Q1010979", "Q1010985", "Q1011011", "Q1011016", "Q1011047", "Q1011210", "Q1011488", "Q1011553", "Q1011669", "Q1011863", "Q1011873", "Q1011882", "Q1011890", "Q1011972", "Q1012706", "Q1012828", "Q1012831", "Q1012862", "Q1012868", "Q1012881", "Q1012887", "Q1012924", "Q1013379", "Q1013389", "Q1013428", "Q1013454", "Q1013526", "Q1013831", "Q1013946", "Q1013965", "Q1014010", "Q1014231", "Q1014235", "Q1014248", "Q1014285", "Q1014306", "Q1014315", "Q1014367", "Q1014375", "Q1014380", "Q1014390", "Q1014409", "Q1014423", "Q1014430", "Q1014433", "Q1014448", "Q1014456", "Q1014461", "Q1014468", "Q1014474", "Q1014481", "Q1014493", "Q1014504", "Q1014511", "Q1014530", "Q1014537", "Q1014543", "Q1014554", "Q1014561", "Q1014564", "Q1014661", "Q1015036", "Q1015069", "Q1015146", "Q1015152", "Q1015157", "Q1015160", "Q1015165", "Q1015172", "Q1015472", "Q1015546", "Q1015618", "Q1015639", "Q1015672", "Q1015681", "Q1015690", "Q1015699", "Q1015727", "Q1015752", "Q1015773", "Q1015796", "Q1015891", "Q1016047", "Q1016289", "Q1016533", "Q1016827", "Q1016873", "Q1016881", "Q1016922", "Q1017098", "Q1017108", "Q1017120", "Q1017129", "Q1017160", "Q1017167", "Q1017183", "Q1017205", "Q1017208", "Q1017210", "Q1017314", "Q1017331", "Q1017358", "Q1017362", "Q1017367", "Q1017369", "Q1017376", "Q1017387", "Q1017430", "Q1017554", "Q1017556", "Q1017594", "Q1017624", "Q1017630", "Q1017637", "Q1017644", "Q1017651", "Q1017662", "Q1017673", "Q1017678", "Q1017683", "Q1017691", "Q1017696", "Q1017710", "Q1017735", "Q1017801", "Q1017895", "Q1017971", "Q1018016", "Q1018092", "Q1018116", "Q1018160", "Q1018163", "Q1018167", "Q1018173", "Q1018201", "Q1018215", "Q1018239", "Q1018271", "Q1018369", "Q1018501", "Q1018524", "Q1018574", "Q1018584", "Q1018592", "Q1018693", "Q1018701", "Q1018781", "Q1018868", "Q1018872", "Q1018877", "Q1019060", "Q1019120", "Q1019152", "Q1019287", "Q1019356", "Q1019377", "Q1019402", "Q1019405", "Q1019424", "Q1019429", "Q1019431", "Q1019443", "Q1019448", "Q1019452", "Q1019466", "Q1019470", "Q1019496", "Q1019505", "Q1019534", "Q1019991", "Q1020010", "Q1020110", "Q1020261", "Q1020263", "Q1020273", "Q1020276", "Q1020277", "Q1020279", "Q1020288", "Q1020292", "Q1020297", "Q1020309", "Q1020314", "Q1020320", "Q1020338", "Q1020384", "Q1020396", "Q1020477", "Q1020481", "Q1020484", "Q1020490", "Q1020535", "Q1020576", "Q1020627", "Q1020649", "Q1020718", "Q1020776", "Q1020785", "Q1020794", "Q1020853", "Q1020969", "Q1020997", "Q1021013", "Q1021223", "Q1021263", "Q1021272", "Q1021277", "Q1021282", "Q1021286", "Q1021294", "Q1021592", "Q1021638", "Q1021800", "Q1021903", "Q1022131", "Q1022152", "Q1022170", "Q1022481", "Q1022488", "Q1022523", "Q1022529", "Q1022535", "Q1022541", "Q1022984", "Q1023044", "Q1023153", "Q1023290", "Q1023330", "Q1023334", "Q1023359", "Q1023393", "Q1023493", "Q1023521", "Q1023540", "Q1023619", "Q1023631", "Q1023655", "Q1023691", "Q1023693", "Q1023703", "Q1023712", "Q1023713", "Q1023718", "Q1023720", "Q1023722", "Q1023746", "Q1023760", "Q1024089", "Q1024157", "Q1024647", "Q1024653", "Q1024667", "Q1024671", "Q1024673", "Q1024676", "Q1024728", "Q1024731", "Q1024793", "Q1025283", "Q1025286", "Q1025299", "Q1025302", "Q1025304", "Q1025309", "Q1025311", "Q1025316", "Q1025320", "Q1025323", "Q1025330", "Q1025336", "Q1025462", "Q1025468", "Q1025475", "Q1025501", "Q1025577", "Q1025587", "Q1025621", "Q1025625", "Q1025701", "Q1025799", "Q1025801", "Q1025805", "Q1025830", "Q1025861", "Q1025873", "Q1025875", "Q1026057", "Q1026135", "Q1026180", "Q1026185", "Q1026219", "Q1026224", "Q1026244", "Q1026253", "Q1026256", "Q1026270", "Q1026281", "Q1026284", "Q1026291", "Q1026296", "Q1026312", "Q1026347", "Q1026436", "Q1026567", "Q1026613", "Q1026616", "Q1026627", "Q1026631", "Q1026633", "Q1026821", "Q1026833", "Q1026878", "Q1026971", "Q1026976", "Q1026982", "Q1026987", "Q1026991", "Q1027004", "Q1027041", "Q1027045", "Q1027111", "Q1027142", "Q1027174", "Q1027188", "Q1027526", "Q1027623", "Q1027828", "Q1027843", "Q1028011", "Q1028027", "Q1028279", "Q1028289", "Q1029634", "Q1029645", "Q1029650", "Q1029787", "Q1030076", "Q1030194", "Q1030202", "Q1033066", "Q1034159", "Q1035471", "Q1036082", "Q1038323", "Q1043575", "Q1044225", "Q1044689", "Q1046653", "Q1047734", "Q1048147", "Q1050352", "Q1051750", "Q1051957", "Q1054127", "Q1054191", "Q1057594", "Q1060628", "Q1061665", "Q1061677", "Q1062370", "Q1062463", "Q1062635", "Q1067163", "Q1067182", "Q1067293", "Q1067464", "Q1069385", "Q1069835", "Q1070175", "Q1071519", "Q1071771", "Q1072210", "Q1072833", "Q1074598", "Q1074644", "Q1074915", "Q1075086", "Q1075566", "Q1075607", "Q1076707", "Q1081284", "Q1081635", "Q1087848", "Q1089052", "Q1089449", "Q1089504", "Q1090858", "Q1093448", "Q1093479", "Q1094355", "Q1094368", "Q1094372", "Q1096108", "Q1098057", "Q1100303", "Q1100543", "Q1100799", "Q1100812", "Q1100817", "Q1101873", "Q1101913", "Q1102045", "Q1102117", "Q1102132", "Q1102140", "Q1102546", "Q1102602", "Q1102796", "Q1102986", "Q1102993", "Q1104010", "Q1105246", "Q1105475", "Q1106169", "Q1106689", "Q1107673", "Q1108876", "Q1110006", "Q1110016", "Q1110026", "Q1110037", "Q1111957", "Q1113311", "Q1115195", "Q1117869", "Q1120810", "Q1120978", "Q1122800", "Q1123806", "Q1134076", "Q1134283", "Q1134454", "Q1135603", "Q1136023", "Q1136189", "Q1136771", "Q1137496", "Q1138762", "Q1140136", "Q1141853", "Q1141858", "Q1142811", "Q1142846", "Q1142926", "Q1143259", "Q1145012", "Q1145715", "Q1146939", "Q1148574", "Q1149273", "Q1149495", "Q1149502", "Q1149819", "Q1150271", "Q1150394", "Q1151582", "Q1152173", "Q1152298", "Q1153061", "Q1153620", "Q1159408", "Q1163924", "Q1166791", "Q1170305", "Q1173008", "Q1173023", "Q1175522", "Q1179634", "Q1179844", "Q1182807", "Q1184741", "Q1185041", "Q1185115", "Q1187240", "Q1187439", "Q1188560", "Q1189982", "Q1190869", "Q1192238", "Q1192377", "Q1192453", "Q1192513", "Q1192614", "Q1192683", "Q1193432", "Q1193830", "Q1195207", "Q1195983", "Q1196877", "Q1197824", "Q1200140", "Q1200491", "Q1202229", "Q1207825", "Q1208152", "Q1208250", "Q1209397", "Q1209404", "Q1210015", "Q1222265", "Q1223508", "Q1226177", "Q1229885", "Q1232016", "Q1236193", "Q1238323", "Q1241126", "Q1241374", "Q1241501", "Q1243772", "Q1246235", "Q1246740", "Q1247205", "Q1249783", "Q1249801", "Q1249888", "Q1249932", "Q1249939", "Q1250076", "Q1250083", "Q1250138", "Q1250201", "Q1250229", "Q1250417", "Q1251114", "Q1251242", "Q1251249", "Q1251261", "Q1251473", "Q1252806", "Q1253663", "Q1257009", "Q1258998", "Q1260951", "Q1261509", "Q1263568", "Q1264006", "Q1264412", "Q1266413", "Q1266637", "Q1266676", "Q1266796", "Q1268139", "Q1269422", "Q1270691", "Q1272817", "Q1274372", "Q1276800", "Q1279608", "Q1280242", "Q1280257", "Q1280261", "Q1280559", "Q1280603", "Q1280822", "Q1280831", "Q1280869", "Q1280983", "Q1281172", "Q1281557", "Q1284453", "Q1286083", "Q1287117", "Q1288480", "Q1289776", "Q1290928", "Q1294439", "Q1295530", "Q1296439", "Q1299852", "Q1308292", "Q1310876", "Q1315249", "Q1318022", "Q1318103", "Q1321216", "Q1321311", "Q1322106", "Q1323393", "Q1323834", "Q1324317", "Q1324574", "Q1324653", "Q1325113", "Q1325690", "Q1329990", "Q1330939", "Q1332144", "Q1332168", "Q1332179", "Q1333077", "Q1337313", "Q1337557", "Q1340331", "Q1340579", "Q1348913", "Q1351046", "Q1354922", "Q1355846", "Q1355984", "Q1355994", "Q1358885", "Q1360304", "Q1361155", "Q1364365", "Q1368165", "Q1368576", "Q1370650", "Q1374967", "Q1375645", "Q1377361", "Q1377368", "Q1377518", "Q1383013", "Q1383404", "Q1385982", "Q1388385", "Q1389472", "Q1390081", "Q1390721", "Q1391693", "Q1392195", "Q1393339", "Q1393804", "Q1395079", "Q1404020", "Q1404518", "Q1404724", "Q1406641", "Q1407440", "Q1415536", "Q1416961", "Q1417212", "Q1421485", "Q1421516", "Q1425428", "Q1428069", "Q1432674", "Q1434796", "Q1436362", "Q1436787", "Q1438830", "Q1439847", "Q1440541", "Q1441919", "Q1445232", "Q1447290", "Q1449543", "Q1453180", "Q1453196", "Q1457265", "Q1458892", "Q1467234", "Q1470987", "Q1471408", "Q1471615", "Q1471709", "Q1472864", "Q1476045", "Q1483871", "Q1487593", "Q1491102", "Q1494067", "Q1499762", "Q1500242", "Q1501621", "Q1505099", "Q1506047", "Q1506112", "Q1506556", "Q1511713", "Q1512154", "Q1514901", "Q1515541", "Q1517030", "Q1517139", "Q1524575", "Q1525192", "Q1525330", "Q1526659", "Q1529020", "Q1530295", "Q1530936", "Q1530993", "Q1532147", "Q1536978", "Q1540219", "Q1540498", "Q1543067", "Q1543632", "Q1549798", "Q1550881", "Q1551924", "Q1552562", "Q1552906", "Q1553052", "Q867039", "Q867102", "Q867431", "Q867437", "Q867573", "Q867586", "Q867592", "Q867603", "Q867704", "Q868203", "Q868205", "Q868423", "Q868631", "Q869403", "Q870103", "Q870475", "Q871209", "Q871557", "Q873405", "Q876166", "Q876176", "Q876191", "Q876483", "Q876549", "Q877229", "Q878820", "Q879057", "Q879065", "Q879071", "Q880512", "Q882907", "Q883362", "Q886561", "Q886590", "Q887147", "Q887488", "Q888300", "Q888390", "Q888769", "Q888946", "Q888971", "Q889344", "Q890126", "Q890681", "Q891241", "Q891664", "Q891719", "Q891949", "Q892020", "Q892441", "Q892886", "Q893092", "Q893554", "Q894513", "Q895029", "Q895407", "Q896073", "Q896185", "Q897320", "Q897446", "Q897898", "Q899873", "Q905423", "Q910973", "Q910997", "Q911020", "Q911358", "Q911750", "Q912235", "Q912253", "Q912952", "Q913102", "Q913292", "Q913356", "Q913399", "Q913406", "Q913429", "Q914055", "Q915420", "Q916382", "Q916514", "Q916536", "Q916733", "Q917173", "Q917330", "Q917434", "Q917690", "Q918461", "Q919678", "Q920866", "Q921052", "Q921505", "Q921577", "Q922701", "Q922959", "Q923393", "Q923414", "Q923541", "Q923643", "Q923687", "Q1553175", "Q1553776", "Q1554994", "Q1555366", "Q1557691", "Q1557796", "Q1563449", "Q1564243", "Q1570801", "Q1572120", "Q1579038", "Q1584051", "Q1587131", "Q1587810", "Q1588249", "Q1588797", "Q1590553", "Q1590869", "Q1591499", "Q1601663", "Q1602897", "Q1605894", "Q1611693", "Q1614556", "Q1615560", "Q1616963", "Q1617416", "Q1619845", "Q1622565", "Q1626079", "Q1627466", "Q1629019", "Q1632220", "Q1632719", "Q1632770", "Q1632857", "Q1632892", "Q1634223", "Q1635196", "Q1635606", "Q1635802", "Q1635908", "Q1637471", "Q1639538", "Q1639696", "Q1640079", "Q1641083", "Q1641337", "Q1642364", "Q1642636", "Q1642670", "Q1642808", "Q1642851", "Q1642884", "Q1643630", "Q1646153", "Q1646181", "Q1647776", "Q1648551", "Q1649287", "Q1649301", "Q1649570", "Q1650017", "Q1650406", "Q1650450", "Q1651059", "Q1655395", "Q1656131", "Q1656462", "Q1656534", "Q1656947", "Q1657230", "Q1657303", "Q1658420", "Q1658752", "Q1659926", "Q1661081", "Q1663450", "Q1665908", "Q1668870", "Q1673881", "Q1675026", "Q1676159", "Q1676558", "Q1677434", "Q1677956", "Q1679567", "Q1681204", "Q1681898", "Q1683722", "Q1683958", "Q1688290", "Q1688300", "Q1689268", "Q1693963", "Q1695650", "Q1703483", "Q1704346", "Q1707618", "Q1707629", "Q1707839", "Q1707848", "Q1707857", "Q1708042", "Q1708143", "Q1708149", "Q1708160", "Q1709128", "Q1709662", "Q1709695", "Q1710703", "Q1711521", "Q1712242", "Q1714088", "Q1715139", "Q1719036", "Q1719466", "Q1721086", "Q1721432", "Q1722562", "Q1722889", "Q1723411", "Q1724990", "Q1725562", "Q1729098", "Q1735037", "Q1736959", "Q1739016", "Q1740472", "Q1740527", "Q1740554", "Q1740566", "Q1740681", "Q1740709", "Q1740795", "Q1741227", "Q1748341", "Q1748623", "Q1748922", "Q1749044", "Q1749078", "Q1751446", "Q1754752", "Q1755283", "Q1755879", "Q1756617", "Q1756745", "Q1756938", "Q1757279", "Q1757609", "Q1758024", "Q1758215", "Q1759360", "Q1759366", "Q1760422", "Q1764282", "Q1765382", "Q1765809", "Q1766020", "Q1766076", "Q1766104", "Q1766619", "Q1768653", "Q1770214", "Q1771398", "Q1771693", "Q1771762", "Q1771821", "Q1771999", "Q1772819", "Q1772825", "Q1773148", "Q1774419", "Q1774606", "Q1780032", "Q1780345", "Q1780350", "Q1780577", "Q1781511", "Q1783539", "Q1783586", "Q1784163", "Q1784539", "Q1784710", "Q1784816", "Q1784846", "Q1785340", "Q1786045", "Q1786597", "Q1788115", "Q1788128", "Q1789805", "Q1796191", "Q1797764", "Q1798241", "Q1798559", "Q1798593", "Q1798658", "Q1798750", "Q1798895", "Q1799019", "Q1800652", "Q1801267", "Q1804166", "Q1806934", "Q1807660", "Q1807929", "Q1807935", "Q1807961", "Q1809024", "Q1812040", "Q1813015", "Q1813609", "Q1814480", "Q1814658", "Q1816192", "Q1816543", "Q1816589", "Q1816833", "Q1817441", "Q1817531", "Q1818610", "Q1818778", "Q1819433", "Q1819486", "Q1822209", "Q1822804", "Q1822816", "Q1823772", "Q1825355", "Q1826232", "Q1827268", "Q1827283", "Q1828035", "Q1828275", "Q1828708", "Q1840873", "Q1844084", "Q1844478", "Q1849093", "Q1850973", "Q1851063", "Q1851848", "Q1853310", "Q1853576", "Q1853969", "Q1856972", "Q1860785", "Q1861898", "Q1865092", "Q1866604", "Q1867123", "Q1867822", "Q1871384", "Q1873660", "Q1876685", "Q1879970", "Q1880859", "Q1883766", "Q1884201", "Q1884227", "Q1886455", "Q1886737", "Q1886759", "Q1887662", "Q1888230", "Q1889146", "Q1890257", "Q1892074", "Q1892445", "Q1892829", "Q1894006", "Q1894082", "Q1895616", "Q1896161", "Q1896205", "Q1896917", "Q1897488", "Q1897640", "Q1897952", "Q1899332", "Q1899754", "Q1899785", "Q1901003", "Q1902266", "Q1903588", "Q1904018", "Q1904137", "Q1904178", "Q1904228", "Q1904521", "Q1904554", "Q1905080", "Q1906235", "Q1906245", "Q1906256", "Q1906266", "Q1906278", "Q1906290", "Q1906311", "Q1906323", "Q1906334", "Q1906346", "Q1907375", "Q1911818", "Q1913327", "Q1913957", "Q1915327", "Q1916952", "Q1918837", "Q1920412", "Q1921003", "Q1921294", "Q1922254", "Q1922257", "Q1922275", "Q1922294", "Q1922299", "Q1922307", "Q1922317", "Q1922330", "Q1925129", "Q1925191", "Q1931717", "Q1932689", "Q1935438", "Q1935454", "Q1935474", "Q1936063", "Q1936947", "Q1937588", "Q1938135", "Q1938572", "Q1938772", "Q1939876", "Q1940256", "Q1944489", "Q1945622", "Q1946017", "Q1946027", "Q1946041", "Q1946049", "Q1946056", "Q1946067", "Q1946077", "Q1946089", "Q1949069", "Q1949134", "Q1949364", "Q1949385", "Q1949403", "Q1949410", "Q1949422", "Q1951490", "Q1953119", "Q1958570", "Q1962023", "Q1962063", "Q1962087", "Q1962104", "Q1962272", "Q1962285", "Q1963359", "Q1963933", "Q1964065", "Q1967802", "Q1968268", "Q1969147", "Q1969407", "Q1970952", "Q1972013", "Q1972757", "Q1972938", "Q1973073", "Q1974445", "Q1974467", "Q1975329", "Q1976231", "Q1976493", "Q1977737", "Q1978797", "Q1980885", "Q1982115", "Q1982137", "Q1982768", "Q1982983", "Q1983186", "Q1983868", "Q1983875", "Q1983932", "Q1987043", "Q1987664", "Q1987828", "Q1987956", "Q1988320", "Q1989713", "Q1989793", "Q1989822", "Q1990163", "Q1991249", "Q1991268", "Q1991722", "Q1993517", "Q1994405", "Q1994818", "Q1995276", "Q1996181", "Q1996815", "Q1997282", "Q1997462", "Q1998630", "Q1999000", "Q2000579", "Q2001490", "Q2003711", "Q2003745", "Q2005211", "Q2005262", "Q2005381", "Q2005439", "Q2006076", "Q2006102", "Q2006112", "Q2006121", "Q2006496", "Q2006546", "Q2008189", "Q2008641", "Q2009698", "Q2009853", "Q2013262", "Q2016879", "Q2017187", "Q2019719", "Q2019727", "Q2020432", "Q2021260", "Q2022508", "Q2023773", "Q2029702", "Q2031369", "Q2031463", "Q2031761", "Q2034978", "Q2036966", "Q2038147", "Q2038603", "Q2038791", "Q2038816", "Q2042136", "Q2043944", "Q2044194", "Q2044578", "Q2044597", "Q2044605", "Q2044999", "Q2045352", "Q2046170", "Q2046587", "Q2048321", "Q2048389", "Q2049147", "Q2049431", "Q2061265", "Q2061316", "Q2061386", "Q2064953", "Q2068157", "Q2072540", "Q2072599", "Q2072887", "Q2075535", "Q2075665", "Q2076213", "Q2077013", "Q2077993", "Q2078026", "Q2078085", "Q2080938", "Q2084446", "Q2084833", "Q2086390", "Q2087489", "Q2087536", "Q2087583", "Q2087713", "Q2087739", "Q2087800", "Q2088176", "Q2088349", "Q2088480", "Q2088506", "Q2088687", "Q2089107", "Q2089594", "Q2089619", "Q2090598", "Q2091673", "Q2092448", "Q2093549", "Q2094682", "Q2096039", "Q2096693", "Q2097797", "Q2100357", "Q2100648", "Q2103589", "Q2105480", "Q2105634", "Q2106396", "Q2110515", "Q2113430", "Q2114405", "Q2117354", "Q2117510", "Q2120402", "Q2120436", "Q2121220", "Q2121478", "Q2121778", "Q2123036", "Q2123580", "Q2125362", "Q2126436", "Q2128609", "Q2129610", "Q2132197", "Q2132653", "Q2135041", "Q2139799", "Q2139924", "Q2140586", "Q2141024", "Q2143101", "Q2143690", "Q2144010", "Q2147497", "Q2148072", "Q2148285", "Q2148635", "Q2158248", "Q2158344", "Q2159352", "Q2159862", "Q2160056", "Q2165007", "Q2167452", "Q2167485", "Q2170773", "Q2176882", "Q2180590", "Q2181579", "Q2181742", "Q2182554", "Q2191437", "Q2191860", "Q2195778", "Q2198509", "Q2199004", "Q2199244", "Q2204862", "Q2205145", "Q2210877", "Q2213151", "Q2215428", "Q2215445", "Q2218065", "Q2218834", "Q2219669", "Q2219743", "Q2219756", "Q2219994", "Q2219999", "Q2220128", "Q2222379", "Q2222616", "Q2222874", "Q2222888", "Q2222954", "Q2223185", "Q2223250", "Q2224040", "Q2224587", "Q2226347", "Q2227170", "Q2228620", "Q2228759", "Q2229754", "Q2231235", "Q2231416", "Q2233964", "Q2234098", "Q2234347", "Q2234381", "Q2235493", "Q2236719", "Q2241122", "Q2245953", "Q2246041", "Q2246518", "Q2248438", "Q2249856", "Q2249997", "Q2252605", "Q2254425", "Q2260170", "Q2260811", "Q2260963", "Q2261361", "Q2262291", "Q2262528", "Q2268790", "Q2269545", "Q2271123", "Q2273431", "Q2274010", "Q2275389", "Q2275983", "Q2276572", "Q2277705", "Q2279371", "Q2281181", "Q2281643", "Q2282045", "Q2282208", "Q2282418", "Q2283155", "Q2283203", "Q2283488", "Q2283714", "Q2283725", "Q2283736", "Q2284679", "Q2284798", "Q2287173", "Q2287316", "Q2290080", "Q2290501", "Q2290708", "Q2291654", "Q2292517", "Q2292590", "Q2292609", "Q2294808", "Q2294847", "Q2297162", "Q2297707", "Q2299018", "Q2300140", "Q2300732", "Q2302162", "Q2302185", "Q2304294", "Q2304483", "Q2305215", "Q2305496", "Q2305836", "Q2305839", "Q2306321", "Q2306609", "Q2307341", "Q2307361", "Q2307472", "Q2307821", "Q2308046", "Q2308752", "Q2311223", "Q2311253", "Q2317068", "Q2317186", "Q2317191", "Q2317504", "Q2317517", "Q2319835", "Q2320876", "Q2329701", "Q2330467", "Q2330916", "Q2333417", "Q2335256", "Q2335680", "Q2338831", "Q2341034", "Q2341047", "Q2341393", "Q2341875", "Q2341892", "Q2342112", "Q2343396", "Q2343517", "Q2344811", "Q2347569", "Q2347920", "Q2349480", "Q2349902", "Q2350519", "Q2351223", "Q2351933", "Q2351948", "Q2352148", "Q2352160", "Q2353077", "Q2353893", "Q2354276", "Q2355674", "Q2355915", "Q2356376", "Q2356396", "Q2356406", "Q2356424", "Q2357510", "Q2357921", "Q2357934", "Q2359107", "Q2359952", "Q2360265", "Q2360416", "Q2360927", "Q2361176", "Q2361658", "Q2362035", "Q2364639", "Q2364886", "Q2364972", "Q2368491", "Q2369466", "Q2370405", "Q2370892", "Q2371098", "Q2372031", "Q2373220", "Q2373358", "Q2375484", "Q2375652", "Q2375936", "Q2378055", "Q2378079", "Q2384142", "Q2390618", "Q2391202", "Q2391391", "Q2391830", "Q2392142", "Q2394006", "Q2396769", "Q2396956", "Q2400043", "Q2401418", "Q2404398", "Q2406134", "Q2408990", "Q2409359", "Q2409805", "Q2412778", "Q2412863", "Q2413233", "Q2414959", "Q2416719", "Q2420477", "Q2421186", "Q2422345", "Q2423013", "Q2423141", "Q2423691", "Q2425651", "Q2427450", "Q2427704", "Q2428259", "Q2428556", "Q2429241", "Q2431796", "Q2435120", "Q2435851", "Q2435966", "Q2439514", "Q2440276", "Q2441398", "Q2441509", "Q2442236", "Q2442675", "Q2445461", "Q2445542", "Q2446919", "Q2447248", "Q2447267", "Q2448297", "Q2448591", "Q2449403", "Q2449703", "Q2450872", "Q2450994", "Q2453472", "Q2458075", "Q2460416", "Q2462135", "Q2465668", "Q2465841", "Q2468221", "Q2471469", "Q2472697", "Q2472976", "Q2473978", "Q2474056", "Q2475182", "Q2475760", "Q2475775", "Q2475908", "Q2477040", "Q2477696", "Q2482800", "Q2483862", "Q2483919", "Q2485287", "Q2487341", "Q2488555", "Q2496764", "Q2497882", "Q2498357", "Q2498538", "Q2501764", "Q2501786", "Q2506989", "Q2507925", "Q2510244", "Q2510445", "Q2511670", "Q2518084", "Q2520086", "Q2523409", "Q2523774", "Q2525523", "Q2525798", "Q2527509", "Q2527695", "Q2528063", "Q2528080", "Q2530831", "Q2532403", "Q2533580", "Q2534936", "Q2539817", "Q2540118", "Q2542724", "Q2543304", "Q2543489", "Q2544240", "Q2544458", "Q2544796", "Q2544948", "Q2545249", "Q2548709", "Q2548730", "Q2549060", "Q2549481", "Q2550461", "Q2550996", "Q2551179", "Q2554975", "Q2558704", "Q2558868", "Q2560293", "Q2560555", "Q2561180", "Q2561181", "Q2561304", "Q2561339", "Q2561767", "Q2562082", "Q2562906", "Q2563156", "Q2565407", "Q2566453", "Q2566827", "Q2568748", "Q2568887", "Q2570307", "Q2570767", "Q2570810", "Q2571376", "Q2573174", "Q2573236", "Q2573404", "Q2573456", "Q2573596", "Q2574933", "Q2576041", "Q2579193", "Q2579925", "Q2579936", "Q2580069", "Q2580112", "Q2580372", "Q2581527", "Q2582611", "Q2582671", "Q2582682", "Q2583107", "Q2583846", "Q2584195", "Q2586396", "Q2588425", "Q2588438", "Q2588449", "Q2589060", "Q2590944", "Q2592149", "Q2592625", "Q2592708", "Q2593882", "Q2594467", "Q2594860", "Q2598968", "Q2600586", "Q2602785", "Q2603127", "Q2603403", "Q2604081", "Q2604706", "Q2604875", "Q2604898", "Q2604911", "Q2605356", "Q2605394", "Q2605521", "Q2608234", "Q2608258", "Q2608901", "Q2615863", "Q2618048", "Q2621177", "Q2625289", "Q2625910", "Q2627209", "Q2629026", "Q2629052", "Q2629132", "Q2630835", "Q2631365", "Q2631639", "Q2638247", "Q2638267", "Q2638284", "Q2638295", "Q2638372", "Q2638696", "Q2640072", "Q2640092", "Q2640808", "Q2650067", "Q2654603", "Q2654892", "Q2656015", "Q2656174", "Q2656511", "Q2656617", "Q2657702", "Q2659599", "Q2660326", "Q2662138", "Q2662991", "Q2663513", "Q2663949", "Q2665223", "Q2665241", "Q2668534", "Q2669640", "Q2670191", "Q2671184", "Q2671684", "Q2671983", "Q2672955", "Q2674278", "Q2677927", "Q2678458", "Q2689111", "Q2699709", "Q2699921", "Q2702755", "Q2703858", "Q2706425", "Q2708419", "Q2708429", "Q2708439", "Q2708449", "Q2708630", "Q2708658", "Q2708675", "Q2708692", "Q2708772", "Q2708780", "Q2709339", "Q2709635", "Q2711899", "Q2712890", "Q2714363", "Q2717436", "Q2717832", "Q2717997", "Q2718157", "Q2718745", "Q2719176", "Q2719283", "Q2719362", "Q2719424", "Q2720579", "Q2720623", "Q2720811", "Q2720813", "Q2720938", "Q2724534", "Q2725364", "Q2725457", "Q2726628", "Q2726653", "Q2726675", "Q2731869", "Q2733738", "Q2736522", "Q2738426", "Q2738432", "Q2739754", "Q2743879", "Q2749246", "Q2756591", "Q2762100", "Q2765597", "Q2766547", "Q2768828", "Q2769882", "Q2781592", "Q2786965", "Q2791141", "Q2794758", "Q2799572", "Q2802193", "Q2811760", "Q2820151", "Q2821705", "Q2824323", "Q2829115", "Q2829121", "Q2829129", "Q2829449", "Q2832251", "Q2832649", "Q2837318", "Q2837518", "Q2837875", "Q2841553", "Q2843528", "Q2855736", "Q2857568", "Q2859097", "Q2861426", "Q2863566", "Q2866069", "Q2866945", "Q2875992", "Q2877655", "Q2877763", "Q2878468", "Q2878774", "Q2878806", "Q2879423", "Q2880291", "Q2880315", "Q2881532", "Q2881786", "Q2881807", "Q2882735", "Q2883555", "Q2884439", "Q2884475", "Q2885485", "Q2885504", "Q2887425", "Q2891177", "Q2891356", "Q2893561", "Q2893570", "Q2893571", "Q2895437", "Q2895854", "Q2895928", "Q2898863", "Q2901034", "Q2901625", "Q2902521", "Q2905684", "Q2907474", "Q2909484", "Q2911089", "Q2911237", "Q2911724", "Q2912547", "Q2915071", "Q2915767", "Q2915901", "Q2916708", "Q2918596", "Q3079381", "Q3079946", "Q3086891", "Q3090358", "Q3090562", "Q3094251", "Q3095099", "Q3095100", "Q3095299", "Q3098785", "Q3099183", "Q3099245", "Q3099973", "Q3099992", "Q3100001", "Q3100518", "Q3100527", "Q3101885", "Q3104753", "Q3104786", "Q3104850", "Q3106775", "Q3109029", "Q3109440", "Q3109447", "Q3109609", "Q3110195", "Q3110404", "Q3111400", "Q3111445", "Q3111576", "Q3111582", "Q3111649", "Q3112862", "Q3113061", "Q3115487", "Q3115657", "Q3115808", "Q3116519", "Q3117688", "Q3117988", "Q3118818", "Q3122451", "Q3122689", "Q3123278", "Q3124743", "Q3125264", "Q3125692", "Q3126323", "Q3127439", "Q3130855", "Q3131511", "Q3132040", "Q3132397", "Q3132654", "Q3133884", "Q3134346", "Q3134431", "Q3135733", "Q3136127", "Q3136729", "Q3139315", "Q3139869", "Q3140976", "Q3141156", "Q3143438", "Q3148695", "Q3173182", "Q3175104", "Q3187889", "Q3187962", "Q3191685", "Q3192160", "Q3192173", "Q3192625", "Q3192674", "Q3192676", "Q3192757", "Q3192921", "Q3192928", "Q3192944", "Q3193697", "Q3194168", "Q3194845", "Q3194987", "Q3195629", "Q3196396", "Q3196864", "Q3198143", "Q3198269", "Q3198730", "Q3199226", "Q3199267", "Q3199296", "Q3199300", "Q3199308", "Q3199309", "Q3199354", "Q3200312", "Q3201090", "Q3213480", "Q3218330", "Q3219779", "Q3223801", "Q3228826", "Q3233176", "Q3233266", "Q3233854", "Q3233968", "Q3233991", "Q3235603", "Q3235662", "Q3236167", "Q3236446", "Q3236564", "Q3236687", "Q3238579", "Q3240868", "Q3243452", "Q3243471", "Q3244848", "Q3246361", "Q3246396", "Q3246527", "Q3246886", "Q3248111", "Q3250492", "Q3251369", "Q3257780", "Q3258078", "Q3258096", "Q3258725", "Q3259332", "Q3259811", "Q3260036", "Q3263949", "Q3263986", "Q3263994", "Q3267362", "Q3272262", "Q3272310", "Q3276080", "Q3276918", "Q3280495", "Q3281038", "Q3281850", "Q3284738", "Q3284743", "Q3285714", "Q3286489", "Q3286648", "Q3287440", "Q3287523", "Q3291153", "Q3303148", "Q3303551", "Q3304215", "Q3304799", "Q3304801", "Q3304823", "Q3305646", "Q3305659", "Q3305671", "Q3305771", "Q3305883", "Q3306256", "Q3306408", "Q3307328", "Q3307925", "Q3308397", "Q3309417", "Q3312424", "Q3312677", "Q3312796", "Q3312840", "Q3313563", "Q3315681", "Q3315977", "Q3317332", "Q3317408", "Q3317415", "Q3317423", "Q3317432", "Q3317724", "Q3317765", "Q3317773", "Q3318939", "Q3319094", "Q3319140", "Q3319310", "Q3320656", "Q3321376", "Q3321405", "Q3321421", "Q3322143", "Q3322237", "Q3322611", "Q3322620", "Q3322627", "Q3322634", "Q2919205", "Q2919593", "Q2920063", "Q2922134", "Q2922170", "Q2922201", "Q2922207", "Q2924791", "Q2928324", "Q2928812", "Q2929807", "Q2932988", "Q2933923", "Q2937166", "Q2938844", "Q2944558", "Q2944819", "Q2947580", "Q2962698", "Q2963374", "Q2964558", "Q2975160", "Q2975618", "Q2977093", "Q2977263", "Q2978509", "Q2981190", "Q2981942", "Q2984767", "Q2985681", "Q2986304", "Q2988951", "Q2989619", "Q2989624", "Q2989631", "Q2989645", "Q2989650", "Q2996307", "Q2996387", "Q2997217", "Q3008539", "Q3010697", "Q3010762", "Q3011615", "Q3011860", "Q3012013", "Q3013542", "Q3018561", "Q3022078", "Q3022456", "Q3026080", "Q3026296", "Q3026301", "Q3027308", "Q3027729", "Q3027920", "Q3032422", "Q3033077", "Q3033674", "Q3034353", "Q3036493", "Q3036637", "Q3037416", "Q3037826", "Q3037892", "Q3040214", "Q3040241", "Q3041503", "Q3041568", "Q3043375", "Q3046868", "Q3049021", "Q3049730", "Q3049763", "Q3049816", "Q3049894", "Q3050629", "Q3050998", "Q3052011", "Q3055947", "Q3056421", "Q3057572", "Q3057885", "Q3058634", "Q3064447", "Q3064450", "Q3064684", "Q3064707", "Q3066757", "Q3066776", "Q3066862", "Q3067441", "Q3068588", "Q3071111", "Q3074767", "Q3075342", "Q3075960", "Q3077739", "Q3077833", "Q3078177", "Q3322638", "Q3322678", "Q3325049", "Q3327422", "Q3327593", "Q3332659", "Q3332718", "Q3334079", "Q3335196", "Q3335220", "Q3335618", "Q3335646", "Q3337485", "Q3337496", "Q3337871", "Q3339368", "Q3339436", "Q3339476", "Q3339478", "Q3339481", "Q3339490", "Q3341295", "Q3341442", "Q3342002", "Q3342193", "Q3342356", "Q3342357", "Q3343235", "Q3343338", "Q3343398", "Q3344002", "Q3344017", "Q3344032", "Q3344040", "Q3344048", "Q3344055", "Q3344059", "Q3344061", "Q3344065", "Q3344069", "Q3344072", "Q3344084", "Q3344087", "Q3344090", "Q3344095", "Q3344099", "Q3344103", "Q3344124", "Q3344141", "Q3344150", "Q3344173", "Q3344197", "Q3344209", "Q3344215", "Q3344236", "Q3344351", "Q3344843", "Q3344855", "Q3344870", "Q3344909", "Q3345555", "Q3347049", "Q3347407", "Q3347804", "Q3348229", "Q3348236", "Q3348291", "Q3350077", "Q3354065", "Q3356822", "Q3357935", "Q3357950", "Q3358051", "Q3358063", "Q3358844", "Q3361853", "Q3361894", "Q3366952", "Q3367230", "Q3368418", "Q3374452", "Q3395141", "Q3395829", "Q3396123", "Q3396216", "Q3399311", "Q3400357", "Q3400742", "Q3404617", "Q3408680", "Q3410592", "Q3411169", "Q3412425", "Q3414556", "Q3414795", "Q3415703", "Q3420445", "Q3434312", "Q3434314", "Q3441236", "Q3442746", "Q3445866", "Q3449469", "Q3458581", "Q3460692", "Q3461465", "Q3464234", "Q3469700", "Q3470665", "Q3471566", "Q3472184", "Q3472203", "Q3472573", "Q3472621", "Q3472626", "Q3472806", "Q3473501", "Q3474658", "Q3476268", "Q3476942", "Q3477726", "Q3478042", "Q3478075", "Q3478522", "Q3479103", "Q3481209", "Q3481278", "Q3481302", "Q3483194", "Q3483204", "Q3485061", "Q3485096", "Q3486116", "Q3487283", "Q3488762", "Q3489051", "Q3491727", "Q3491742", "Q3494688", "Q3498842", "Q3499515", "Q3500883", "Q3502663", "Q3502865", "Q3504032", "Q3504675", "Q3505782", "Q3505791", "Q3505801", "Q3513519", "Q3513909", "Q3514416", "Q3517441", "Q3518101", "Q3523969", "Q3524626", "Q3528033", "Q3528317", "Q3530025", "Q3532754", "Q3532864", "Q3541533", "Q3541569", "Q3542009", "Q3544851", "Q3546813", "Q3547421", "Q3548253", "Q3552274", "Q3552479", "Q3556823", "Q3557909", "Q3559157", "Q3559224", "Q3563897", "Q3565377", "Q3566248", "Q3567161", "Q3567301", "Q3567308", "Q3569773", "Q3571397", "Q3574797", "Q3574882", "Q3575469", "Q3575640", "Q3577266", "Q3595659", "Q3595848", "Q3607447", "Q3607448", "Q3608608", "Q3619248", "Q3619316", "Q3620580", "Q3626200", "Q3634114", "Q3634175", "Q3636023", "Q3643900", "Q3645598", "Q3646152", "Q3646506", "Q3651040", "Q3652748", "Q3660136", "Q3666300", "Q3666877", "Q3675400", "Q3693997", "Q3695241", "Q3695300", "Q3695618", "Q3695624", "Q3695697", "Q3695904", "Q3696036", "Q3696182", "Q3696209", "Q3696367", "Q3700809", "Q3711197", "Q3719360", "Q3720937", "Q3721220", "Q3721297", "Q3721987", "Q3723441", "Q3724044", "Q3724048", "Q3732722", "Q3738335", "Q3745777", "Q3753233", "Q3773723", "Q3777358", "Q3780142", "Q3782784", "Q3785959", "Q3786092", "Q3786686", "Q3787050", "Q3788017", "Q3798365", "Q3807754", "Q3809153", "Q3814773", "Q3816731", "Q3829351", "Q3836328", "Q3850273", "Q3867196", "Q3874055", "Q3874838", "Q3878801", "Q3879165", "Q3892731", "Q3905064", "Q3912975", "Q3917005", "Q3925393", "Q3937986", "Q3942968", "Q3945164", "Q3947434", "Q3948919", "Q3949007", "Q3976467", "Q3983043", "Q3983093", "Q3990170", "Q3991144", "Q3998737", "Q4059354", "Q4063326", "Q4064121", "Q4064550", "Q4065546", "Q4072347", "Q4103058", "Q4105094", "Q4108354", "Q4115712", "Q4116151", "Q4116186", "Q4116291", "Q4118025", "Q4118337", "Q4118953", "Q4119153", "Q4119728", "Q4119742", "Q4119766", "Q4119894", "Q4120190", "Q4120522", "Q4120525", "Q4120566", "Q4120581", "Q4131635", "Q4131907", "Q4132923", "Q4139824", "Q4151853", "Q4156781", "Q4159797", "Q4161769", "Q4162074", "Q4165411", "Q4165625", "Q4165655", "Q4165945", "Q4166063", "Q4166184", "Q4166337", "Q4166604", "Q4167668", "Q4178675", "Q4220657", "Q4228741", "Q4247181", "Q4248310", "Q4251679", "Q4274209", "Q4274214", "Q4291263", "Q4311575", "Q4312524", "Q4312918", "Q4312927", "Q4405656", "Q4405727", "Q4407227", "Q4407951", "Q4408127", "Q4408287", "Q4409387", "Q4418748", "Q4419079", "Q4445103", "Q4446399", "Q4449159", "Q4449920", "Q4450198", "Q4452813", "Q4453847", "Q4459029", "Q4459073", "Q4466847", "Q4468504", "Q4470303", "Q4490010", "Q4495185", "Q4495294", "Q4495844", "Q4497421", "Q4502049", "Q4515514", "Q4515627", "Q4520486", "Q4520563", "Q4523051", "Q4523190", "Q4524218", "Q4526627", "Q4532299", "Q4533372", "Q4534209", "Q4539990", "Q4573340", "Q4579677", "Q4622385", "Q4623904", "Q4624506", "Q4650216", "Q4660870", "Q4678136", "Q4681407", "Q4691586", "Q4699229", "Q4702331", "Q4702665", "Q4703079", "Q4703973", "Q4740224", "Q4741622", "Q4745109", "Q4747704", "Q4748280", "Q4752772", "Q4775046", "Q4775098", "Q4779536", "Q4786593", "Q4788771", "Q4795376", "Q4810310", "Q4821345", "Q4838013", "Q4841319", "Q4841445", "Q4843907", "Q4844168", "Q4848984", "Q4850064", "Q4852560", "Q4853169", "Q4881072", "Q4890124", "Q4890987", "Q4902946", "Q4907688", "Q4936764", "Q4939409", "Q4939784", "Q4950013", "Q4985397", "Q4987159", "Q4998078", "Q5017508", "Q5018764", "Q5024056", "Q5029212", "Q5069048", "Q5069447", "Q5072720", "Q5105558", "Q5115146", "Q5118616", "Q5119913", "Q5124142", "Q5124162", "Q5124170", "Q5124173", "Q5148266", "Q5208131", "Q5221425", "Q5222112", "Q5222600", "Q5243296", "Q5243979", "Q5255116", "Q5255269", "Q5259650", "Q5270295", "Q5276491", "Q5278157", "Q5278308", "Q5284691", "Q5295566", "Q5350647", "Q5351224", "Q5351356", "Q5352055", "Q5352068", "Q5352286", "Q5362582", "Q5368613", "Q5372475", "Q5373099", "Q5376121", "Q5398364", "Q5399339", "Q5410028", "Q5414521", "Q5419083", "Q5420717", "Q5436153", "Q5437418", "Q5443492", "Q5474812", "Q5478122", "Q5509404", "Q5521848", "Q5527338", "Q5532089", "Q5562219", "Q5576202", "Q5577468", "Q5582862", "Q5584396", "Q5594127", "Q5594333", "Q5599705", "Q5600202", "Q5602740", "Q5607284", "Q5620048", "Q5637571", "Q5637733", "Q5639815", "Q5641021", "Q5641122", "Q5641388", "Q5654198", "Q5664431", "Q5666936", "Q5666996", "Q5667075", "Q5667302", "Q5667609", "Q5668451", "Q5668631", "Q5668715", "Q5669041", "Q5671433", "Q5671837", "Q5674954", "Q5676365", "Q5678181", "Q5680619", "Q5685979", "Q5691156", "Q5691477", "Q5691973", "Q5698503", "Q5701225", "Q5701306", "Q5701309", "Q5701336", "Q5701386", "Q5701389", "Q5701455", "Q5701510", "Q5701562", "Q5701592", "Q5701662", "Q5701665", "Q5701772", "Q5702191", "Q5702292", "Q5702349", "Q5703231", "Q5703776", "Q5704405", "Q5704657", "Q5707354", "Q5709588", "Q5709618", "Q5709620", "Q5710500", "Q5710505", "Q5710624", "Q5712621", "Q5712699", "Q5712788", "Q5713256", "Q5716299", "Q5717907", "Q5719362", "Q5722442", "Q5722721", "Q5724384", "Q5726624", "Q5727456", "Q5727577", "Q5727866", "Q5749247", "Q5749711", "Q5762368", "Q5763389", "Q5763390", "Q5763412", "Q5766186", "Q5768702", "Q5789709", "Q5806703", "Q5832423", "Q5835883", "Q5838711", "Q5840235", "Q5857375", "Q5881262", "Q5905318", "Q5915138", "Q5938642", "Q5938733", "Q5945898", "Q5949897", "Q5962199", "Q5963243", "Q5968987", "Q5987687", "Q5990184", "Q5994951", "Q5998871", "Q5999474", "Q5999646", "Q5999829", "Q6000830", "Q6003432", "Q6014404", "Q6015141", "Q6018368", "Q6018830", "Q6018847", "Q6023307", "Q6023870", "Q6025001", "Q6025183", "Q6028342", "Q6031444", "Q6037615", "Q6041307", "Q6049649", "Q6050210", "Q6050235", "Q6050261", "Q6052525", "Q6055977", "Q6069369", "Q6076674", "Q6080543", "Q6093319", "Q6093787", "Q6118807", "Q6119013", "Q6121011", "Q6125981", "Q6129295", "Q6140277", "Q6140279", "Q6154758", "Q6159672", "Q6166116", "Q6167965", "Q6168081", "Q6169531", "Q6173006", "Q6193113", "Q6293252", "Q6293554", "Q6298685", "Q6346798", "Q6350016", "Q6351676", "Q6356825", "Q6365782", "Q6368203", "Q6373489", "Q6389103", "Q6402808", "Q6406498", "Q6406917", "Q6412117", "Q6412671", "Q6414288", "Q6415759", "Q6418020", "Q6419912", "Q6431544", "Q6442723", "Q6447388", "Q6459366", "Q6462206", "Q6465070", "Q6465543", "Q6485624", "Q6492291", "Q6503576", "Q6516399", "Q6540185", "Q6571316", "Q6583924", "Q6587270", "Q6595658", "Q6609604", "Q6634626", "Q6642236", "Q6649311", "Q6669164", "Q6704167", "Q6710593", "Q6710802", "Q6721179", "Q6722685", "Q6723341", "Q6726220", "Q6729149", "Q6736825", "Q6737230", "Q6737428", "Q6740518", "Q6741450", "Q6749069", "Q6792576", "Q6819071", "Q6827675", "Q6839370", "Q6843184", "Q6860386", "Q6874886", "Q6887544", "Q6895634", "Q6903267", "Q6922178", "Q6932090", "Q6936056", "Q6948694", "Q6956610", "Q6965358", "Q6972345", "Q6974233", "Q6974906", "Q6977194", "Q6983051", "Q6997456", "Q6998782", "Q7001323", "Q7005391", "Q7005393", "Q7012098", "Q7021974", "Q7037160", "Q7041563", "Q7058499", "Q7067578", "Q7081929", "Q7095260", "Q7099213", "Q7106532", "Q7125163", "Q7127272", "Q7130364", "Q7139444", "Q7193761", "Q7195018", "Q7195866", "Q7223092", "Q7230482", "Q7237629", "Q7263152", "Q7265828", "Q7266461", "Q7278471", "Q7283492", "Q7294653", "Q7314331", "Q7322016", "Q7337796", "Q7367138", "Q7396574", "Q7398431", "Q7399661", "Q7405804", "Q7409016", "Q7413381", "Q7414682", "Q7414937", "Q7417749", "Q7419262", "Q7419863", "Q7420390", "Q7421008", "Q7437459", "Q7448218", "Q7449126", "Q7454833", "Q7456830", "Q7461493", "Q7501510", "Q7504702", "Q7504795", "Q7524554", "Q7586465", "Q7636579", "Q7641860", "Q7645273", "Q7672929", "Q7681046", "Q7684735", "Q7697381", "Q7697898", "Q7711602", "Q7810359", "Q7854816", "Q7856500", "Q7877316", "Q7883868", "Q7909176", "Q7916821", "Q7925281", "Q7930370", "Q7935966", "Q7958728", "Q7958913", "Q7960673", "Q7967865", "Q7973205", "Q8044291", "Q8048196", "Q8052256", "Q8064579", "Q8073157", "Q8197166", "Q8215260", "Q8215298", "Q8253543", "Q8536073", "Q8772897", "Q8963744", "Q9001103", "Q9020124", "Q9053113", "Q9092331", "Q9093772", "Q9142949", "Q9143904", "Q9160295", "Q9176109", "Q9210387", "Q9293211", "Q9293647", "Q9295498", "Q9300715", "Q9391358", "Q9560053", "Q9560982", "Q9712078", "Q10054424", "Q10271130", "Q10280269", "Q10301027", "Q10301045", "Q10306899", "Q10316445", "Q10323671", "Q10327461", "Q10344168", "Q10355792", "Q10364660", "Q10373307", "Q10378793", "Q10382434", "Q10387515", "Q10390786", "Q10394607", "Q10396595", "Q10401099", "Q10480578", "Q10498783", "Q10518562", "Q10542373", "Q10543698", "Q10587563", "Q10600392", "Q10600995", "Q10623109", "Q10637941", "Q10661956", "Q10731600", "Q10803523", "Q10824077", "Q10837783", "Q10839880", "Q10842552", "Q10853792", "Q10856006", "Q10859337", "Q10859501", "Q10860440", "Q10861438", "Q10867816", "Q10878511", "Q10885263", "Q10891328", "Q10921692", "Q10923028", "Q10938567", "Q10954107", "Q10954229", "Q11000280", "Q11004410", "Q11014097", "Q11023989", "Q11024122", "Q11025286", "Q11029999", "Q11043707", "Q11044571", "Q11045775", "Q11046275", "Q11048692", "Q11133430", "Q11160785", "Q11167467", "Q11168982", "Q11198998", "Q11249733", "Q11293408", "Q11346728", "Q11349865", "Q11385909", "Q11428087", "Q11439906", "Q11444975", "Q11445500", "Q11481809", "Q11705096", "Q11711757", "Q11722595", "Q11748397", "Q11792967", "Q11794247", "Q11825037", "Q11830645", "Q11854844", "Q11878638", "Q11878912", "Q11903694", "Q11904142", "Q11904143", "Q11904203", "Q11904209", "Q11904486", "Q11904922", "Q11904923", "Q11906352", "Q11906692", "Q11906932", "Q11907223", "Q11907308", "Q11907505", "Q11909428", "Q11909484", "Q11910210", "Q11911022", "Q11913747", "Q11913978", "Q11915614", "Q11915715", "Q11916326", "Q11916346", "Q11916493", "Q11916598", "Q11916627", "Q11916635", "Q11916722", "Q11917191", "Q11917849", "Q11917863", "Q11918142", "Q11918812", "Q11919440", "Q11919529", "Q11919561", "Q11921103", "Q11921177", "Q11921470", "Q11923822", "Q11923902", "Q11923903", "Q11923909", "Q11924427", "Q11924438", "Q11924817", "Q11924989", "Q11925163", "Q11925164", "Q11925220", "Q11925247", "Q11925281", "Q11925286", "Q11925294", "Q11925311", "Q11925432", "Q11925438", "Q11925455", "Q11925576", "Q11925589", "Q11926000", "Q11926001", "Q11926060", "Q11926141", "Q11926184", "Q11926192", "Q11926198", "Q11926317", "Q11926387", "Q11926413", "Q11926503", "Q11926561", "Q11926564", "Q11926589", "Q11926755", "Q11926853", "Q11926899", "Q11926968", "Q11927021", "Q11929497", "Q11929595", "Q11929635", "Q11929668", "Q11929681", "Q11929692", "Q11929813", "Q11930000", "Q11930644", "Q11931072", "Q11931097", "Q11931146", "Q11931147", "Q11931236", "Q11931241", "Q11931246", "Q11931301", "Q11931798", "Q11931950", "Q11932040", "Q11933999", "Q11934232", "Q11934283", "Q11934284", "Q11934291", "Q11934300", "Q11934523", "Q11934572", "Q11934662", "Q11934787", "Q11935060", "Q11935295", "Q11935569", "Q11936119", "Q11936175", "Q11936310", "Q11936311", "Q11936411", "Q11936430", "Q11936456", "Q11936483", "Q11936492", "Q11936724", "Q11936725", "Q11936726", "Q11936815", "Q11936845", "Q11937108", "Q11937776", "Q11937856", "Q11937880", "Q11938024", "Q11938028", "Q11938267", "Q11938328", "Q11938336", "Q11938344", "Q11938434", "Q11938600", "Q11938603", "Q11938653", "Q11938655", "Q11938656", "Q11939018", "Q11939024", "Q11939109", "Q11939601", "Q11939621", "Q11939639", "Q11939754", "Q11939899", "Q11939902", "Q11940207", "Q11940225", "Q11940236", "Q11940407", "Q11941360", "Q11941612", "Q11941720", "Q11941760", "Q11942112", "Q11942475", "Q11942554", "Q11944061", "Q11944351", "Q11946591", "Q11946622", "Q11946688", "Q11946713", "Q11946863", "Q11947731", "Q11947732", "Q11947748", "Q11947754", "Q11949614", "Q11949674", "Q11949742", "Q11949854", "Q11949874", "Q11949948", "Q11950409", "Q11950443", "Q11950528", "Q11950583", "Q11950612", "Q11950700", "Q11950776", "Q11950835", "Q11950837", "Q11950881", "Q11950894", "Q11950934", "Q11950974", "Q11951222", "Q11951565", "Q11951621", "Q11951665", "Q11951793", "Q11951823", "Q11952027", "Q11952068", "Q11952143", "Q11952993", "Q11953079", "Q11953150", "Q11953197", "Q11953360", "Q11953365", "Q11953408", "Q11953805", "Q11953889", "Q11954075", "Q11954085", "Q11954122", "Q11954189", "Q11954442", "Q11955023", "Q11955083", "Q11955098", "Q11955111", "Q11955116", "Q11955184", "Q11955238", "Q11955240", "Q11955460", "Q11955549", "Q11955570", "Q11955606", "Q11955612", "Q11955620", "Q11955622", "Q11955652", "Q11989329", "Q12059689", "Q12115162", "Q12126543", "Q12146576", "Q12180000", "Q12184391", "Q12184496", "Q12184689", "Q12185219", "Q12185451", "Q12186298", "Q12186493", "Q12186515", "Q12186928", "Q12187525", "Q12187701", "Q12187714", "Q12187740", "Q12187916", "Q12187930", "Q12187948", "Q12188030", "Q12188056", "Q12188359", "Q12188617", "Q12188818", "Q12188944", "Q12189023", "Q12189084", "Q12189155", "Q12189158", "Q12189422", "Q12189449", "Q12189530", "Q12189776", "Q12189989", "Q12190071", "Q12190227", "Q12190515", "Q12190542", "Q12190793", "Q12191078", "Q12191144", "Q12191415", "Q12191447", "Q12191490", "Q12192163", "Q12192260", "Q12192403", "Q12192449", "Q12192588", "Q12192860", "Q12193261", "Q12193560", "Q12193589", "Q12193707", "Q12193891", "Q12193915", "Q12193973", "Q12194127", "Q12194169", "Q12194422", "Q12194598", "Q12194637", "Q12195127", "Q12195639", "Q12195788", "Q12196044", "Q12197650", "Q12197874", "Q12199525", "Q12199726", "Q12200476", "Q12200575", "Q12201321", "Q12201790", "Q12201989", "Q12202359", "Q12202762", "Q12204956", "Q12205208", "Q12207016", "Q12207019", "Q12207042", "Q12207477", "Q12209190", "Q12209192", "Q12209238", "Q12209250", "Q12209309", "Q12209342", "Q12209345", "Q12209384", "Q12209423", "Q12209474", "Q12209477", "Q12209556", "Q12209560", "Q12209578", "Q12209579", "Q12209582", "Q12209603", "Q12209635", "Q12209705", "Q12209711", "Q12209712", "Q12209727", "Q12209764", "Q12210853", "Q12211002", "Q12211943", "Q12212707", "Q12213476", "Q12213554", "Q12214074", "Q12214318", "Q12214550", "Q12215069", "Q12215319", "Q12215911", "Q12216525", "Q12217454", "Q12218533", "Q12218873", "Q12218941", "Q12219186", "Q12220316", "Q12220509", "Q12220631", "Q12220632", "Q12224236", "Q12227171", "Q12227613", "Q12229073", "Q12230559", "Q12232879", "Q12233153", "Q12233466", "Q12233488", "Q12233558", "Q12234512", "Q12234596", "Q12234940", "Q12234980", "Q12235706", "Q12238566", "Q12238873", "Q12239463", "Q12241799", "Q12241854", "Q12241857", "Q12241887", "Q12241891", "Q12241893", "Q12241940", "Q12242323", "Q12242399", "Q12242935", "Q12243521", "Q12245008", "Q12245024", "Q12246436", "Q12246625", "Q12248469", "Q12248676", "Q12249029", "Q12250817", "Q12256462", "Q12274956", "Q12286651", "Q12345194", "Q12346240", "Q12352265", "Q12353234", "Q12357278", "Q12359550", "Q12374357", "Q12375138", "Q12390404", "Q12390415", "Q12390760", "Q12401528", "Q12401568", "Q12403127", "Q12489692", "Q12520861", "Q12530186", "Q12533648", "Q12535419", "Q12535762", "Q12536050", "Q12536243", "Q12536268", "Q12536274", "Q12537795", "Q12538082", "Q12538332", "Q12538422", "Q12538663", "Q12539468", "Q12539515", "Q12540592", "Q12541055", "Q12541090", "Q12546631", "Q12547673", "Q12547674", "Q12547959", "Q12548032", "Q12548033", "Q12549210", "Q12549229", "Q12549482", "Q12549498", "Q12549538", "Q12549868", "Q12550263", "Q12551519", "Q12551520", "Q12551704", "Q12551744", "Q12551881", "Q12551910", "Q12551911", "Q12552054", "Q12552097", "Q12552098", "Q12552099", "Q12552126", "Q12552762", "Q12552963", "Q12553746", "Q12554061", "Q12554391", "Q12554781", "Q12554801", "Q12555944", "Q12555948", "Q12556472", "Q12556475", "Q12556476", "Q12556477", "Q12556566", "Q12556903", "Q12557873", "Q12558974", "Q12559006", "Q12559406", "Q12559407", "Q12559677", "Q12560253", "Q12560411", "Q12560740", "Q12560957", "Q12561266", "Q12562341", "Q12562436", "Q12562437", "Q12562440", "Q12562441", "Q12562442", "Q12562446", "Q12562448", "Q12562450", "Q12562451", "Q12562453", "Q12562455", "Q12562456", "Q12562458", "Q12562462", "Q12562463", "Q12562464", "Q12562465", "Q12562466", "Q12562467", "Q12562469", "Q12562470", "Q12562473", "Q12562474", "Q12562476", "Q12562532", "Q12562598", "Q12562988", "Q12563046", "Q12563727", "Q12563728", "Q12563729", "Q12564949", "Q12564950", "Q12564951", "Q12564952", "Q12564953", "Q12564954", "Q12564955", "Q12564956", "Q12564957", "Q12564958", "Q12564959", "Q12564961", "Q12564963", "Q12564964", "Q12566128", "Q12566375", "Q12566452", "Q12568210", "Q12568388", "Q12568626", "Q12568997", "Q12569148", "Q12569288", "Q12569520", "Q12569522", "Q12571390", "Q12571796", "Q12571804", "Q12571806", "Q12609184", "Q12634651", "Q12646101", "Q12685605", "Q12685644", "Q12685747", "Q12686738", "Q12686930", "Q12688348", "Q12688550", "Q12690256", "Q12690481", "Q12691312", "Q12697558", "Q12698776", "Q12699022", "Q12699043", "Q12699781", "Q12700646", "Q12701702", "Q12708770", "Q12709229", "Q12709357", "Q12709419", "Q12709615", "Q12711300", "Q12715526", "Q12732033", "Q12743707", "Q12787056", "Q12824866", "Q12825018", "Q12825686", "Q12828789", "Q12829712", "Q12831146", "Q12831394", "Q12833394", "Q12845287", "Q12877252", "Q12881477", "Q12881994", "Q12884189", "Q12888448", "Q12890620", "Q12893305", "Q12897993", "Q12898273", "Q12956773", "Q12984995", "Q13015151", "Q13037424", "Q13046194", "Q13046345", "Q13060024", "Q13065889", "Q13094249", "Q13094637", "Q13095376", "Q13097231", "Q13100072", "Q13139122", "Q13140702", "Q13140703", "Q13141363", "Q13188714", "Q13189168", "Q13189443", "Q13189564", "Q13189679", "Q13190763", "Q13191052", "Q13191114", "Q13360574", "Q13365870", "Q13634887", "Q13635068", "Q13637388", "Q13638193", "Q13655778", "Q13740935", "Q13814733", "Q13957085", "Q14028321", "Q14060205", "Q14203238", "Q14204056", "Q14204629", "Q14204826", "Q14206889", "Q14207198", "Q14207530", "Q14208893", "Q14213648", "Q14215956", "Q14217100", "Q14218845", "Q14219428", "Q14219787", "Q14220126", "Q14220314", "Q14220534", "Q14221464", "Q14221716", "Q14222058", "Q14222661", "Q14226379", "Q14236161", "Q14517894", "Q14523368", "Q14524048", "Q14623748", "Q14900639", "Q14920600", "Q14928192", "Q14955813", "Q15063114", "Q15156199", "Q15179688", "Q15192658", "Q15207968", "Q15229230", "Q15244462", "Q15247898", "Q15248566", "Q15260737", "Q15261696", "Q15272287", "Q15275308", "Q15277648", "Q15411354", "Q15411644", "Q15411978", "Q15506930", "Q15507021", "Q15554012", "Q15708442", "Q15723752", "Q15730054", "Q15776943", "Q15806224", "Q15879634", "Q15895448", "Q15924011", "Q15927358", "Q15934709", "Q15966111", "Q15972991", "Q16005686", "Q16010634", "Q16045278", "Q16046152", "Q16049416", "Q16051569", "Q16052654", "Q16052713", "Q16068685", "Q16069637", "Q16117788", "Q16118885", "Q16120028", "Q16121312", "Q16122205", "Q16122766", "Q16220881", "Q16257679", "Q16258125", "Q16303925", "Q16304164", "Q16319265", "Q16319283", "Q16329777", "Q16330169", "Q16355285", "Q16358899", "Q16376641", "Q16465942", "Q16508147", "Q16509748", "Q16510368", "Q16523298", "Q16526959", "Q16559728", "Q16576408", "Q16587384", "Q16612682", "Q16628307", "Q16628330", "Q16629473", "Q16644893", "Q16645100", "Q16645326", "Q16647402", "Q16667804", "Q16676721", "Q16727024", "Q16734017", "Q16765057", "Q16890238", "Q16891715", "Q16898113", "Q16898607", "Q16920553", "Q16964589", "Q16977290", "Q17026198", "Q17055090", "Q17077319", "Q17081237", "Q17297395", "Q17449251", "Q17586994", "Q17623836", "Q17627929", "Q18207676", "Q18285914", "Q18347469", "Q18351710", "Q18368176", "Q18389044", "Q18419392", "Q18459276", "Q18465837", "Q18535266", "Q18592055", "Q18696315", "Q18696933", "Q18788784", "Q18795368", "Q18800799", "Q18803101", "Q18943508", "Q19343677", "Q19507712", "Q19542981", "Q19542984", "Q19588497", "Q19598752", "Q19657399", "Q19713720", "Q19715112", "Q19717047", "Q19718760", "Q19758976", "Q19824930", "Q19835573", "Q19850332", "Q19858176", "Q19876621", "Q19900870", "Q19901222", "Q19977751", "Q20020658", "Q20022186", "Q20074605", "Q20085842", "Q20085844", "Q20102648", "Q20102711", "Q20102718", "Q20102876", "Q20107757", "Q20107809", "Q20108000", "Q20108068", "Q20108173", "Q20108207", "Q20108209", "Q20108215", "Q20108275", "Q20108326", "Q20108333", "Q20108391", "Q20108409", "Q20108468", "Q20108523", "Q20108531", "Q20108542", "Q20108570", "Q20108619", "Q20108623", "Q20108649", "Q20108650", "Q20108679", "Q20108708", "Q20108766", "Q20108893", "Q20108952", "Q20108991", "Q20109049", "Q20109055", "Q20109102", "Q20109106", "Q20109123", "Q20139591", "Q20204317", "Q20204353", "Q20220404", "Q20224679", "Q20229329", "Q20249052", "Q20252359", "Q20289664", "Q20292722", "Q20382277", "Q20382484", "Q20390794", "Q20396292", "Q20399771", "Q20404696", "Q20413554", "Q20415747", "Q20417588", "Q20419412", "Q20423389", "Q20423415", "Q20423540", "Q20423959", "Q20452780", "Q20452993", "Q20463473", "Q20463478", "Q20464883", "Q20477886", "Q20479852", "Q20480430", "Q20482060", "Q20483985", "Q20483988", "Q20484024", "Q20484032", "Q20484082", "Q20484171", "Q20484190", "Q20484211", "Q20484258", "Q20484369", "Q20484420", "Q20484423", "Q20484433", "Q20484436", "Q20484570", "Q20484586", "Q20484637", "Q20484762", "Q20484859", "Q20484864", "Q20484870", "Q20484993", "Q20485010", "Q20485019", "Q20485029", "Q20485042", "Q20485073", "Q20485163", "Q20485203", "Q20485258", "Q20485371", "Q20485381", "Q20485400", "Q20485407", "Q20485501", "Q20485512", "Q20485544", "Q20485548", "Q20485550", "Q20485693", "Q20485695", "Q20485731", "Q20485756", "Q20485825", "Q20485844", "Q20485881", "Q20485886", "Q20485895", "Q20485900", "Q20485950", "Q20485981", "Q20485984", "Q20486033", "Q20486037", "Q20502362", "Q20502588", "Q20502763", "Q20577232", "Q20584179", "Q20584189", "Q20587345", "Q20589670", "Q20599584", "Q20601279", "Q20620795", "Q20641708", "Q20669755", "Q20809745", "Q20809750", "Q20809754", "Q20809757", "Q20829828", "Q20861269", "Q20870856", "Q20870954", "Q20870966", "Q20966341", "Q20968258", "Q20969217", "Q20969331", "Q20976571", "Q20976908", "Q20982437", "Q20993686", "Q20995230", "Q21010221", "Q21044453", "Q21044532", "Q21053651", "Q21075159", "Q21075306", "Q21076331", "Q21076417", "Q21076437", "Q21076439", "Q21076455", "Q21076466", "Q21076480", "Q21076521", "Q21076523", "Q21076566", "Q21076567", "Q21076615", "Q21081228", "Q21087999", "Q21088738", "Q21088741", "Q21092595", "Q21095127", "Q21095137", "Q21095147", "Q21095193", "Q21095801", "Q21099418", "Q21123396", "Q21140688", "Q21409363", "Q21414421", "Q21587147", "Q21589819", "Q21645767", "Q21654817", "Q21656191", "Q21711493", "Q21712004", "Q21712896", "Q21746018", "Q21746051", "Q21748569", "Q21754863", "Q21760204", "Q21764698", "Q21765449", "Q21765562", "Q21765751", "Q21767677", "Q21767697", "Q21769011", "Q21769082", "Q21787794", "Q21787833", "Q21787866", "Q21788741", "Q21788742", "Q21790695", "Q21790698", "Q21806727", "Q21873543", "Q21979688", "Q21994179", "Q21995688", "Q22002185", "Q22002188", "Q22002189", "Q22002193", "Q22002195", "Q22002198", "Q22002202", "Q22002205", "Q22002206", "Q22002207", "Q22002208", "Q22002209", "Q22002210", "Q22002211", "Q22002212", "Q22002213", "Q22002215", "Q22002218", "Q22002219", "Q22002223", "Q22002225", "Q22002226", "Q22002228", "Q22002230", "Q22002231", "Q22002232", "Q22002233", "Q22002234", "Q22002236", "Q22002481", "Q22018317", "Q22020210", "Q22035307", "Q22038711", "Q22042365", "Q22060164", "Q22064499", "Q22082386", "Q22132450", "Q22347637", "Q22350804", "Q22350840", "Q22350865", "Q22680674", "Q22680860", "Q22694790", "Q22914735", "Q22928906", "Q22928988", "Q22929853", "Q22931319", "Q22935181", "Q22948561", "Q22961958", "Q22969731", "Q23012947", "Q23012952", "Q23012983", "Q23013006", "Q23013009", "Q23013059", "Q23013060", "Q23013064", "Q23013122", "Q23013147", "Q23013165", "Q23013166", "Q23013167", "Q23015066", "Q23017320", "Q23017954", "Q23048675", "Q23188658", "Q23498650", "Q23498869", "Q23499016", "Q23499058", "Q23499059", "Q23649433", "Q23682533", "Q23696223", "Q23766515", "Q23808321", "Q23808322", "Q23808328", "Q23808330", "Q23808365", "Q23808755", "Q23835648", "Q23858165", "Q23915191", "Q23929256", "Q23958347", "Q23979008", "Q23979439", "Q23982169", "Q23984135", "Q23984786", "Q23986458", "Q23986680", "Q23992498", "Q23992507", "Q23995893", "Q23995898", "Q24001084", "Q24004465", "Q24007770", "Q24008496", "Q24008770", "Q24009397", "Q24009437", "Q24009550", "Q24010459", "Q24011583", "Q24011926", "Q24012279", "Q24012306", "Q24012739", "Q24013138", "Q24013224", "Q24013285", "Q24013418", "Q24013887", "Q24014143", "Q24014203", "Q24015194", "Q24016460", "Q24026909", "Q24036336", "Q24045698", "Q24045719", "Q24053081", "Q24061831", "Q24260573", "Q24261002", "Q24265917", "Q24288527", "Q24341876", "Q24573853", "Q24828295", "Q24881908", "Q24882650", "Q24886515", "Q24887144", "Q24906131", "Q24907418", "Q24907536", "Q24909819", "Q24927921", "Q24929370", "Q24930608", "Q24934489", "Q24946388", "Q24949000", "Q24952263", "Q24952482", "Q25053057", "Q25056931", "Q25230774", "Q25247514", "Q25247574", "Q25247751", "Q25247765", "Q25302843", "Q25388051", "Q25388976", "Q25396900", "Q25397474", "Q25421479", "Q25421489", "Q25421494", "Q25451465", "Q25461611", "Q25478034", "Q25478465", "Q25478552", "Q25486634", "Q25491022", "Q25530748", "Q25530765", "Q25581618", "Q25582176", "Q25582178", "Q25582182", "Q25582183", "Q25582188", "Q25582190", "Q25582194", "Q25582196", "Q25582199", "Q25582203", "Q25582204", "Q25582222", "Q25582225", "Q25582232", "Q25582235", "Q25583217", "Q25583220", "Q25583229", "Q25587399", "Q25589206", "Q25589403", "Q25591146", "Q25591147", "Q25591356", "Q25591364", "Q25591391", "Q25591393", "Q25591422", "Q25591430", "Q25591446", "Q25591451", "Q25591470", "Q25591484", "Q25634166", "Q25652788", "Q25695142", "Q25767774", "Q25768004", "Q25768133", "Q25805133", "Q25850565", "Q25990692", "Q26200857", "Q26233856", "Q26296883", "Q26747720", "Q26761871", "Q26772254", "Q26772333", "Q26866040", "Q27096933", "Q27122897", "Q27125336", "Q27125366", "Q27125371", "Q27189578", "Q27459466", "Q27530903", "Q27541457", "Q27573903", "Q27768283", "Q27910419", "Q27940770", "Q27994547", "Q28122652", "Q28154023", "Q28154409", "Q28219801", "Q28220653", "Q28220931", "Q28221538", "Q28223524", "Q28319968", "Q28401698", "Q28403188", "Q28419396", "Q28502997", "Q28555089", "Q28660543", "Q28666013", "Q28682362", "Q28708391", "Q28712337", "Q28747858", "Q28883745", "Q28914824", "Q28976219", "Q28976366", "Q29001009", "Q29016316", "Q29057521", "Q29350065", "Q29512591", "Q29575107", "Q29828788", "Q29956239", "Q30027673", "Q30029393", "Q30304289", "Q30344713", "Q30590215", "Q30590864", "Q30591336", "Q30593336", "Q30621429", "Q30622001", "Q30624191", "Q30752877", "Q30897875", "Q30944028", "Q31069548", "Q31213664", "Q31298239", "Q31455237", "Q31455238", "Q31455249", "Q31455252", "Q31455253", "Q31455254", "Q31455255", "Q31467408", "Q31513084", "Q31555441", "Q31558934", "Q31571687", "Q31571899", "Q31590351", "Q31755139", "Q31812672", "Q31824038", "Q31844059", "Q31850648", "Q31850976", "Q31852421", "Q31877141", "Q31891842", "Q31891847", "Q31898193", "Q31910934", "Q31913048", "Q31914172", "Q31914790", "Q31915927", "Q31916975", "Q31917158", "Q31917885", "Q31918671", "Q31918813", "Q31923541", "Q31925653", "Q31925679", "Q31926034", "Q31997476", "Q32055985", "Q32061466", "Q32063702", "Q32067904", "Q32137066", "Q32189647", "Q32361660", "Q32361661", "Q33019826", "Q33421017", "Q33421377", "Q33427844", "Q33432868", "Q33439340", "Q33461897", "Q33512335", "Q33529058", "Q33659069", "Q35640709", "Q35969205", "Q38298753", "Q38372119", "Q39297398", "Q41876951", "Q42109661", "Q42271976", "Q42316051", "Q42328401", "Q42555003", "Q42555300", "Q42592114", "Q42900680", "Q43033003", "Q43174653", "Q43212685", "Q43212781", "Q43252758", "Q46187190", "Q46451010", "Q47045330", "Q47045335", "Q47227519", "Q48728388", "Q48731532", "Q48733876", "Q48770924", "Q48848557", "Q48856412", "Q48880737", "Q49277152", "Q49277802", "Q49278237", "Q49278394", "Q49279284", "Q49280472", "Q49288767", "Q49364945", "Q49367049", "Q49371613", "Q49403792", "Q49755148", "Q50293544", "Q50358912", "Q51338366", "Q51389725", "Q51462855", "Q51885230", "Q52153735", "Q52555450", "Q52873082", "Q53314634", "Q54556713", "Q54888161", "Q55048249", "Q55144231", "Q55232766", "Q55232785", "Q55440278", "Q55608706", "Q55615961", "Q55616318", "Q55621920", "Q55630059", "Q55634648", "Q55695431", "Q55868696", "Q55893348", "Q56121478", "Q56241563", "Q56244320", "Q56244324", "Q56250654", "Q56271982", "Q56291123", "Q56293133", "Q56301283", "Q56301285", "Q56302707", "Q56322069", "Q56376612", "Q56400692", "Q56668978", "Q57079173", "Q58085822", "Q59985053", "Q59987223", "Q60054250", "Q60213117", "Q60572327", "Q60577104", "Q60791070", "Q60791571", "Q60792211", "Q60848484", "Q60997513", "Q61074099", "Q61079103", "Q61082735", "Q61277556", "Q61708053", "Q61941883", "Q62789749", "Q63122627", "Q63884249", "Q64523396", "Q64697794", "Q64769073", "Q65057733", "Q65078458", "Q65212614", "Q65298155", "Q65299509", "Q65300020", "Q65309550", "Q65325125", "Q65397554", "Q65424418", "Q66336728", "Q66426746", "Q66644816", "Q66813953", "Q67168350", "Q68012046", "Q68169453", "Q68169455", "Q68169457", "Q72861632", "Q73042984", "Q78745614", "Q80349557", "Q81923050", "Q81970326", "Q83184814", "Q84047391", "Q84779307", "Q84794369", "Q85098690", "Q85313545", "Q85635706", "Q85740734", "Q85747607", "Q85785836", "Q85793558", "Q85874318", "Q85968436", "Q85977621", "Q86682012", "Q87063496", "Q87496085", "Q87842497", "Q88211613", "Q88220438", "Q88224191", "Q88231421", "Q88237042", "Q88296583", "Q88301462", "Q88313418", "Q88324056", "Q88329445", "Q88332316", "Q88342098", "Q88402260", "Q88413883", "Q88485527", "Q88485575", "Q88485593", "Q88694311", "Q88694313", "Q88696397", "Q88719149", "Q88719156", "Q88719161", "Q88808647", "Q88808649", "Q88808658", "Q89129532", "Q89306983", "Q89604177", "Q89604178", "Q90309498", "Q91204461", "Q91209174", "Q91216554", "Q91302415", "Q91353166", "Q93979253", "Q96142556", "Q96143966", "Q96395299", "Q96395867", "Q96484029", "Q96484031", "Q96484032", "Q96484033", "Q96484035", "Q96484036", "Q96484037", "Q96484038", "Q96484039", "Q96484040", "Q96484041", "Q96484042", "Q96484043", "Q96484044", "Q96484045", "Q96484047", "Q96484049", "Q96484050", "Q96484051", "Q96596873", "Q96596875", "Q96596876", "Q96596879", "Q96596883", "Q96596885", "Q96596886", "Q96596888", "Q96596889", "Q96596890", "Q96596893", "Q96596896", "Q96596898", "Q96596899", "Q96596901", "Q96596902", "Q96596908", "Q96596914", "Q96596921", "Q96596928", "Q96596939", "Q96596946", "Q96596949", "Q96596950", "Q96596961", "Q96596966", "Q96596972", "Q96596981", "Q96596988", "Q96596994", "Q96596999", "Q96597004", "Q96597010", "Q96597015", "Q96597024", "Q97166215", "Q97177600", "Q97207840", "Q97254370", "Q97255767", "Q97285857", "Q97286129", "Q97286365", "Q97290977", "Q97291034", "Q97291232", "Q97291607", "Q97291686", "Q97291737", "Q97291790", "Q97300483", "Q97316502", "Q97366861", "Q97601506", "Q97602066", "Q97605119", "Q97605270", "Q97616365", "Q97616794", "Q97616795", "Q97616842", "Q97616963", "Q97617104", "Q97617126", "Q97617161", "Q97617180", "Q97617187", "Q97617242", "Q97617245", "Q97617264", "Q97617734", "Q97619016", "Q97619302", "Q97619318", "Q97619324", "Q97619325", "Q97619543", "Q97620135", "Q97620148", "Q97620169", "Q97620213", "Q97620410", "Q97620433", "Q97620485", "Q97620519", "Q97620532", "Q97620539", "Q97620540", "Q97620546", "Q97620586", "Q97620610", "Q97621946", "Q97621948", "Q97621954", "Q97622593", "Q97622693", "Q97622784", "Q97622789", "Q97622911", "Q97622912", "Q97622913", "Q97623002", "Q97623422", "Q97623588", "Q97623897", "Q97623925", "Q97623953", "Q97624152", "Q97625106", "Q97625159", "Q97625262", "Q97625289", "Q97625434", "Q97625439", "Q97625457", "Q97625608", "Q97625617", "Q97625618", "Q97625650", "Q97625957", "Q97628335", "Q97628361", "Q97628362", "Q97628403", "Q97628509", "Q97628610", "Q97628646", "Q97628796", "Q97629481", "Q97629568", "Q97631015", "Q97631083", "Q97631157", "Q97631170", "Q97631201", "Q97631223", "Q97631247", "Q97631581", "Q97631621", "Q97631664", "Q97631669", "Q97631836", "Q97631860", "Q97632023", "Q97632047", "Q97632093", "Q97633731", "Q97633766", "Q97633798", "Q97633905", "Q97633951", "Q97634144", "Q97634170", "Q97634236", "Q97635493", "Q97635649", "Q97642022", "Q97642035", "Q97642791", "Q97643032", "Q97643194", "Q97643219", "Q97643383", "Q97643393", "Q97643883", "Q97644376", "Q97644429", "Q97644437", "Q97644588", "Q97644751", "Q97645044", "Q97645201", "Q97645234", "Q97645548", "Q97645611", "Q97645792", "Q97645794", "Q97645904", "Q97646127", "Q97646148", "Q97646518", "Q97646739", "Q97647044", "Q97647058", "Q97647204", "Q97648067", "Q97648118", "Q97648125", "Q97648243", "Q97650902", "Q97652476", "Q97653696", "Q97653697", "Q97653855", "Q97654181", "Q98008573", "Q98059431", "Q98060606", "Q98060685", "Q98062010", "Q98110217", "Q98381550", "Q98501460", "Q98505058", "Q98867105", "Q98869161", "Q98972377", "Q99239828", "Q99458251", "Q99735485", "Q100234030", "Q101002825", "Q101145616", "Q101186473", "Q102180841", "Q102282494", "Q102290707", "Q102291018", "Q102312393", "Q102355646", "Q102428504", "Q104050371", "Q104591642", "Q104654963", "Q104656158", "Q104656674", "Q104657473", "Q104657987", "Q104658082", "Q104658251", "Q104658390", "Q104658393", "Q104658775", "Q104658935", "Q104658950", "Q104665636", "Q104670297", "Q104670310", "Q104670333", "Q104670336", "Q104670404", "Q104670507", "Q104670560", "Q104670567", "Q104670572", "Q104670802", "Q104670836", "Q104670943", "Q104670989", "Q104671195", "Q104671210", "Q104671410", "Q104671462", "Q104679971", "Q104680188", "Q104713256", "Q104717406", "Q104861662", "Q105076326", "Q105123905", "Q105336395", "Q105358597", "Q105358598", "Q105358600", "Q105358605", "Q105392233", "Q105392236", "Q105409933", "Q105908755", "Q105970025", "Q106046148", "Q106095709", "Q106095820", "Q106095944", "Q106100847", "Q106101158", "Q106285411", "Q106510487", "Q106581522", "Q106849514", "Q106869611", "Q106904207", "Q106914446", "Q107013371", "Q107024198", "Q107173751", "Q107527228", "Q107658630", "Q108036365", "Q108037197", "Q108103451", "Q108103556", "Q108114535", "Q108114607", "Q108114814", "Q108124174", "Q108133113", "Q108145158", "Q108147538", "Q108150764", "Q108208378", "Q108209953", "Q108223053", "Q108227837", "Q108228329", "Q108248706", "Q108250894", "Q108254387", "Q108254637", "Q108266881", "Q108301469", "Q108554160", "Q108750045", "Q108777536", "Q108886420", "Q108908310", "Q109331101", "Q109332166", "Q109423216", "Q109432160", "Q109548535", "Q109571818", "Q109760152", "Q109887582", "Q109888963", "Q109918035", "Q109918213", "Q109923997", "Q109928346", "Q110100403", "Q110111747", "Q110189401", "Q110243632", "Q110307937", "Q110561338", "Q110647975", "Q110812156", "Q110867387", "Q110918178", "Q111016813", "Q111080250", "Q111174565", "Q111190727", "Q111207264", "Q111260922", "Q111285560", "Q111285601", "Q111285603", "Q111285623", "Q111291650", "Q111430002", "Q111494210", "Q111607005", "Q111607192", "Q111731341", "Q111830847", "Q112110813", "Q112153435", "Q112248191", "Q112309778", "Q112620253", "Q113141522", "Q113303708", "Q113336184", "Q113358512", "Q113368834", "Q113577306", "Q113621163", "Q113626518", "Q113827285", "Q113941007", "Q113952413", "Q113995533", "Q114554928", "Q114839543", "Q114959355", "Q115045527", "Q115378358", "Q115707125", "Q115738587", "Q115768043", "Q115869414", "Q115977790", "Q116044468", "Q116046574", "Q116160279", "Q116170766", "Q116175360", "Q116262957", "Q116371547", "Q116423012", "Q116436925", "Q116437137", "Q116450456", "Q116452341", "Q116517569", "Q116690749", "Q116695556", "Q116759598", "Q116813782", "Q116943402", "Q117074584", "Q117335925", "Q117468830", "Q117614775", "Q117808928", "Q117831271", "Q118113927", "Q118366736", "Q118434309", "Q118954480", "Q118957962", "Q119133024", "Q119496031", "Q119806208", "Q120635414", "Q121074736", "Q121075080", "Q121150916", "Q121359147", "Q121619418", "Q121620396", "Q122439773", "Q122460788", "Q122475510", "Q122475547", "Q122581568", "Q122609583", "Q122881581", "Q123022482", "Q123174109",]
-# big cities
-items = items + [ "Q61" , "Q62" , "Q64" , "Q65" , "Q70" , "Q71" , "Q78" , "Q85" , "Q87" , "Q100" , "Q172" , "Q174" , "Q220" , "Q239" , "Q240" , "Q268" , "Q270" , "Q279" , "Q288" , "Q334" , "Q350" , "Q365" , "Q384" , "Q385" , "Q393" , "Q437" , "Q456" , "Q459" , "Q472" , "Q490" , "Q495" , "Q546" , "Q580" , "Q582" , "Q585" , "Q586" , "Q588" , "Q597" , "Q598" , "Q612" , "Q617" , "Q628" , "Q641" , "Q647" , "Q648" , "Q649" , "Q656" , "Q690" , "Q715" , "Q727" , "Q749" , "Q761" , "Q793" , "Q807" , "Q883" , "Q887" , "Q891" , "Q894" , "Q898" , "Q900" , "Q911" , "Q914" , "Q915" , "Q919" , "Q956" , "Q975" , "Q976" , "Q994" , "Q1010" , "Q1017" , "Q1022" , "Q1040" , "Q1055" , "Q1070" , "Q1083" , "Q1085" , "Q1154" , "Q1218" , "Q1289" , "Q1295" , "Q1296" , "Q1297" , "Q1309" , "Q1342" , "Q1352" , "Q1355" , "Q1362" , "Q1435" , "Q1449" , "Q1461" , "Q1476" , "Q1479" , "Q1486" , "Q1489" , "Q1490" , "Q1491" , "Q1513" , "Q1515" , "Q1520" , "Q1524" , "Q3889" , "Q3894" , "Q3897" , "Q3901" , "Q3909" , "Q3915" , "Q3919" , "Q3921" , "Q3926" , "Q3927" , "Q3929" , "Q3935" , "Q3977" , "Q3992" , "Q4035" , "Q4093" , "Q4301" , "Q4361" , "Q4454" , "Q4469" , "Q4582" , "Q4629" , "Q4709" , "Q4970" , "Q5083" , "Q5087" , "Q5088" , "Q5112" , "Q5168" , "Q5196" , "Q5206" , "Q5326" , "Q5332" , "Q5337" , "Q5343" , "Q5384" , "Q5426" , "Q5449" , "Q5465" , "Q5468" , "Q5470" , "Q5540" , "Q5627" , "Q5713" , "Q5753" , "Q5764" , "Q5815" , "Q5826" , "Q5869" , "Q5917" , "Q6014" , "Q6046" , "Q6106" , "Q6221" , "Q6225" , "Q6252" , "Q6346" , "Q6441" , "Q6487" , "Q6506" , "Q6509" , "Q6526" , "Q6537" , "Q6548" , "Q6576" , "Q6602" , "Q6610" , "Q6640" , "Q6647" , "Q6730" , "Q6761" , "Q6816" , "Q7003" , "Q7525" , "Q7550" , "Q7859" , "Q7880" , "Q8247" , "Q8252" , "Q8254" , "Q8385" , "Q8471" , "Q8621" , "Q8646" , "Q8660" , "Q8673" , "Q8678" , "Q8684" , "Q8686" , "Q8969" , "Q9022" , "Q9125" , "Q9270" , "Q9310" , "Q9347" , "Q9361" , "Q9365" , "Q9733" , "Q9777" , "Q9824" , "Q9832" , "Q9863" , "Q9885" , "Q9920" , "Q10002" , "Q10086" , "Q10566" , "Q10686" , "Q10690" , "Q10717" , "Q11194" , "Q11283" , "Q11568" , "Q11711" , "Q11720" , "Q11736" , "Q11739" , "Q11746" , "Q11854" , "Q11909" , "Q11910" , "Q11959" , "Q11977" , "Q12191" , "Q12193" , "Q12258" , "Q12439" , "Q12886" , "Q12892" , "Q12994" , "Q13030" , "Q13298" , "Q13329" , "Q13360" , "Q13362" , "Q13364" , "Q13367" , "Q13369" , "Q13377" , "Q13379" , "Q13498" , "Q13629" , "Q13666" , "Q13670" , "Q13695" , "Q14440" , "Q14467" , "Q14773" , "Q14960" , "Q15092" , "Q15174" , "Q15468" , "Q15470" , "Q15674" , "Q15760" , "Q15767" , "Q16552" , "Q16553" , "Q16554" , "Q16555" , "Q16556" , "Q16557" , "Q16558" , "Q16559" , "Q16562" , "Q16563" , "Q16565" , "Q16567" , "Q16568" , "Q16572" , "Q16666" , "Q16739" , "Q16868" , "Q16910" , "Q16959" , "Q17042" , "Q17139" , "Q17151" , "Q17943" , "Q18013" , "Q18094" , "Q18125" , "Q18383" , "Q18575" , "Q18780" , "Q18808" , "Q19157" , "Q19313" , "Q19316" , "Q19491" , "Q19566" , "Q19660" , "Q19689" , "Q20714" , "Q20921" , "Q20927" , "Q20929" , "Q21194" , "Q21197" , "Q22595" , "Q22690" , "Q23025" , "Q23044" , "Q23051" , "Q23154" , "Q23185" , "Q23197" , "Q23430" , "Q23436" , "Q23438" , "Q23443" , "Q23482" , "Q23551" , "Q23556" , "Q23564" , "Q23661" , "Q23768" , "Q24603" , "Q24639" , "Q24826" , "Q24861" , "Q24879" , "Q25262" , "Q25270" , "Q25281" , "Q25282" , "Q25287" , "Q25315" , "Q25319" , "Q25331" , "Q25395" , "Q25409" , "Q25410" , "Q25411" , "Q25412" , "Q25413" , "Q25444" , "Q25475" , "Q25732" , "Q25804" , "Q26101" , "Q26134" , "Q26155" , "Q26323" , "Q26406" , "Q26410" , "Q26418" , "Q26430" , "Q26590" , "Q26600" , "Q26793" , "Q26887" , "Q27138" , "Q27161" , "Q27174" , "Q27400" , "Q27430" , "Q27469" , "Q27660" , "Q28198" , "Q28218" , "Q28237" , "Q28260" , "Q28301" , "Q28441" , "Q28515" , "Q28587" , "Q28729" , "Q28848" , "Q28911" , "Q28979" , "Q28994" , "Q28996" , "Q29003" , "Q29015" , "Q29364" , "Q29888" , "Q29962" , "Q30096" , "Q30340" , "Q30651" , "Q30951" , "Q30974" , "Q30996" , "Q31094" , "Q31350" , "Q31356" , "Q31487" , "Q33147" , "Q33292" , "Q33345" , "Q33405" , "Q33469" , "Q33486" , "Q33682" , "Q33935" , "Q33959" , "Q33986" , "Q34109" , "Q34116" , "Q34183" , "Q34218" , "Q34261" , "Q34370" , "Q34404" , "Q34405" , "Q34412" , "Q34600" , "Q34647" , "Q34664" , "Q34692" , "Q34713" , "Q34739" , "Q34750" , "Q34804" , "Q34820" , "Q34863" , "Q34932" , "Q35004" , "Q35045" , "Q35135" , "Q35178" , "Q35246" , "Q35381" , "Q35484" , "Q35747" , "Q35775" , "Q35784" , "Q36091" , "Q36160" , "Q36168" , "Q36214" , "Q36307" , "Q36312" , "Q36405" , "Q36433" , "Q36526" , "Q36647" , "Q36752" , "Q37043" , "Q37320" , "Q37333" , "Q37400" , "Q37701" , "Q37776" , "Q37836" , "Q37951" , "Q37995" , "Q38022" , "Q38234" , "Q38380" , "Q38511" , "Q38545" , "Q38811" , "Q38927" , "Q38968" , "Q39121" , "Q39450" , "Q39561" , "Q39709" , "Q40191" , "Q40194" , "Q40236" , "Q40269" , "Q40345" , "Q40347" , "Q40435" , "Q40738" , "Q40816" , "Q40840" , "Q40844" , "Q40898" , "Q41057" , "Q41087" , "Q41106" , "Q41183" , "Q41185" , "Q41211" , "Q41252" , "Q41262" , "Q41278" , "Q41283" , "Q41329" , "Q41473" , "Q41496" , "Q41538" , "Q41604" , "Q41621" , "Q41753" , "Q41819" , "Q41827" , "Q41843" , "Q41876" , "Q41963" , "Q42053" , "Q42056" , "Q42057" , "Q42059" , "Q42061" , "Q42062" , "Q1530" , "Q1533" , "Q1538" , "Q1555" , "Q1647" , "Q1663" , "Q1707" , "Q1709" , "Q1711" , "Q1715" , "Q1718" , "Q1720" , "Q1721" , "Q1724" , "Q1726" , "Q1729" , "Q1731" , "Q1733" , "Q1735" , "Q1748" , "Q1754" , "Q1757" , "Q1761" , "Q1764" , "Q1770" , "Q1780" , "Q1792" , "Q1794" , "Q1800" , "Q1829" , "Q1842" , "Q1850" , "Q1854" , "Q1858" , "Q1861" , "Q1865" , "Q1867" , "Q1877" , "Q1880" , "Q1891" , "Q1895" , "Q1903" , "Q1930" , "Q1947" , "Q1953" , "Q1960" , "Q1963" , "Q2028" , "Q2044" , "Q2066" , "Q2079" , "Q2082" , "Q2090" , "Q2096" , "Q2100" , "Q2103" , "Q2107" , "Q2112" , "Q2119" , "Q2123" , "Q2132" , "Q2135" , "Q2141" , "Q2143" , "Q2145" , "Q2203" , "Q2214" , "Q2235" , "Q2280" , "Q2288" , "Q2337" , "Q2423" , "Q2467" , "Q2471" , "Q2634" , "Q2656" , "Q2678" , "Q2683" , "Q2684" , "Q2706" , "Q2742" , "Q2746" , "Q2749" , "Q2758" , "Q2765" , "Q2770" , "Q2773" , "Q2795" , "Q2801" , "Q2805" , "Q2814" , "Q2833" , "Q2837" , "Q2838" , "Q2841" , "Q2843" , "Q2844" , "Q2865" , "Q2868" , "Q2871" , "Q42066" , "Q42067" , "Q42069" , "Q42071" , "Q42073" , "Q42074" , "Q42075" , "Q42078" , "Q42080" , "Q42082" , "Q42084" , "Q42088" , "Q42089" , "Q42094" , "Q42096" , "Q42097" , "Q42098" , "Q42100" , "Q42103" , "Q42105" , "Q42108" , "Q42112" , "Q42113" , "Q42114" , "Q42116" , "Q42119" , "Q42123" , "Q42124" , "Q42125" , "Q42126" , "Q42129" , "Q42131" , "Q42134" , "Q42135" , "Q42136" , "Q42137" , "Q42140" , "Q42142" , "Q42143" , "Q42144" , "Q42147" , "Q42148" , "Q42152" , "Q42153" , "Q42154" , "Q42155" , "Q42157" , "Q42159" , "Q42163" , "Q42168" , "Q42448" , "Q42462" , "Q42622" , "Q42635" , "Q42651" , "Q42664" , "Q42666" , "Q42716" , "Q42780" , "Q42807" , "Q42810" , "Q42941" , "Q43196" , "Q43199" , "Q43301" , "Q43382" , "Q43387" , "Q43433" , "Q43453" , "Q43475" , "Q43509" , "Q43595" , "Q43668" , "Q43788" , "Q44012" , "Q44013" , "Q44016" , "Q44059" , "Q44160" , "Q44162" , "Q44198" , "Q44206" , "Q44211" , "Q44213" , "Q44214" , "Q44215" , "Q44217" , "Q44236" , "Q44237" , "Q44238" , "Q44239" , "Q44241" , "Q44243" , "Q44253" , "Q44255" , "Q44830" , "Q44989" , "Q45301" , "Q45313" , "Q45412" , "Q2880" , "Q2887" , "Q2899" , "Q2904" , "Q2907" , "Q2910" , "Q2916" , "Q2933" , "Q2936" , "Q2938" , "Q2942" , "Q2948" , "Q2966" , "Q2971" , "Q2973" , "Q2978" , "Q2999" , "Q3001" , "Q3004" , "Q3012" , "Q3014" , "Q3033" , "Q3037" , "Q3042" , "Q3046" , "Q3050" , "Q3069" , "Q3070" , "Q3075" , "Q3085" , "Q3097" , "Q3104" , "Q3110" , "Q3114" , "Q3117" , "Q3126" , "Q3130" , "Q3132" , "Q3138" , "Q3141" , "Q3150" , "Q3167" , "Q3183" , "Q3185" , "Q3200" , "Q3214" , "Q3238" , "Q3274" , "Q3306" , "Q3323" , "Q3415" , "Q3426" , "Q3437" , "Q3519" , "Q3544" , "Q3551" , "Q3561" , "Q3572" , "Q3579" , "Q3604" , "Q3612" , "Q3616" , "Q3624" , "Q3642" , "Q3646" , "Q3659" , "Q3674" , "Q3688" , "Q3711" , "Q3718" , "Q3739" , "Q3748" , "Q3750" , "Q3751" , "Q3761" , "Q3764" , "Q3766" , "Q3768" , "Q3774" , "Q3777" , "Q3780" , "Q3787" , "Q3792" , "Q3805" , "Q3818" , "Q3820" , "Q3825" , "Q3826" , "Q3832" , "Q3844" , "Q3854" , "Q3856" , "Q3859" , "Q3866" , "Q3868" , "Q3870" , "Q3871" , "Q3876" , "Q3881" , "Q3882" , "Q45604" , "Q45656" , "Q45779" , "Q45798" , "Q45942" , "Q46400" , "Q46747" , "Q46852" , "Q47034" , "Q47045" , "Q47048" , "Q47084" , "Q47138" , "Q47166" , "Q47264" , "Q47282" , "Q47465" , "Q47492" , "Q47535" , "Q47554" , "Q47716" , "Q47772" , "Q47837" , "Q47916" , "Q47952" , "Q48195" , "Q48256" , "Q48278" , "Q48320" , "Q48338" , "Q48370" , "Q48403" , "Q48888" , "Q49145" , "Q49158" , "Q49162" , "Q49169" , "Q49174" , "Q49178" , "Q49179" , "Q49218" , "Q49219" , "Q49220" , "Q49221" , "Q49225" , "Q49227" , "Q49229" , "Q49233" , "Q49236" , "Q49238" , "Q49239" , "Q49240" , "Q49241" , "Q49242" , "Q49243" , "Q49244" , "Q49246" , "Q49247" , "Q49255" , "Q49256" , "Q49258" , "Q49261" , "Q49266" , "Q49267" , "Q49268" , "Q49270" , "Q49272" , "Q49273" , "Q49274" , "Q49276" , "Q50054" , "Q50189" , "Q50257" , "Q50816" , "Q51059" , "Q51103" , "Q51111" , "Q51599" , "Q51682" , "Q51685" , "Q51686" , "Q51687" , "Q51689" , "Q51690" , "Q51691" , "Q51693" , "Q51694" , "Q51695" , "Q51696" , "Q51697" , "Q51698" , "Q52028" , "Q52465" , "Q52466" , "Q52535" , "Q52578" , "Q52585" , "Q52607" , "Q52842" , "Q52998" , "Q53077" , "Q53139" , "Q54108" , "Q55630" , "Q56037" , "Q57278" , "Q57719" , "Q57756" , "Q57787" , "Q57818" , "Q57866" , "Q57906" , "Q57931" , "Q57947" , "Q57958" , "Q57970" , "Q58178" , "Q58210" , "Q58235" , "Q58273" , "Q58294" , "Q58324" , "Q58401" , "Q58422" , "Q58560" , "Q58570" , "Q58584" , "Q58650" , "Q58675" , "Q58695" , "Q58710" , "Q58724" , "Q58794" , "Q58976" , "Q59018" , "Q59095" , "Q59100" , "Q59107" , "Q59132" , "Q59144" , "Q59164" , "Q59173" , "Q59184" , "Q59189" , "Q59205" , "Q59209" , "Q59213" , "Q59218" , "Q59223" , "Q59227" , "Q59233" , "Q59670" , "Q59975" , "Q60956" , "Q61092" , "Q61301" , "Q61302" , "Q61320" , "Q61434" , "Q61445" , "Q61944" , "Q62823" , "Q62868" , "Q63049" , "Q64116" , "Q66485" , "Q66568" , "Q66616" , "Q68481" , "Q68534" , "Q68579" , "Q68593" , "Q68614" , "Q68695" , "Q68744" , "Q68814" , "Q68862" , "Q68919" , "Q68953" , "Q69060" , "Q71204" , "Q71227" , "Q71247" , "Q71266" , "Q71284" , "Q71305" , "Q71323" , "Q71339" , "Q71355" , "Q71373" , "Q71401" , "Q72125" , "Q72259" , "Q72536" , "Q72778" , "Q72818" , "Q72877" , "Q72907" , "Q72945" , "Q72990" , "Q73020" , "Q73045" , "Q73119" , "Q73156" , "Q73186" , "Q74881" , "Q74957" , "Q75026" , "Q75091" , "Q75110" , "Q75150" , "Q75203" , "Q75230" , "Q75268" , "Q75336" , "Q75379" , "Q75621" , "Q79808" , "Q79815" , "Q79848" , "Q79857" , "Q79860" , "Q79867" , "Q79875" , "Q79980" , "Q79990" , "Q80004" , "Q80484" , "Q80517" , "Q80561" , "Q80989" , "Q81033" , "Q81046" , "Q81137" , "Q81398" , "Q81581" , "Q81844" , "Q81882" , "Q82070" , "Q82128" , "Q82174" , "Q82765" , "Q83061" , "Q83065" , "Q83114" , "Q83178" , "Q83247" , "Q83285" , "Q83317" , "Q83324" , "Q83387" , "Q83404" , "Q83786" , "Q83813" , "Q92161" , "Q92212" , "Q92277" , "Q92297" , "Q92561" , "Q93230" , "Q93338" , "Q93358" , "Q95041" , "Q95449" , "Q98967" , "Q98995" , "Q99648" , "Q100188" , "Q101254" , "Q101625" , "Q102217" , "Q102317" , "Q102350" , "Q102397" , "Q102667" , "Q103217" , "Q103483" , "Q103892" , "Q104232" , "Q104302" , "Q104560" , "Q104649" , "Q104712" , "Q104720" , "Q104725" , "Q104731" , "Q104740" , "Q104991" , "Q105002" , "Q105037" , "Q105060" , "Q105084" , "Q105444" , "Q106583" , "Q106636" , "Q106681" , "Q107401" , "Q108672" , "Q108679" , "Q109188" , "Q109336" , "Q109356" , "Q109374" , "Q109386" , "Q109949" , "Q110017" , "Q110218" , "Q110732" , "Q112813" , "Q114045" , "Q115256" , "Q115323" , "Q115329" , "Q115382" , "Q115403" , "Q115465" , "Q115527" , "Q117040" , "Q118958" , "Q119140" , "Q122803" , "Q123709" , "Q125293" , "Q125434" , "Q126148" , "Q126805" , "Q126995" , "Q127041" , "Q127063" , "Q128228" , "Q128244" , "Q128261" , "Q128269" , "Q128282" , "Q128295" , "Q128306" , "Q128321" , "Q128349" , "Q128674" , "Q128849" , "Q128891" , "Q129259" , "Q129649" , "Q130191" , "Q130324" , "Q130469" , "Q130514" , "Q131127" , "Q131290" , "Q131301" , "Q131323" , "Q131335" , "Q131350" , "Q131416" , "Q131491" , "Q131620" , "Q131638" , "Q131694" , "Q131818" , "Q132189" , "Q132572" , "Q132679" , "Q132754" , "Q132830" , "Q132997" , "Q133073" , "Q133116" , "Q133118" , "Q133123" , "Q134121" , "Q134287" , "Q134291" , "Q134509" , "Q134514" , "Q134620" , "Q134635" , "Q134672" , "Q134703" , "Q134712" , "Q134902" , "Q135285" , "Q135615" , "Q136217" , "Q137203" , "Q137271" , "Q139190" , "Q139208" , "Q139229" , "Q139473" , "Q140075" , "Q140087" , "Q140147" , "Q140304" , "Q140561" , "Q140631" , "Q141810" , "Q141844" , "Q143782" , "Q144170" , "Q144663" , "Q145333" , "Q145507" , "Q145865" , "Q146351" , "Q146699" , "Q146723" , "Q146790" , "Q147089" , "Q147187" , "Q147402" , "Q147756" , "Q151958" , "Q152449" , "Q152467" , "Q152831" , "Q152902" , "Q153511" , "Q153647" , "Q154814" , "Q154835" , "Q155148" , "Q155277" , "Q155557" , "Q155809" , "Q156243" , "Q156711" , "Q156726" , "Q156760" , "Q156819" , "Q157024" , "Q157065" , "Q157137" , "Q157144" , "Q157725" , "Q157835" , "Q157915" , "Q158467" , "Q158928" , "Q159260" , "Q159273" , "Q159610" , "Q159835" , "Q160173" , "Q160320" , "Q160450" , "Q160506" , "Q160544" , "Q160687" , "Q161176" , "Q162279" , "Q162442" , "Q162548" , "Q162677" , "Q162880" , "Q163132" , "Q163464" , "Q163490" , "Q163798" , "Q163888" , "Q165204" , "Q165341" , "Q165420" , "Q165444" , "Q165806" , "Q165857" , "Q166304" , "Q166824" , "Q167394" , "Q167436" , "Q167715" , "Q167974" , "Q168057" , "Q168193" , "Q168197" , "Q168225" , "Q168376" , "Q168652" , "Q168843" , "Q168866" , "Q168929" , "Q169134" , "Q169997" , "Q170047" , "Q170115" , "Q170247" , "Q170287" , "Q170315" , "Q170322" , "Q170366" , "Q170415" , "Q170454" , "Q170457" , "Q170478" , "Q170497" , "Q170513" , "Q170521" , "Q170532" , "Q170540" , "Q170578" , "Q170616" , "Q170688" , "Q170762" , "Q170919" , "Q170967" , "Q170996" , "Q171031" , "Q171223" , "Q171357" , "Q171612" , "Q171617" , "Q171632" , "Q171639" , "Q171714" , "Q171771" , "Q171866" , "Q171943" , "Q172343" , "Q172415" , "Q172438" , "Q172455" , "Q172512" , "Q172601" , "Q172616" , "Q172637" , "Q172657" , "Q173270" , "Q173310" , "Q173545" , "Q173591" , "Q173699" , "Q173731" , "Q173849" , "Q174060" , "Q174091" , "Q174461" , "Q174684" , "Q174691" , "Q174744" , "Q174916" , "Q175124" , "Q175161" , "Q175323" , "Q175433" , "Q175452" , "Q175470" , "Q175524" , "Q176325" , "Q176891" , "Q177149" , "Q178067" , "Q178373" , "Q178405" , "Q178663" , "Q178725" , "Q178945" , "Q178993" , "Q179585" , "Q179608" , "Q179665" , "Q179691" , "Q179833" , "Q179841" , "Q180057" , "Q180078" , "Q180084" , "Q180192" , "Q180215" , "Q180470" , "Q180522" , "Q180921" , "Q181056" , "Q181376" , "Q181379" , "Q181557" , "Q181578" , "Q181946" , "Q181966" , "Q182009" , "Q182025" , "Q182059" , "Q182092" , "Q182394" , "Q182521" , "Q182625" , "Q182640" , "Q182852" , "Q182984" , "Q183002" , "Q183124" , "Q183303" , "Q183405" , "Q183584" , "Q183651" , "Q184046" , "Q184090" , "Q184345" , "Q184403" , "Q184409" , "Q184579" , "Q184587" , "Q185084" , "Q185125" , "Q185134" , "Q185156" , "Q185280" , "Q185332" , "Q185453" , "Q185518" , "Q185582" , "Q185632" , "Q185684" , "Q186006" , "Q186141" , "Q186234" , "Q186349" , "Q186702" , "Q186935" , "Q187136" , "Q187284" , "Q187346" , "Q187593" , "Q187805" , "Q187826" , "Q187938" , "Q188022" , "Q188155" , "Q188304" , "Q188478" , "Q188693" , "Q188806" , "Q188892" , "Q188897" , "Q188901" , "Q189043" , "Q189128" , "Q189133" , "Q189134" , "Q189138" , "Q189166" , "Q189383" , "Q189633" , "Q189697" , "Q189823" , "Q190005" , "Q190021" , "Q190184" , "Q190828" , "Q190948" , "Q191130" , "Q191135" , "Q191170" , "Q191204" , "Q191642" , "Q191652" , "Q191914" , "Q192181" , "Q192213" , "Q192225" , "Q192235" , "Q192271" , "Q192387" , "Q192517" , "Q192807" , "Q192918" , "Q192961" , "Q193016" , "Q193019" , "Q193021" , "Q193250" , "Q193289" , "Q193350" , "Q193370" , "Q193380" , "Q193413" , "Q193428" , "Q193443" , "Q193486" , "Q193722" , "Q193802" , "Q193806" , "Q193909" , "Q193965" , "Q194087" , "Q194146" , "Q194165" , "Q194325" , "Q194328" , "Q194332" , "Q194338" , "Q194343" , "Q194531" , "Q195531" , "Q196236" , "Q196486" , "Q196489" , "Q197379" , "Q197402" , "Q197519" , "Q197922" , "Q198061" , "Q198206" , "Q198240" , "Q198266" , "Q198370" , "Q198748" , "Q198989" , "Q199440" , "Q199500" , "Q199528" , "Q199575" , "Q199605" , "Q199609" , "Q199712" , "Q199723" , "Q199797" , "Q199889" , "Q199909" , "Q200016" , "Q200017" , "Q200019" , "Q200022" , "Q200028" , "Q200030" , "Q200054" , "Q200077" , "Q200078" , "Q200119" , "Q200166" , "Q200235" , "Q200237" , "Q200251" , "Q200267" , "Q200340" , "Q200578" , "Q200589" , "Q200663" , "Q200707" , "Q200713" , "Q200718" , "Q200731" , "Q200740" , "Q200747" , "Q200805" , "Q200878" , "Q200942" , "Q200951" , "Q201051" , "Q201095" , "Q201101" , "Q201117" , "Q201404" , "Q201613" , "Q201618" , "Q201812" , "Q201832" , "Q201932" , "Q202139" , "Q202162" , "Q202316" , "Q202453" , "Q202776" , "Q202907" , "Q202973" , "Q203027" , "Q203045" , "Q203263" , "Q203299" , "Q203308" , "Q203476" , "Q204150" , "Q204234" , "Q204249" , "Q204266" , "Q204271" , "Q204308" , "Q204561" , "Q205119" , "Q205327" , "Q205526" , "Q205648" , "Q205681" , "Q205914" , "Q205922" , "Q206484" , "Q206879" , "Q206881" , "Q206885" , "Q206891" , "Q206900" , "Q206903" , "Q206988" , "Q207030" , "Q207098" , "Q207294" , "Q207309" , "Q207311" , "Q207321" , "Q207322" , "Q207324" , "Q207350" , "Q207429" , "Q207749" , "Q207754" , "Q207756" , "Q207799" , "Q207801" , "Q207876" , "Q207881" , "Q207972" , "Q208005" , "Q208097" , "Q208143" , "Q208151" , "Q208162" , "Q208262" , "Q208318" , "Q208389" , "Q208445" , "Q208447" , "Q208459" , "Q208471" , "Q208472" , "Q208669" , "Q208718" , "Q208725" , "Q208818" , "Q208863" , "Q209016" , "Q209034" , "Q209338" , "Q209766" , "Q209779" , "Q209785" , "Q209801" , "Q210292" , "Q210307" , "Q210365" , "Q210493" , "Q210628" , "Q210661" , "Q210667" , "Q210886" , "Q211243" , "Q211563" , "Q211590" , "Q211805" , "Q211811" , "Q211867" , "Q211907" , "Q212332" , "Q212494" , "Q212628" , "Q212826" , "Q212991" , "Q213014" , "Q213026" , "Q213169" , "Q213242" , "Q213263" , "Q213278" , "Q213318" , "Q213324" , "Q214164" , "Q214173" , "Q214215" , "Q214248" , "Q214485" , "Q214651" , "Q214655" , "Q214670" , "Q215733" , "Q215755" , "Q216075" , "Q216077" , "Q216835" , "Q216847" , "Q216897" , "Q216902" , "Q217039" , "Q217040" , "Q217071" , "Q217156" , "Q217432" , "Q217646" , "Q217681" , "Q217698" , "Q218861" , "Q219039" , "Q219117" , "Q219583" , "Q219656" , "Q219671" , "Q220049" , "Q220445" , "Q221051" , "Q221283" , "Q221734" , "Q221914" , "Q221921" , "Q222755" , "Q223422" , "Q223439" , "Q223517" , "Q223587" , "Q223920" , "Q223966" , "Q225641" , "Q228405" , "Q230628" , "Q231765" , "Q232226" , "Q232842" , "Q234053" , "Q234061" , "Q234453" , "Q234600" , "Q236197" , "Q236744" , "Q237655" , "Q237683" , "Q237699" , "Q237847" , "Q238217" , "Q238375" , "Q238452" , "Q238508" , "Q239097" , "Q239107" , "Q239421" , "Q239580" , "Q239870" , "Q240475" , "Q240489" , "Q240891" , "Q241037" , "Q241645" , "Q242108" , "Q242144" , "Q242783" , "Q242874" , "Q242882" , "Q242885" , "Q242895" , "Q242906" , "Q242995" , "Q243293" , "Q243319" , "Q243322" , "Q243325" , "Q243766" , "Q243846" , "Q243853" , "Q243859" , "Q243863" , "Q244004" , "Q244139" , "Q244146" , "Q244154" , "Q244232" , "Q244509" , "Q245023" , "Q247248" , "Q249007" , "Q249830" , "Q249994" , "Q249996" , "Q250220" , "Q251329" , "Q255455" , "Q259253" , "Q260911" , "Q261076" , "Q261988" , "Q262579" , "Q264206" , "Q265555" , "Q266014" , "Q267258" , "Q267439" , "Q268915" , "Q269634" , "Q269960" , "Q270041" , "Q270176" , "Q270806" , "Q270810" , "Q270814" , "Q270821" , "Q270912" , "Q271000" , "Q271215" , "Q271333" , "Q271374" , "Q271393" , "Q271417" , "Q271619" , "Q271730" , "Q271733" , "Q271771" , "Q271911" , "Q271917" , "Q272093" , "Q272254" , "Q272471" , "Q272795" , "Q273779" , "Q273798" , "Q273863" , "Q273880" , "Q274384" , "Q274584" , "Q275109" , "Q276176" , "Q276534" , "Q278913" , "Q279009" , "Q279951" , "Q282335" , "Q282948" , "Q283368" , "Q287722" , "Q289693" , "Q290504" , "Q291277" , "Q293927" , "Q297511" , "Q304848" , "Q309348" , "Q309475" , "Q310114" , "Q310117" , "Q310772" , "Q310892" , "Q311266" , "Q311321" , "Q311341" , "Q312209" , "Q312723" , "Q312759" , "Q316887" , "Q317830" , "Q317834" , "Q317844" , "Q317946" , "Q318047" , "Q318156" , "Q318299" , "Q318306" , "Q318314" , "Q319476" , "Q319729" , "Q319740" , "Q319743" , "Q320015" , "Q320487" , "Q320792" , "Q320934" , "Q320943" , "Q320964" , "Q321079" , "Q321331" , "Q321475" , "Q322149" , "Q322155" , "Q323414" , "Q323432" , "Q323801" , "Q324293" , "Q325164" , "Q326354" , "Q326956" , "Q328000" , "Q328015" , "Q328030" , "Q328067" , "Q328153" , "Q328176" , "Q328518" , "Q328596" , "Q328605" , "Q328610" , "Q328613" , "Q328615" , "Q328619" , "Q328625" , "Q328651" , "Q328941" , "Q329488" , "Q329797" , "Q330175" , "Q330202" , "Q330531" , "Q330643" , "Q331078" , "Q331104" , "Q331300" , "Q332319" , "Q332753" , "Q333074" , "Q333476" , "Q333928" , "Q334197" , "Q334577" , "Q334985" , "Q335135" , "Q335423" , "Q335427" , "Q335444" , "Q335506" , "Q335708" , "Q335769" , "Q336431" , "Q336438" , "Q336661" , "Q336966" , "Q337123" , "Q338059" , "Q339527" , "Q340572" , "Q343973" , "Q345204" , "Q348972" , "Q349973" , "Q349976" , "Q349979" , "Q349982" , "Q349983" , "Q349985" , "Q359990" , "Q360069" , "Q360178" , "Q360235" , "Q360268" , "Q360326" , "Q360374" , "Q360584" , "Q360643" , "Q360702" , "Q360769" , "Q360870" , "Q360942" , "Q362865" , "Q362959" , "Q363076" , "Q363166" , "Q363262" , "Q363326" , "Q363391" , "Q363479" , "Q366010" , "Q370456" , "Q370925" , "Q370972" , "Q371112" , "Q371354" , "Q371640" , "Q372414" , "Q372454" , "Q372773" , "Q372791" , "Q373023" , "Q373101" , "Q373214" , "Q373564" , "Q373687" , "Q373705" , "Q373808" , "Q374365" , "Q374432" , "Q374477" , "Q374511" , "Q375432" , "Q376023" , "Q376903" , "Q377588" , "Q377601" , "Q377965" , "Q379509" , "Q381733" , "Q383129" , "Q383622" , "Q384926" , "Q385341" , "Q385623" , "Q385762" , "Q385892" , "Q386052" , "Q386179" , "Q386487" , "Q386628" , "Q386635" , "Q386649" , "Q386651" , "Q386661" , "Q386668" , "Q386677" , "Q386682" , "Q386691" , "Q386697" , "Q386991" , "Q387136" , "Q387322" , "Q387365" , "Q388108" , "Q388242" , "Q389495" , "Q389515" , "Q389537" , "Q389562" , "Q389633" , "Q389711" , "Q390413" , "Q390583" , "Q390817" , "Q391221" , "Q392599" , "Q393495" , "Q393498" , "Q394080" , "Q395863" , "Q397343" , "Q397905" , "Q399270" , "Q399316" , "Q399322" , "Q403446" , "Q404116" , "Q404301" , "Q404362" , "Q404429" , "Q404484" , "Q404529" , "Q404599" , "Q404636" , "Q404763" , "Q404817" , "Q404873" , "Q406358" , "Q416544" , "Q416669" , "Q416748" , "Q416922" , "Q416988" , "Q425415" , "Q425996" , "Q426130" , "Q426237" , "Q426644" , "Q426756" , "Q426868" , "Q426996" , "Q427097" , "Q427265" , "Q427367" , "Q427488" , "Q427557" , "Q429215" , "Q430308" , "Q431533" , "Q431845" , "Q434285" , "Q449593" , "Q459360" , "Q459553" , "Q459690" , "Q459711" , "Q460222" , "Q460750" , "Q460806" , "Q460829" , "Q460835" , "Q461020" , "Q461773" , "Q462218" , "Q462789" , "Q462804" , "Q463171" , "Q464699" , "Q465022" , "Q466000" , "Q466027" , "Q466046" , "Q466216" , "Q466221" , "Q467421" , "Q467479" , "Q467487" , "Q468563" , "Q468765" , "Q468782" , "Q472925" , "Q473250" , "Q476800" , "Q477148" , "Q477232" , "Q478207" , "Q478302" , "Q478518" , "Q478818" , "Q483331" , "Q484678" , "Q484706" , "Q484799" , "Q485172" , "Q485176" , "Q485496" , "Q485716" , "Q485887" , "Q485918" , "Q486149" , "Q486168" , "Q486235" , "Q486282" , "Q486319" , "Q486329" , "Q486439" , "Q486459" , "Q486472" , "Q486479" , "Q486545" , "Q486868" , "Q486877" , "Q486913" , "Q487439" , "Q487656" , "Q487672" , "Q487684" , "Q487999" , "Q488125" , "Q488134" , "Q488379" , "Q488924" , "Q488940" , "Q488946" , "Q488990" , "Q489197" , "Q489825" , "Q489829" , "Q489898" , "Q490434" , "Q490441" , "Q490584" , "Q490643" , "Q490732" , "Q490872" , "Q490928" , "Q491099" , "Q491114" , "Q491123" , "Q491128" , "Q491132" , "Q491340" , "Q491350" , "Q491879" , "Q492552" , "Q492778" , "Q494606" , "Q494707" , "Q494711" , "Q494715" , "Q494720" , "Q494723" , "Q494728" , "Q495353" , "Q495357" , "Q495365" , "Q495373" , "Q495377" , "Q495387" , "Q495730" , "Q495809" , "Q496072" , "Q496080" , "Q496319" , "Q496405" , "Q496442" , "Q496472" , "Q496576" , "Q496681" , "Q496765" , "Q496837" , "Q497341" , "Q497731" , "Q497952" , "Q498011" , "Q498027" , "Q498048" , "Q499196" , "Q499401" , "Q499470" , "Q499493" , "Q499922" , "Q500033" , "Q500366" , "Q500481" , "Q501766" , "Q502023" , "Q502199" , "Q502209" , "Q502212" , "Q502216" , "Q502988" , "Q503852" , "Q504114" , "Q504215" , "Q504394" , "Q504587" , "Q504657" , "Q504690" , "Q504755" , "Q505557" , "Q505807" , "Q505930" , "Q507080" , "Q509324" , "Q509818" , "Q510413" , "Q511352" , "Q513537" , "Q514136" , "Q514608" , "Q514796" , "Q515118" , "Q515388" , "Q515573" , "Q515712" , "Q515983" , "Q518431" , "Q518785" , "Q519810" , "Q523778" , "Q524250" , "Q524894" , "Q525118" , "Q525618" , "Q525647" , "Q526318" , "Q528432" , "Q530171" , "Q532560" , "Q532776" , "Q532981" , "Q533157" , "Q533432" , "Q533764" , "Q533985" , "Q534409" , "Q535534" , "Q536569" , "Q538953" , "Q540312" , "Q542829" , "Q542966" , "Q545707" , "Q548652" , "Q548807" , "Q551658" , "Q559834" , "Q564813" , "Q569766" , "Q569907" , "Q570312" , "Q570768" , "Q570829" , "Q570884" , "Q570937" , "Q571033" , "Q571126" , "Q571219" , "Q571652" , "Q571712" , "Q571766" , "Q571808" , "Q571918" , "Q571949" , "Q572014" , "Q572089" , "Q572140" , "Q572231" , "Q572380" , "Q574469" , "Q575780" , "Q576938" , "Q579761" , "Q580366" , "Q580876" , "Q581213" , "Q581562" , "Q582289" , "Q582917" , "Q583184" , "Q583568" , "Q583619" , "Q583818" , "Q584295" , "Q585014" , "Q586057" , "Q587085" , "Q588477" , "Q590133" , "Q590849" , "Q593022" , "Q593948" , "Q594843" , "Q595550" , "Q596012" , "Q596469" , "Q596688" , "Q598016" , "Q598985" , "Q600693" , "Q600893" , "Q601130" , "Q601897" , "Q604385" , "Q604517" , "Q604625" , "Q605105" , "Q605142" , "Q605157" , "Q605167" , "Q605209" , "Q605224" , "Q605454" , "Q606564" , "Q607167" , "Q609350" , "Q616650" , "Q621549" , "Q622607" , "Q622612" , "Q622620" , "Q622823" , "Q622830" , "Q622836" , "Q625279" , "Q625394" , "Q626175" , "Q626199" , "Q626247" , "Q626670" , "Q626835" , "Q628172" , "Q628877" , "Q630203" , "Q631194" , "Q631517" , "Q633036" , "Q633530" , "Q633911" , "Q633922" , "Q633945" , "Q634022" , "Q634698" , "Q636188" , "Q636209" , "Q637120" , "Q637555" , "Q637901" , "Q638260" , "Q638301" , "Q638312" , "Q638509" , "Q639408" , "Q639452" , "Q641491" , "Q642057" , "Q642088" , "Q643112" , "Q643172" , "Q643207" , "Q643215" , "Q643386" , "Q643929" , "Q644008" , "Q644663" , "Q645725" , "Q646834" , "Q646898" , "Q646912" , "Q647417" , "Q648696" , "Q649955" , "Q651131" , "Q651286" , "Q651860" , "Q651874" , "Q651891" , "Q651906" , "Q652376" , "Q652895" , "Q653372" , "Q653389" , "Q653446" , "Q653478" , "Q653510" , "Q655363" , "Q655734" , "Q657199" , "Q657461" , "Q657734" , "Q658240" , "Q659450" , "Q661038" , "Q664550" , "Q665097" , "Q667650" , "Q667749" , "Q668616" , "Q669305" , "Q671314" , "Q672458" , "Q675568" , "Q675576" , "Q679169" , "Q681340" , "Q681999" , "Q685315" , "Q685941" , "Q686813" , "Q688275" , "Q689868" , "Q693093" , "Q693929" , "Q694154" , "Q694308" , "Q694313" , "Q694322" , "Q694822" , "Q694845" , "Q694939" , "Q695511" , "Q695591" , "Q695623" , "Q695631" , "Q695895" , "Q696074" , "Q696407" , "Q696412" , "Q696605" , "Q696694" , "Q696772" , "Q696783" , "Q696925" , "Q698064" , "Q698719" , "Q699777" , "Q709267" , "Q709298" , "Q712504" , "Q712515" , "Q712644" , "Q713310" , "Q713357" , "Q713381" , "Q714865" , "Q714873" , "Q715931" , "Q715946" , "Q715975" , "Q716127" , "Q720001" , "Q720403" , "Q720828" , "Q720937" , "Q721034" , "Q721198" , "Q721455" , "Q722827" , "Q723246" , "Q723588" , "Q723677" , "Q726143" , "Q730437" , "Q732905" , "Q733005" , "Q734390" , "Q734416" , "Q734432" , "Q734442" , "Q734479" , "Q734520" , "Q734532" , "Q734541" , "Q735025" , "Q736897" , "Q737636" , "Q737644" , "Q737660" , "Q737670" , "Q737689" , "Q737822" , "Q738275" , "Q738303" , "Q738353" , "Q738748" , "Q739664" , "Q739908" , "Q740236" , "Q740456" , "Q740477" , "Q740687" , "Q740833" , "Q742227" , "Q743601" , "Q745168" , "Q745906" , "Q746718" , "Q747840" , "Q748028" , "Q748336" , "Q749187" , "Q749224" , "Q750443" , "Q750569" , "Q750679" , "Q753044" , "Q753906" , "Q755752" , "Q755763" , "Q755765" , "Q759381" , "Q760714" , "Q762009" , "Q763015" , "Q765528" , "Q765553" , "Q765571" , "Q765715" , "Q768864" , "Q770309" , "Q771345" , "Q771575" , "Q773065" , "Q773764" , "Q774952" , "Q776965" , "Q778941" , "Q781510" , "Q793809" , "Q796669" , "Q796739" , "Q800122" , "Q807311" , "Q808797" , "Q810196" , "Q814033" , "Q814748" , "Q816331" , "Q816420" , "Q816809" , "Q816845" , "Q817216" , "Q817227" , "Q817233" , "Q817387" , "Q817954" , "Q817965" , "Q818019" , "Q818106" , "Q819572" , "Q819578" , "Q819689" , "Q820235" , "Q821363" , "Q822196" , "Q823874" , "Q823988" , "Q824009" , "Q824594" , "Q825166" , "Q826566" , "Q828782" , "Q836836" , "Q838785" , "Q838787" , "Q838954" , "Q840712" , "Q840957" , "Q841125" , "Q841218" , "Q841222" , "Q841226" , "Q841231" , "Q841241" , "Q841244" , "Q841299" , "Q842143" , "Q842407" , "Q842713" , "Q842779" , "Q842806" , "Q844130" , "Q844140" , "Q844852" , "Q845097" , "Q845720" , "Q846502" , "Q846939" , "Q847037" , "Q963782" , "Q966819" , "Q967648" , "Q967688" , "Q972756" , "Q973513" , "Q974354" , "Q974642" , "Q979808" , "Q982550" , "Q983451" , "Q983459" , "Q983480" , "Q983483" , "Q983498" , "Q983511" , "Q983524" , "Q983714" , "Q983747" , "Q983815" , "Q983884" , "Q984571" , "Q984581" , "Q984646" , "Q984780" , "Q984788" , "Q985521" , "Q985531" , "Q985579" , "Q985583" , "Q985605" , "Q985627" , "Q985685" , "Q986207" , "Q986261" , "Q986288" , "Q986429" , "Q986803" , "Q988225" , "Q989492" , "Q989988" , "Q990001" , "Q990080" , "Q990115" , "Q990403" , "Q990448" , "Q990706" , "Q990764" , "Q991006" , "Q991400" , "Q991435" , "Q994514" , "Q994917" , "Q995163" , "Q995380" , "Q995695" , "Q995718" , "Q995727" , "Q996056" , "Q996478" , "Q996748" , "Q997069" , "Q997084" , "Q997107" , "Q997821" , "Q999076" , "Q1000336" , "Q1000383" , "Q1001104" , "Q1001440" , "Q1001522" , "Q1001914" , "Q1002090" , "Q1002900" , "Q1003392" , "Q1003502" , "Q1004897" , "Q1006240" , "Q1006277" , "Q1006330" , "Q1006338" , "Q1006343" , "Q1006367" , "Q1007634" , "Q1008456" , "Q1009253" , "Q1009276" , "Q1010367" , "Q1011201" , "Q1012419" , "Q1012424" , "Q1012460" , "Q1012465" , "Q1012546" , "Q1012824" , "Q1012831" , "Q1012935" , "Q1014010" , "Q1014125" , "Q1015132" , "Q1016720" , "Q1017101" , "Q1017554" , "Q1017594" , "Q1017637" , "Q1017651" , "Q1017696" , "Q1018144" , "Q1018167" , "Q1018501" , "Q1018592" , "Q1018781" , "Q1019424" , "Q1020192" , "Q1020279" , "Q1020297" , "Q1020384" , "Q1020490" , "Q1020637" , "Q1020753" , "Q1020901" , "Q1021748" , "Q1021818" , "Q1022488" , "Q1023359" , "Q1023493" , "Q1023910" , "Q1023920" , "Q1025448" , "Q1025475" , "Q1026185" , "Q1026270" , "Q1026296" , "Q1026376" , "Q1026616" , "Q1026987" , "Q1027004" , "Q1027734" , "Q1028279" , "Q1031051" , "Q1043513" , "Q1044689" , "Q1046653" , "Q1048700" , "Q1054450" , "Q1062370" , "Q1113311" , "Q1120810" , "Q1134454" , "Q1136204" , "Q1164081" , "Q1189982" , "Q1209404" , "Q1211183" , "Q1241426" , "Q1249888" , "Q1250417" , "Q1252806" , "Q1266637" , "Q1308292" , "Q1324317" , "Q1344820" , "Q1355911" , "Q1384520" , "Q1385982" , "Q1390081" , "Q1425428" , "Q1439157" , "Q1439193" , "Q1446993" , "Q1447167" , "Q1451808" , "Q1453180" , "Q1453196" , "Q1494067" , "Q1496283" , "Q1517139" , "Q1525057" , "Q1552562" , "Q1552906" , "Q1553052" , "Q1557691" , "Q1615298" , "Q1622565" , "Q1625598" , "Q1635606" , "Q1637405" , "Q1637446" , "Q1637488" , "Q1637522" , "Q1637538" , "Q1637552" , "Q1637702" , "Q1638385" , "Q1638413" , "Q1638425" , "Q1640079" , "Q1643864" , "Q1645080" , "Q1646103" , "Q847315" , "Q847607" , "Q847610" , "Q847677" , "Q848638" , "Q848680" , "Q849292" , "Q849561" , "Q849584" , "Q849859" , "Q850344" , "Q850837" , "Q851292" , "Q851576" , "Q851680" , "Q852018" , "Q852238" , "Q852550" , "Q852725" , "Q853061" , "Q853805" , "Q854109" , "Q854914" , "Q855724" , "Q855997" , "Q856003" , "Q857581" , "Q857746" , "Q858120" , "Q858352" , "Q860452" , "Q862105" , "Q862519" , "Q863461" , "Q864965" , "Q867102" , "Q868527" , "Q868631" , "Q869403" , "Q869571" , "Q873405" , "Q873590" , "Q876526" , "Q876876" , "Q890671" , "Q893274" , "Q897232" , "Q897320" , "Q905157" , "Q905164" , "Q910973" , "Q911727" , "Q913356" , "Q913390" , "Q913406" , "Q914055" , "Q916536" , "Q917326" , "Q917535" , "Q922944" , "Q926426" , "Q926606" , "Q926662" , "Q926688" , "Q926713" , "Q927243" , "Q927537" , "Q927933" , "Q927935" , "Q929062" , "Q931560" , "Q933380" , "Q938835" , "Q942064" , "Q942071" , "Q942083" , "Q942122" , "Q942135" , "Q942235" , "Q945363" , "Q945388" , "Q948129" , "Q949746" , "Q949798" , "Q949833" , "Q952617" , "Q953449" , "Q953490" , "Q955510" , "Q955523" , "Q956008" , "Q956017" , "Q956172" , "Q956371" , "Q956602" , "Q956659" , "Q957653" , "Q957697" , "Q958586" , "Q963648" , "Q2224587" , "Q2230683" , "Q2235942" , "Q2274595" , "Q2287060" , "Q2287264" , "Q2288052" , "Q2289846" , "Q2294847" , "Q2296366" , "Q2304045" , "Q2317215" , "Q2318208" , "Q2318927" , "Q2320876" , "Q2321929" , "Q2329701" , "Q2359107" , "Q2384142" , "Q2421238" , "Q2453308" , "Q2453443" , "Q2462135" , "Q2466841" , "Q2471226" , "Q2484567" , "Q2563840" , "Q2564010" , "Q2570924" , "Q2578786" , "Q2671609" , "Q2700395" , "Q2711899" , "Q2722762" , "Q2725457" , "Q2734589" , "Q2766547" , "Q2768192" , "Q2794758" , "Q2799572" , "Q2898863" , "Q2987563" , "Q2996335" , "Q3015863" , "Q3120966" , "Q3133884" , "Q3183016" , "Q3236167" , "Q3344946" , "Q3360716" , "Q3472806" , "Q3612324" , "Q3635276" , "Q3636023" , "Q3695624" , "Q3852743" , "Q3869982" , "Q3916792" , "Q3980318" , "Q4115712" , "Q4120519" , "Q4418748" , "Q4939409" , "Q4986926" , "Q5124156" , "Q5207471" , "Q5219966" , "Q5576202" , "Q5582862" , "Q6063659" , "Q6163801" , "Q6397066" , "Q6465359" , "Q6634626" , "Q6635526" , "Q7450932" , "Q10737004" , "Q12185424" , "Q12191144" , "Q12191403" , "Q12242935" , "Q12447537" , "Q12460009" , "Q12489692" , "Q12685199" , "Q12817935" , "Q12824432" , "Q12824787" , "Q12825018" , "Q12829141" , "Q12829343" , "Q12829733" , "Q13035398" , "Q13124930" , "Q16123684" , "Q16251875" , "Q16319283" , "Q16836589" , "Q16895027" , "Q16897309" , "Q1646181" , "Q1646968" , "Q1646970" , "Q1646975" , "Q1647167" , "Q1650073" , "Q1650078" , "Q1656639" , "Q1675245" , "Q1707370" , "Q1707695" , "Q1708114" , "Q1708439" , "Q1734942" , "Q1749958" , "Q1750870" , "Q1751207" , "Q1755402" , "Q1756328" , "Q1756745" , "Q1759112" , "Q1759235" , "Q1761143" , "Q1761549" , "Q1763534" , "Q1763574" , "Q1764163" , "Q1771398" , "Q1771721" , "Q1771762" , "Q1772825" , "Q1773148" , "Q1773313" , "Q1773340" , "Q1776774" , "Q1787619" , "Q1787668" , "Q1787673" , "Q1788891" , "Q1790206" , "Q1794219" , "Q1794732" , "Q1795232" , "Q1795613" , "Q1795634" , "Q1796277" , "Q1796467" , "Q1797985" , "Q1798241" , "Q1798559" , "Q1800687" , "Q1800756" , "Q1801463" , "Q1804770" , "Q1805166" , "Q1805206" , "Q1806100" , "Q1807313" , "Q1807947" , "Q1813001" , "Q1815367" , "Q1815730" , "Q1815899" , "Q1816543" , "Q1817441" , "Q1822816" , "Q1853445" , "Q1856408" , "Q1866604" , "Q1897488" , "Q1922275" , "Q1922283" , "Q1937304" , "Q1944489" , "Q1949069" , "Q1949125" , "Q1949422" , "Q1961680" , "Q1962104" , "Q1966384" , "Q1972757" , "Q1975291" , "Q1994826" , "Q1994845" , "Q2004395" , "Q2004440" , "Q2009595" , "Q2013225" , "Q2022168" , "Q2035284" , "Q2076464" , "Q2088134" , "Q2088474" , "Q2110515" , "Q2120110" , "Q2152404" , "Q2158697" , "Q2166182" , "Q2191860" , "Q2222874" , "Q17396881" , "Q20099772" , "Q21414421" , "Q21746038" , "Q22050101" , "Q22060164" , "Q22062839" , "Q22067368" , "Q23984578" , "Q23984786" , "Q23992498" , "Q23995898" , "Q24001084" , "Q24008386" , "Q24008392" , "Q24012386" , "Q24014650" , "Q24017120" , "Q25563078" , "Q25563103" , "Q26236372" , "Q26772333" , "Q31912880" , "Q31913048" , "Q31917806" , "Q31918779" , "Q31925679" , "Q31926034" , "Q43167665" , "Q49279759" , "Q56299321" , "Q62866867" , "Q80349557" , "Q97290671" , "Q101948176" , "Q106576946" , "Q111961821" , "Q112795541" , "Q116170766" , "Q116423012" , "Q116442617" , "Q116450456" , "Q116450968" , "Q116451210" ]
-# city or town
-items = items + [ "Q649" , "Q656" , "Q875" , "Q883" , "Q887" , "Q891" , "Q894" , "Q898" , "Q900" , "Q906" , "Q908" , "Q911" , "Q914" , "Q915" , "Q919" , "Q959" , "Q976" , "Q1341" , "Q1520" , "Q1763" , "Q1829" , "Q1851" , "Q1895" , "Q1899" , "Q1957" , "Q2137" , "Q2143" , "Q2144" , "Q2174" , "Q2214" , "Q2219" , "Q2235" , "Q2280" , "Q2288" , "Q2423" , "Q2592" , "Q2630" , "Q2684" , "Q2746" , "Q2770" , "Q2801" , "Q2837" , "Q3118" , "Q3159" , "Q3323" , "Q3426" , "Q3490" , "Q3544" , "Q3927" , "Q3977" , "Q4454" , "Q5099" , "Q5196" , "Q5206" , "Q5222" , "Q5239" , "Q5265" , "Q5326" , "Q5332" , "Q5337" , "Q5343" , "Q5384" , "Q5426" , "Q5449" , "Q5470" , "Q5540" , "Q5584" , "Q5627" , "Q5655" , "Q5660" , "Q5663" , "Q5665" , "Q5668" , "Q5671" , "Q5815" , "Q6014" , "Q6025" , "Q6049" , "Q6066" , "Q6329" , "Q6494" , "Q6610" , "Q6816" , "Q6934" , "Q7054" , "Q7525" , "Q7550" , "Q7705" , "Q7769" , "Q7830" , "Q7859" , "Q7938" , "Q7951" , "Q7968" , "Q7977" , "Q7978" , "Q8660" , "Q13379" , "Q13661" , "Q14657" , "Q15235" , "Q15236" , "Q15238" , "Q15245" , "Q15248" , "Q15250" , "Q15256" , "Q15264" , "Q15270" , "Q15273" , "Q15275" , "Q15279" , "Q15281" , "Q15287" , "Q15301" , "Q15306" , "Q15307" , "Q15309" , "Q15311" , "Q15320" , "Q15322" , "Q15323" , "Q15335" , "Q15336" , "Q15337" , "Q15339" , "Q15757" , "Q15758" , "Q15759" , "Q15760" , "Q15762" , "Q15764" , "Q15767" , "Q15774" , "Q15775" , "Q16969" , "Q16971" , "Q16973" , "Q16982" , "Q16985" , "Q19157" , "Q19520" , "Q19566" , "Q23116" , "Q23185" , "Q25952" , "Q32380" , "Q33345" , "Q34261" , "Q36526" , "Q39420" , "Q41970" , "Q41993" , "Q42234" , "Q46001" , "Q46639" , "Q46736" , "Q47068" , "Q48562" , "Q49583" , "Q49771" , "Q53139" , "Q58790" , "Q58880" , "Q59246" , "Q59704" , "Q59828" , "Q59831" , "Q60005" , "Q60013" , "Q72025" , "Q72189" , "Q72360" , "Q72373" , "Q72380" , "Q72536" , "Q72656" , "Q72704" , "Q76493" , "Q83339" , "Q83621" , "Q93910" , "Q95041" , "Q95449" , "Q98967" , "Q98995" , "Q100000" , "Q101825" , "Q102152" , "Q102307" , "Q102334" , "Q102346" , "Q102364" , "Q102435" , "Q102445" , "Q102521" , "Q102603" , "Q102659" , "Q102667" , "Q102682" , "Q102737" , "Q102746" , "Q102755" , "Q102762" , "Q103115" , "Q103176" , "Q103196" , "Q103212" , "Q103255" , "Q103273" , "Q103377" , "Q103390" , "Q103406" , "Q103427" , "Q103439" , "Q103466" , "Q103483" , "Q103493" , "Q103565" , "Q103604" , "Q103620" , "Q103652" , "Q103661" , "Q103676" , "Q103694" , "Q103703" , "Q103747" , "Q103789" , "Q103826" , "Q103850" , "Q103985" , "Q103993" , "Q104010" , "Q104030" , "Q104059" , "Q104111" , "Q104143" , "Q104201" , "Q104232" , "Q104262" , "Q104278" , "Q104299" , "Q104345" , "Q104354" , "Q104367" , "Q104374" , "Q104530" , "Q104538" , "Q104545" , "Q104557" , "Q104559" , "Q104560" , "Q104564" , "Q104569" , "Q104609" , "Q104646" , "Q104649" , "Q104654" , "Q104658" , "Q104660" , "Q104703" , "Q104707" , "Q104713" , "Q104717" , "Q104735" , "Q104764" , "Q104773" , "Q104801" , "Q104957" , "Q104984" , "Q104991" , "Q105002" , "Q105010" , "Q105023" , "Q105035" , "Q105056" , "Q105116" , "Q105133" , "Q105141" , "Q105150" , "Q105179" , "Q105208" , "Q105215" , "Q105223" , "Q105235" , "Q105243" , "Q105253" , "Q105264" , "Q105272" , "Q105284" , "Q105298" , "Q105306" , "Q105315" , "Q105323" , "Q105342" , "Q105360" , "Q105372" , "Q105392" , "Q105413" , "Q105425" , "Q105433" , "Q105444" , "Q105455" , "Q105465" , "Q105477" , "Q105503" , "Q105520" , "Q105538" , "Q105548" , "Q105554" , "Q109356" , "Q111048" , "Q120299" , "Q125172" , "Q126758" , "Q131329" , "Q131416" , "Q132572" , "Q132698" , "Q132714" , "Q132718" , "Q132724" , "Q132732" , "Q132739" , "Q132806" , "Q132829" , "Q132832" , "Q132846" , "Q132855" , "Q132931" , "Q132939" , "Q132947" , "Q132957" , "Q132960" , "Q132972" , "Q132974" , "Q132977" , "Q132981" , "Q133010" , "Q133026" , "Q133029" , "Q133033" , "Q133037" , "Q133045" , "Q133049" , "Q133052" , "Q133057" , "Q133061" , "Q133071" , "Q133075" , "Q133089" , "Q133093" , "Q133099" , "Q133102" , "Q133175" , "Q133291" , "Q133293" , "Q133299" , "Q133310" , "Q133416" , "Q133529" , "Q133816" , "Q133819" , "Q133825" , "Q133838" , "Q134163" , "Q134169" , "Q134181" , "Q134206" , "Q134296" , "Q134302" , "Q134306" , "Q134318" , "Q134366" , "Q134375" , "Q134396" , "Q134433" , "Q134446" , "Q134473" , "Q134483" , "Q134493" , "Q134506" , "Q134512" , "Q134519" , "Q134528" , "Q134531" , "Q134651" , "Q134656" , "Q134663" , "Q134667" , "Q134670" , "Q134679" , "Q134686" , "Q134693" , "Q134699" , "Q134707" , "Q134717" , "Q134732" , "Q134735" , "Q134752" , "Q134760" , "Q134770" , "Q134776" , "Q134786" , "Q134790" , "Q135161" , "Q135189" , "Q135213" , "Q135275" , "Q135285" , "Q135358" , "Q135370" , "Q135386" , "Q135394" , "Q135406" , "Q135410" , "Q135427" , "Q135446" , "Q135456" , "Q135466" , "Q135473" , "Q135482" , "Q135543" , "Q135549" , "Q135559" , "Q135572" , "Q135616" , "Q135650" , "Q135657" , "Q135665" , "Q135675" , "Q135686" , "Q135696" , "Q135754" , "Q135787" , "Q135809" , "Q135829" , "Q135869" , "Q135968" , "Q136223" , "Q136310" , "Q136340" , "Q136361" , "Q136383" , "Q136411" , "Q136435" , "Q136456" , "Q136471" , "Q136490" , "Q136528" , "Q136551" , "Q136576" , "Q136585" , "Q136629" , "Q136656" , "Q136669" , "Q136692" , "Q136715" , "Q136758" , "Q136792" , "Q136813" , "Q136834" , "Q136848" , "Q138474" , "Q139743" , "Q139794" , "Q139840" , "Q139867" , "Q140012" , "Q140087" , "Q140117" , "Q141260" , "Q141290" , "Q141342" , "Q141358" , "Q141373" , "Q141538" , "Q141578" , "Q141606" , "Q141666" , "Q141697" , "Q141814" , "Q142009" , "Q142996" , "Q143052" , "Q143079" , "Q143247" , "Q143274" , "Q143297" , "Q143334" , "Q143376" , "Q143481" , "Q143557" , "Q143614" , "Q143697" , "Q143722" , "Q143775" , "Q143813" , "Q143839" , "Q144017" , "Q144057" , "Q144097" , "Q144123" , "Q144170" , "Q144209" , "Q144213" , "Q144234" , "Q144264" , "Q144345" , "Q144844" , "Q144969" , "Q144973" , "Q145012" , "Q145073" , "Q145115" , "Q145187" , "Q145261" , "Q145406" , "Q145426" , "Q145457" , "Q145476" , "Q145507" , "Q145552" , "Q145567" , "Q145583" , "Q145621" , "Q145638" , "Q145669" , "Q145717" , "Q145735" , "Q145799" , "Q145810" , "Q145906" , "Q145993" , "Q146013" , "Q146043" , "Q146334" , "Q146372" , "Q146419" , "Q146435" , "Q146453" , "Q146468" , "Q147756" , "Q149108" , "Q149155" , "Q150346" , "Q152906" , "Q153380" , "Q153392" , "Q153412" , "Q153434" , "Q153453" , "Q153490" , "Q153549" , "Q153565" , "Q153609" , "Q153636" , "Q153655" , "Q153663" , "Q153676" , "Q153684" , "Q153698" , "Q153715" , "Q153734" , "Q153749" , "Q153787" , "Q154630" , "Q154648" , "Q154661" , "Q154669" , "Q154682" , "Q154704" , "Q154711" , "Q154725" , "Q154747" , "Q154785" , "Q154801" , "Q155095" , "Q155108" , "Q155122" , "Q155133" , "Q155148" , "Q155229" , "Q155276" , "Q155309" , "Q155331" , "Q155349" , "Q155365" , "Q155379" , "Q155405" , "Q155426" , "Q155437" , "Q155455" , "Q155470" , "Q155489" , "Q155515" , "Q155532" , "Q155541" , "Q155553" , "Q155560" , "Q155569" , "Q155597" , "Q155606" , "Q155615" , "Q155624" , "Q155632" , "Q155732" , "Q155745" , "Q155767" , "Q155774" , "Q155785" , "Q155797" , "Q155809" , "Q155818" , "Q155829" , "Q155836" , "Q155853" , "Q155893" , "Q155902" , "Q155912" , "Q155923" , "Q155936" , "Q155947" , "Q155955" , "Q155963" , "Q155968" , "Q155974" , "Q155990" , "Q156046" , "Q156056" , "Q156066" , "Q156209" , "Q156261" , "Q156284" , "Q156320" , "Q156337" , "Q156602" , "Q156614" , "Q156648" , "Q156658" , "Q156726" , "Q157065" , "Q157144" , "Q157395" , "Q157439" , "Q157447" , "Q157458" , "Q157469" , "Q157478" , "Q157482" , "Q157493" , "Q157510" , "Q157523" , "Q157566" , "Q157576" , "Q157590" , "Q157613" , "Q157622" , "Q157660" , "Q157666" , "Q157723" , "Q157757" , "Q157764" , "Q157771" , "Q157779" , "Q157790" , "Q157832" , "Q157841" , "Q157850" , "Q157930" , "Q157936" , "Q157938" , "Q157945" , "Q157955" , "Q157961" , "Q157990" , "Q157992" , "Q158005" , "Q158010" , "Q158101" , "Q158114" , "Q158336" , "Q158357" , "Q158393" , "Q158405" , "Q158411" , "Q158424" , "Q158437" , "Q158491" , "Q158604" , "Q158731" , "Q158751" , "Q158775" , "Q158788" , "Q158798" , "Q158816" , "Q158830" , "Q158848" , "Q158864" , "Q158872" , "Q158936" , "Q158990" , "Q159041" , "Q159071" , "Q159081" , "Q159097" , "Q159112" , "Q159124" , "Q159134" , "Q159139" , "Q159149" , "Q159217" , "Q159222" , "Q159230" , "Q159240" , "Q159261" , "Q159501" , "Q161970" , "Q161978" , "Q161987" , "Q162079" , "Q162640" , "Q162677" , "Q162698" , "Q162761" , "Q163643" , "Q163845" , "Q163864" , "Q163907" , "Q163935" , "Q163954" , "Q163986" , "Q164001" , "Q165682" , "Q165773" , "Q165790" , "Q165844" , "Q168088" , "Q168782" , "Q170513" , "Q170639" , "Q170660" , "Q170711" , "Q170725" , "Q170882" , "Q170961" , "Q170971" , "Q170981" , "Q172366" , "Q172448" , "Q172470" , "Q172484" , "Q172575" , "Q172601" , "Q172608" , "Q172616" , "Q172657" , "Q172671" , "Q172685" , "Q173008" , "Q173015" , "Q173026" , "Q173047" , "Q173064" , "Q173858" , "Q173883" , "Q173903" , "Q173925" , "Q173943" , "Q174124" , "Q174138" , "Q174155" , "Q174185" , "Q175124" , "Q175141" , "Q175161" , "Q175209" , "Q175258" , "Q175353" , "Q175360" , "Q175371" , "Q175380" , "Q175393" , "Q175407" , "Q175433" , "Q175452" , "Q175470" , "Q175480" , "Q175505" , "Q175517" , "Q175524" , "Q175533" , "Q175541" , "Q175552" , "Q175576" , "Q175601" , "Q175727" , "Q175742" , "Q175795" , "Q176217" , "Q176264" , "Q176325" , "Q176337" , "Q176348" , "Q176364" , "Q176395" , "Q176592" , "Q176636" , "Q176738" , "Q176753" , "Q176761" , "Q176773" , "Q177723" , "Q177737" , "Q177770" , "Q177782" , "Q177805" , "Q177829" , "Q177839" , "Q177867" , "Q177908" , "Q177920" , "Q178090" , "Q178105" , "Q178132" , "Q178152" , "Q178175" , "Q178188" , "Q178238" , "Q178322" , "Q178857" , "Q178870" , "Q179361" , "Q179372" , "Q179387" , "Q179407" , "Q179439" , "Q179454" , "Q179464" , "Q179476" , "Q179486" , "Q179495" , "Q179525" , "Q180082" , "Q180758" , "Q181376" , "Q181531" , "Q181548" , "Q181550" , "Q182871" , "Q182906" , "Q182918" , "Q182935" , "Q183002" , "Q183093" , "Q183106" , "Q183145" , "Q183162" , "Q183183" , "Q183193" , "Q183208" , "Q183223" , "Q184095" , "Q184147" , "Q184185" , "Q184193" , "Q184200" , "Q184220" , "Q184225" , "Q184242" , "Q184258" , "Q184322" , "Q184346" , "Q184361" , "Q184391" , "Q184537" , "Q184562" , "Q184617" , "Q186495" , "Q187032" , "Q189295" , "Q190499" , "Q191465" , "Q193269" , "Q193277" , "Q193288" , "Q193293" , "Q193318" , "Q193328" , "Q193333" , "Q193342" , "Q193363" , "Q193371" , "Q193380" , "Q193388" , "Q193396" , "Q193403" , "Q193413" , "Q193419" , "Q193425" , "Q193443" , "Q193455" , "Q193473" , "Q193505" , "Q193522" , "Q193557" , "Q193569" , "Q193575" , "Q193580" , "Q193586" , "Q193595" , "Q193604" , "Q193631" , "Q193636" , "Q193641" , "Q193652" , "Q193662" , "Q193722" , "Q193898" , "Q193906" , "Q193909" , "Q193917" , "Q193922" , "Q193930" , "Q193936" , "Q193941" , "Q193965" , "Q194001" , "Q194020" , "Q194030" , "Q194048" , "Q194067" , "Q194438" , "Q194623" , "Q194648" , "Q194670" , "Q194693" , "Q194708" , "Q195662" , "Q195683" , "Q196357" , "Q196358" , "Q196359" , "Q196369" , "Q196373" , "Q196374" , "Q196377" , "Q196378" , "Q196380" , "Q196384" , "Q196386" , "Q196387" , "Q196388" , "Q196390" , "Q196392" , "Q196394" , "Q196397" , "Q196399" , "Q196400" , "Q196402" , "Q196415" , "Q196435" , "Q196439" , "Q196443" , "Q196446" , "Q196458" , "Q196464" , "Q196466" , "Q196469" , "Q196476" , "Q196479" , "Q196481" , "Q196483" , "Q196486" , "Q196489" , "Q196497" , "Q196498" , "Q196501" , "Q196507" , "Q196514" , "Q196516" , "Q196520" , "Q196522" , "Q196525" , "Q196526" , "Q196528" , "Q196531" , "Q196533" , "Q196537" , "Q196592" , "Q196594" , "Q196599" , "Q196603" , "Q196607" , "Q196611" , "Q196616" , "Q196622" , "Q196629" , "Q196637" , "Q196643" , "Q196645" , "Q196649" , "Q196651" , "Q196654" , "Q196658" , "Q196660" , "Q196666" , "Q196669" , "Q196675" , "Q196678" , "Q196686" , "Q196694" , "Q196700" , "Q196702" , "Q196705" , "Q196709" , "Q196710" , "Q196711" , "Q196724" , "Q196729" , "Q196732" , "Q196747" , "Q196757" , "Q196778" , "Q196786" , "Q196792" , "Q196798" , "Q196803" , "Q196815" , "Q196827" , "Q196833" , "Q196835" , "Q196839" , "Q196845" , "Q196904" , "Q196907" , "Q196922" , "Q196925" , "Q196934" , "Q196938" , "Q196946" , "Q196953" , "Q196964" , "Q196975" , "Q197006" , "Q197018" , "Q197345" , "Q197351" , "Q197356" , "Q197382" , "Q197383" , "Q197385" , "Q197386" , "Q197393" , "Q197410" , "Q197473" , "Q197560" , "Q197573" , "Q197582" , "Q197595" , "Q197609" , "Q197620" , "Q197625" , "Q197637" , "Q197643" , "Q197654" , "Q197677" , "Q197691" , "Q197860" , "Q197890" , "Q197902" , "Q197934" , "Q197942" , "Q197954" , "Q198033" , "Q198047" , "Q198087" , "Q198102" , "Q198125" , "Q198135" , "Q198140" , "Q198143" , "Q198145" , "Q198152" , "Q198155" , "Q198163" , "Q198173" , "Q198182" , "Q198190" , "Q198206" , "Q198210" , "Q198299" , "Q198306" , "Q198311" , "Q198332" , "Q198349" , "Q198358" , "Q198364" , "Q198369" , "Q198400" , "Q198412" , "Q198419" , "Q198427" , "Q198748" , "Q198753" , "Q198776" , "Q198802" , "Q198816" , "Q198820" , "Q198824" , "Q198826" , "Q198834" , "Q198842" , "Q198852" , "Q198859" , "Q198973" , "Q198977" , "Q198990" , "Q199004" , "Q199016" , "Q199022" , "Q211600" , "Q259612" , "Q261976" , "Q271922" , "Q303374" , "Q304827" , "Q321197" , "Q336426" , "Q336475" , "Q345331" , "Q346006" , "Q367214" , "Q372110" , "Q387561" , "Q388224" , "Q391545" , "Q403100" , "Q431317" , "Q448047" , "Q476688" , "Q477142" , "Q477170" , "Q490643" , "Q511216" , "Q544109" , "Q571136" , "Q576937" , "Q579984" , "Q583161" , "Q584670" , "Q584694" , "Q614855" , "Q615274" , "Q633664" , "Q643376" , "Q644131" , "Q651409" , "Q658218" , "Q658562" , "Q661718" , "Q670842" , "Q684630" , "Q686680" , "Q688716" , "Q714643" , "Q715716" , "Q720652" , "Q744259" , "Q744598" , "Q745005" , "Q752183" , "Q760230" , "Q770624" , "Q771826" , "Q772805" , "Q792509" , "Q810884" , "Q832340" , "Q834989" , "Q846082" , "Q856306" , "Q856318" , "Q856332" , "Q856450" , "Q859785" , "Q863330" , "Q879935" , "Q888404" , "Q913768" , "Q919617" , "Q922060" , "Q924849" , "Q926336" , "Q930847" , "Q932398" , "Q966804" , "Q974987" , "Q979248" , "Q987991" , "Q991072" , "Q995031" , "Q995055" , "Q995091" , "Q997469" , "Q1001225" , "Q1001297" , "Q1001326" , "Q1004332" , "Q1006545" , "Q1011263" , "Q1011275" , "Q1013189" , "Q1013389" , "Q1017748" , "Q1018025" , "Q1020063" , "Q1026867" , "Q1028198" , "Q1252490" , "Q1273297" , "Q1274263" , "Q1419953" , "Q1544334" , "Q1551883" , "Q1649631" , "Q1678433" , "Q1794350" , "Q1895761" , "Q2029443" , "Q2089397" , "Q2096486" , "Q2292617" , "Q2347869" , "Q2360570" , "Q2374447" , "Q2384255" , "Q2397804" , "Q2477836" , "Q2499450" , "Q2590658" , "Q2631684" , "Q2651369" , "Q2651377" , "Q2693647" , "Q2750772" , "Q2866322" , "Q2902079" , "Q3056770" , "Q3105416" , "Q3192084" , "Q3196325" , "Q3310766" , "Q3423988" , "Q3530435" , "Q4164256" , "Q4201239" , "Q4244555" , "Q4247318" , "Q4249235" , "Q4323399" , "Q4412457" , "Q5103812" , "Q5423099" , "Q6021507" , "Q6127774" , "Q6315043" , "Q6734014" , "Q7382031" , "Q10781358" , "Q12179390" , "Q12188038" , "Q13166707" , "Q16401330" , "Q19543792" , "Q20391665" , "Q21764905" , "Q25425552" , "Q25594361" , "Q30622998" , "Q55658728" , "Q55813637" , "Q60792293" , "Q71274278" , "Q82001853" , "Q97254616" , "Q108405443" , "Q108750051" , "Q113656987" , "Q122971324" , "Q123160054" , "Q123361744" ]
-
-for i in tqdm(items):
-    tqdm.write(f"Generating {i}...")
-    text_representation = wikidata_item_to_text(i)
-    with open(f"{text_representations_dir}/{i}.txt", "w") as file:
+def write_text_representation(item_id, prefetch=True):
+    tqdm.write(f"Generating {item_id}...")
+    text_representation = wikidata_item_to_text(item_id, prefetch)
+    with open(f"{text_representations_dir}/{item_id}.txt", "w") as file:
         file.write(text_representation)
+    return item_id
+
+
+def init_render_worker(output_dir, item_store_path, label_store_path, rps):
+    """
+    Configure a rendering process like its parent. Each process opens its own
+    connections to the item and label stores on first use.
+    """
+    global text_representations_dir, item_store_file_path, label_store_file_path
+    global wikidata_client
+    text_representations_dir = output_dir
+    item_store_file_path = item_store_path
+    label_store_file_path = label_store_path
+    wikidata_client = WikidataClient(rps=rps)
+
+
+def render_pool(workers):
+    """
+    Create a process pool for rendering, or return None to render in this
+    process if workers is 1. Processes are spawned rather than forked, so no
+    SQLite connection is shared with the parent.
+    """
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        return None
+    # Labels are prefetched before rendering, so the processes rarely need to
+    # make requests. If they do, they share the rate limit.
+    rps = wikidata_client.rate_limiter.rate
+    return ProcessPoolExecutor(
+        workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_render_worker,
+        initargs=(
+            text_representations_dir,
+            item_store_file_path,
+            label_store_file_path,
+            rps / workers if rps else rps,
+        ),
+    )
+
+
+def generate_text_representations(
+    items, fetch_workers=8, render_workers=None, batch_size=500
+):
+    """
+    Generate the text representations of items. Items are processed in
+    batches: first the uncached items of a batch are fetched, then the labels
+    all items of the batch need are fetched together, both in a pool of
+    fetch_workers threads. Decoding the cached items, to collect their label
+    IDs and to render them, runs in a pool of render_workers processes, by
+    default one per core. Each item is written to its own file, so the output
+    does not depend on the order in which the workers finish.
+
+    Args:
+        items (list): The IDs of the Wikidata items.
+        fetch_workers (int): The number of concurrent requests.
+        render_workers (int): The number of rendering processes.
+        batch_size (int): The number of items per batch.
+
+    Returns:
+        list: The IDs of the generated items, in the order of items.
+    """
+    os.makedirs(text_representations_dir, exist_ok=True)
+    # Load the caches before any worker thread needs them
+    get_label_cache()
+    item_cache = get_item_cache()
+    generated = []
+    renderer = render_pool(render_workers)
+    # The labels are prefetched for the whole batch, not again per item.
+    render = functools.partial(write_text_representation, prefetch=False)
+    try:
+        with ThreadPoolExecutor(fetch_workers) as fetcher, tqdm(
+            total=len(items)
+        ) as progress:
+            for start in range(0, len(items), batch_size):
+                batch = items[start : start + batch_size]
+                missing = [item_id for item_id in batch if item_id not in item_cache]
+                list(fetcher.map(fetch_item, missing))
+                if renderer is None:
+                    label_ids = map(item_label_ids, batch)
+                else:
+                    label_ids = renderer.map(item_label_ids, batch, chunksize=16)
+                prefetch_labels(set().union(*label_ids), fetcher)
+                if renderer is None:
+                    rendered = map(render, batch)
+                else:
+                    rendered = renderer.map(render, batch, chunksize=16)
+                for item_id in rendered:
+                    generated.append(item_id)
+                    progress.update()
+    finally:
+        if renderer is not None:
+            renderer.shutdown()
+    return generated
+
+
+def read_items(item_files):
+    """
+    Read the IDs of Wikidata items from CSV files with an "item" column of
+    entity URLs or IDs, such as the query results in snippets/. Entities
+    other than items, e.g. lexeme senses, are skipped, and so are duplicates.
+
+    Args:
+        item_files (list): The paths of the CSV files.
+
+    Returns:
+        list: The item IDs, in the order of their first occurrence.
+    """
+    items = {}
+    for item_file in item_files:
+        with open(item_file, "r", newline="") as file:
+            for row in csv.DictReader(file):
+                item_id = row["item"].rsplit("/", 1)[-1]
+                if re.fullmatch(r"Q\d+", item_id):
+                    items[item_id] = True
+    return list(items)
+
+
+def main(argv=None):
+    global text_representations_dir, wikidata_client
+
+    parser = argparse.ArgumentParser(
+        description="Generate text representations of Wikidata items."
+    )
+    parser.add_argument(
+        "item_files",
+        nargs="*",
+        default=sorted(glob.glob("snippets/*.csv")),
+        help="CSV files with an item column (default: snippets/*.csv)",
+    )
+    parser.add_argument("--output-dir", default=text_representations_dir)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="rendering processes (default: one per core)",
+    )
+    parser.add_argument("--fetch-workers", type=int, default=8)
+    parser.add_argument(
+        "--rps", type=float, default=10, help="requests per second to Wikidata"
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    text_representations_dir = args.output_dir
+    wikidata_client = WikidataClient(rps=args.rps)
+
+    items = read_items(args.item_files)
+    print(f"Generating text representations of {len(items)} items...")
+    generate_text_representations(
+        items,
+        fetch_workers=args.fetch_workers,
+        render_workers=args.workers,
+        batch_size=args.batch_size,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import threading
+import time
+
+from retrying_client import RetryingClient
+
+USER_AGENT = "askwikidata (https://github.com/rti/askwikidata)"
+
+
+class RateLimiter:
+    """
+    A token bucket shared by all threads. On average at most rate calls to
+    acquire return per second, with bursts of up to burst calls.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            # Take the token now, possibly going into debt, and wait outside
+            # the lock until the debt is paid off.
+            self.tokens -= 1
+            wait = -self.tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+class WikidataClient(RetryingClient):
+    """
+    A client for the Wikidata APIs that is safe to share between threads.
+    Requests, including retries, are limited to rps per second in total.
+    """
+
+    user_agent = USER_AGENT
+
+    def __init__(
+        self,
+        rps=10,
+        connect_timeout=5,
+        read_timeout=60,
+        max_retries=5,
+        backoff=1.0,
+        max_backoff=60.0,
+        pool_size=16,
+    ):
+        super().__init__(
+            connect_timeout, read_timeout, max_retries, backoff, max_backoff, pool_size
+        )
+        self.rate_limiter = RateLimiter(rps)
+
+    def before_attempt(self):
+        self.rate_limiter.acquire()
+
+    def get(self, url):
+        return self.request("GET", url).json()